@@ -0,0 +1,50 @@
+import random
+from typing import Dict, List
+
+SENTENCES = [
+    "My mobile phone was stolen from my bag while I was travelling in the bus near the market.",
+    "Two men on a bike snatched my gold chain and ran away towards the highway.",
+    "The chor took my gadi from outside the house at night and the CCTV shows his face.",
+    "My neighbour hit me with a stick and I was hurt badly on my arm and head.",
+    "He attacked my brother in the street and threatened to kill him if he went to the police.",
+    "My husband beaten me again yesterday and the violence has been going on for months.",
+    "A man keeps following me to work and sends threat messages to my phone every night.",
+    "My colleague bully me at the office and tries to intimidate me in front of everyone.",
+    "Someone is stalking my sister on social media and posting fake photos of her.",
+    "A caller said he was from the bank and took paise from my account using a fake link.",
+    "The shopkeeper cheat us with forged bills and refused to return the money we paid.",
+    "I was duped by an online seller who took advance payment and never delivered the items.",
+    "My email account was hack and the person sent scam messages to all my contacts.",
+    "There was a phishing message with a fake website and my password was used for online fraud.",
+    "Unknown people broke into our house while we were away and took cash and jewellery.",
+    "The accused demanded a bribe to return my documents and said he would harm my family.",
+    "pls help, ur officer did not write my complaint and the guy is still roaming free.",
+    "The robber had a knife and he took the stuff from my shop before the police came."
+]
+
+SIZES = {
+    "sentence": 0,
+    "1kb": 1024,
+    "10kb": 10 * 1024,
+    "50kb": 50 * 1024
+}
+
+def complaint_text(size: int, seed: int = 0) -> str:
+    generator = random.Random(seed)
+    if size <= 0:
+        return generator.choice(SENTENCES)
+
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        sentence = generator.choice(SENTENCES)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    text = " ".join(parts)
+    return text[:text.rfind(" ", 0, size) if len(text) > size else size].rstrip()
+
+def sized_texts(sizes: Dict[str, int] = SIZES, seed: int = 0) -> Dict[str, str]:
+    return {name: complaint_text(size, seed) for name, size in sizes.items()}
+
+def distinct_texts(count: int, size: int = 0, seed: int = 0) -> List[str]:
+    return [f"{complaint_text(size, seed + index)} Reference {index}." for index in range(count)]
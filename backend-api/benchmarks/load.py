@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.corpus import SIZES, distinct_texts
+from benchmarks.micro import COMPLAINANT_INFO
+from benchmarks.results import DEFAULT_THRESHOLD, finish, print_table, summarize
+
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]]]
+
+ENDPOINTS: Dict[str, Callable[[List[str], int], RequestSpec]] = {
+    "POST /normalize": lambda texts, i: ("POST", "/normalize", {"text": texts[i]}),
+    "POST /classify": lambda texts, i: ("POST", "/classify", {"text": texts[i]}),
+    "POST /severity": lambda texts, i: ("POST", "/severity", {"text": texts[i], "category": "theft"}),
+    "POST /explain": lambda texts, i: ("POST", "/explain", {
+        "original_text": texts[i],
+        "classification": {"category": "theft", "confidence": 0.8}
+    }),
+    "POST /legal-mapping": lambda texts, i: ("POST", "/legal-mapping", {"text": texts[i], "category": "Theft"}),
+    "POST /generate-fir": lambda texts, i: ("POST", "/generate-fir", {
+        "complaint_text": texts[i],
+        "category": "Theft",
+        "severity_score": 6,
+        "severity_level": "Medium",
+        "ipc_sections": ["378", "379"],
+        "complainant_info": COMPLAINANT_INFO
+    }),
+    "POST /predict-timeline": lambda texts, i: ("POST", "/predict-timeline", {"category": "Theft", "severity_score": 6}),
+    "POST /assess-corruption-risk": lambda texts, i: (
+        "POST", "/assess-corruption-risk", {"category": "Theft", "severity_score": 6}
+    ),
+    "POST /analyze-complete": lambda texts, i: ("POST", "/analyze-complete", {"text": texts[i]}),
+    "POST /analyze-batch": lambda texts, i: ("POST", "/analyze-batch", {
+        "complaints": [{"text": texts[(i + offset) % len(texts)]} for offset in range(8)]
+    }),
+    "GET /legal-search": lambda texts, i: ("GET", "/legal-search?q=theft+property&page_size=10", None)
+}
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 120.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        response = await client.get("/ready")
+        if response.status_code == 200:
+            return
+        if "Startup error" in response.text or time.monotonic() > deadline:
+            raise RuntimeError(f"App did not become ready: {response.text}")
+        await asyncio.sleep(0.1)
+
+async def load_endpoint(client: httpx.AsyncClient, build: Callable[[List[str], int], RequestSpec],
+                        texts: List[str], requests: int, concurrency: int, warmup: int) -> Dict[str, Any]:
+    for index in range(warmup):
+        method, path, payload = build(texts, index % len(texts))
+        await client.request(method, path, json=payload)
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    counter = itertools.count()
+
+    async def worker():
+        clock = time.perf_counter
+        while True:
+            index = next(counter)
+            if index >= requests:
+                return
+            method, path, payload = build(texts, index % len(texts))
+            started = clock()
+            response = await client.request(method, path, json=payload)
+            latencies.append(clock() - started)
+            statuses[response.status_code] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    errors = sum(count for status, count in statuses.items() if status >= 400)
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "requests_per_sec": round(len(latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        **summarize(latencies, 1e3, "ms")
+    }
+
+async def run(endpoints: Optional[List[str]] = None, requests: int = 200, concurrency: int = 8,
+              warmup: int = 10, distinct: int = 32, size: str = "sentence",
+              progress=sys.stderr) -> Dict[str, Dict[str, Any]]:
+    from main import app
+
+    texts = distinct_texts(distinct, SIZES[size])
+    results = {}
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            await wait_until_ready(client)
+            for name in endpoints or ENDPOINTS:
+                results[name] = await load_endpoint(client, ENDPOINTS[name], texts, requests, concurrency, warmup)
+                print(f"{name}: {results[name]['requests_per_sec']} req/s", file=progress, flush=True)
+    finally:
+        await app.router.shutdown()
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the API in-process and report latency percentiles")
+    parser.add_argument("--endpoint", action="append", choices=list(ENDPOINTS),
+                        help="Endpoint to load, repeatable (default: all)")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per endpoint")
+    parser.add_argument("--distinct", type=int, default=32, help="Distinct complaint texts to cycle through")
+    parser.add_argument("--size", choices=list(SIZES), default="sentence", help="Complaint text size")
+    parser.add_argument("--output", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", help="Baseline JSON to compare against; exits 2 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative change counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(
+        args.endpoint, args.requests, args.concurrency, args.warmup, args.distinct, args.size
+    ))
+    print_table(results, ["requests_per_sec", "p50_ms", "p95_ms", "p99_ms", "error_rate"])
+    settings = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "distinct": args.distinct,
+        "size": args.size
+    }
+    return finish("load", results, settings, args.output, args.compare, args.threshold)
+
+if __name__ == "__main__":
+    sys.exit(main())
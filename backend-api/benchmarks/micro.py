@@ -0,0 +1,109 @@
+import argparse
+import gc
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.corpus import SIZES, sized_texts
+from benchmarks.results import DEFAULT_THRESHOLD, finish, print_table, summarize
+
+COMPLAINANT_INFO = {
+    "name": "Benchmark Complainant",
+    "address": "12 Market Road, Pune",
+    "phone": "9800000000",
+    "email": "complainant@example.com"
+}
+
+def build_targets() -> Dict[str, Callable[[str], Any]]:
+    from models.dialect_normalizer import DialectNormalizer
+    from models.eccm_model import ECCMModel
+    from utils.document_generator import DocumentGenerator
+    from utils.lss_calculator import LSSCalculator
+    from utils.preprocessing import TextPreprocessor
+
+    normalizer = DialectNormalizer()
+    eccm_model = ECCMModel()
+    lss_calculator = LSSCalculator()
+    preprocessor = TextPreprocessor()
+    doc_generator = DocumentGenerator()
+
+    return {
+        "DialectNormalizer.normalize": lambda text: normalizer.normalize(text, "auto"),
+        "ECCMModel.predict": lambda text: eccm_model.predict(text),
+        "ECCMModel.explain_prediction": lambda text: eccm_model.explain_prediction(text, "theft"),
+        "LSSCalculator.calculate_score": lambda text: lss_calculator.calculate_score(text, "theft"),
+        "TextPreprocessor.preprocess": lambda text: preprocessor.preprocess(text),
+        "DocumentGenerator.generate_fir_draft": lambda text: doc_generator.generate_fir_draft(
+            text, "Theft", 6, "Medium", ["378", "379"], COMPLAINANT_INFO
+        )
+    }
+
+def measure(func: Callable[[str], Any], text: str, min_time: float, min_iterations: int,
+            max_iterations: int, warmup: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        func(text)
+    gc.collect()
+
+    samples: List[float] = []
+    clock = time.perf_counter
+    started = clock()
+    while len(samples) < max_iterations:
+        call_started = clock()
+        func(text)
+        samples.append(clock() - call_started)
+        if len(samples) >= min_iterations and clock() - started >= min_time:
+            break
+    elapsed = clock() - started
+
+    return {
+        "bytes": len(text.encode("utf-8")),
+        "iterations": len(samples),
+        "ops_per_sec": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        **summarize(samples, 1e6, "us")
+    }
+
+def run(targets: Optional[List[str]] = None, sizes: Optional[List[str]] = None, min_time: float = 0.5,
+        min_iterations: int = 5, max_iterations: int = 100000, warmup: int = 3,
+        progress=sys.stderr) -> Dict[str, Dict[str, Any]]:
+    available = build_targets()
+    texts = sized_texts({name: SIZES[name] for name in sizes or SIZES})
+
+    results = {}
+    for target in targets or available:
+        for size_name, text in texts.items():
+            name = f"{target}[{size_name}]"
+            results[name] = measure(available[target], text, min_time, min_iterations, max_iterations, warmup)
+            print(f"{name}: {results[name]['ops_per_sec']} ops/s", file=progress, flush=True)
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmark the analysis stages across text sizes")
+    parser.add_argument("--target", action="append", help="Stage to benchmark, repeatable (default: all)")
+    parser.add_argument("--size", action="append", choices=list(SIZES), help="Text size, repeatable (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds to sample each case")
+    parser.add_argument("--min-iterations", type=int, default=5)
+    parser.add_argument("--max-iterations", type=int, default=100000)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", help="Baseline JSON to compare against; exits 2 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative change counted as a regression")
+    parser.add_argument("--list", action="store_true", help="List the available targets")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for target in build_targets():
+            print(target)
+        return 0
+
+    unknown = set(args.target or []) - set(build_targets())
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    results = run(args.target, args.size, args.min_time, args.min_iterations, args.max_iterations, args.warmup)
+    print_table(results, ["bytes", "ops_per_sec", "mean_us", "p50_us", "p95_us", "p99_us"])
+    settings = {"min_time": args.min_time, "min_iterations": args.min_iterations, "warmup": args.warmup}
+    return finish("micro", results, settings, args.output, args.compare, args.threshold)
+
+if __name__ == "__main__":
+    sys.exit(main())
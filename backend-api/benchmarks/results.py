@@ -0,0 +1,145 @@
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+DEFAULT_THRESHOLD = 0.10
+
+HIGHER_IS_BETTER = {"ops_per_sec", "requests_per_sec"}
+LOWER_IS_BETTER = {"p50_us", "p50_ms", "p95_ms", "p99_ms", "error_rate"}
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, math.ceil(fraction * len(sorted_samples)) - 1)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
+
+def summarize(samples: List[float], scale: float, unit: str) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        f"mean_{unit}": round(sum(ordered) / len(ordered) * scale, 3) if ordered else 0.0,
+        f"p50_{unit}": round(percentile(ordered, 0.50) * scale, 3),
+        f"p95_{unit}": round(percentile(ordered, 0.95) * scale, 3),
+        f"p99_{unit}": round(percentile(ordered, 0.99) * scale, 3)
+    }
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+def report(kind: str, results: Dict[str, Dict[str, Any]], settings: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "kind": kind,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "settings": settings,
+        "results": results
+    }
+
+def save_report(path: str, data: Dict[str, Any]):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".baseline-", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(temp_path, path)
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Any]:
+    if baseline.get("kind") != current.get("kind"):
+        raise ValueError(f"Cannot compare a '{current.get('kind')}' run against a '{baseline.get('kind')}' baseline")
+
+    rows = []
+    for name, metrics in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            rows.append({"name": name, "metric": None, "status": "new"})
+            continue
+        for metric, value in metrics.items():
+            if metric not in HIGHER_IS_BETTER and metric not in LOWER_IS_BETTER:
+                continue
+            before = reference.get(metric)
+            if before is None:
+                continue
+            if before == 0:
+                change = 0.0 if value == 0 else math.inf
+            else:
+                change = (value - before) / before
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            status = "regressed" if change > threshold else "improved" if change < -threshold else "ok"
+            rows.append({
+                "name": name,
+                "metric": metric,
+                "baseline": before,
+                "current": value,
+                "change": round(change, 4) if math.isfinite(change) else None,
+                "status": status
+            })
+
+    missing = sorted(set(baseline["results"]) - set(current["results"]))
+    return {
+        "threshold": threshold,
+        "environment_changed": baseline.get("environment") != current.get("environment"),
+        "regressions": [row for row in rows if row["status"] == "regressed"],
+        "improvements": [row for row in rows if row["status"] == "improved"],
+        "missing": missing,
+        "rows": rows
+    }
+
+def print_comparison(comparison: Dict[str, Any], out=sys.stdout):
+    if comparison["environment_changed"]:
+        print("warning: baseline was recorded on a different environment", file=out)
+    for row in comparison["rows"]:
+        if row["status"] == "new":
+            print(f"  new        {row['name']}", file=out)
+            continue
+        if row["status"] == "ok":
+            continue
+        change = "n/a" if row["change"] is None else f"{abs(row['change']) * 100:.1f}%"
+        direction = "worse" if row["status"] == "regressed" else "better"
+        print(
+            f"  {row['status']:<10} {row['name']} {row['metric']}: "
+            f"{row['baseline']} -> {row['current']} ({change} {direction})",
+            file=out
+        )
+    if comparison["missing"]:
+        print(f"{len(comparison['missing'])} baseline case(s) were not run", file=out)
+    print(
+        f"{len(comparison['regressions'])} regression(s), {len(comparison['improvements'])} improvement(s) "
+        f"at a {comparison['threshold'] * 100:.0f}% threshold",
+        file=out
+    )
+
+def print_table(results: Dict[str, Dict[str, Any]], columns: List[str], out=sys.stdout):
+    width = max([len(name) for name in results] + [4])
+    print(f"{'name':<{width}}  " + "  ".join(f"{column:>14}" for column in columns), file=out)
+    for name, metrics in results.items():
+        print(f"{name:<{width}}  " + "  ".join(f"{metrics.get(column, ''):>14}" for column in columns), file=out)
+
+def finish(kind: str, results: Dict[str, Dict[str, Any]], settings: Dict[str, Any],
+           output: Optional[str], baseline: Optional[str], threshold: float) -> int:
+    current = report(kind, results, settings)
+    if output:
+        save_report(output, current)
+        print(f"saved {kind} results to {output}", file=sys.stderr)
+    if not baseline:
+        return 0
+
+    comparison = compare(load_report(baseline), current, threshold)
+    print_comparison(comparison)
+    return 2 if comparison["regressions"] else 0
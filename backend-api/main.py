@@ -1,17 +1,23 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+import asyncio
 import json
+import os
+import time
 
-from models.eccm_model import ECCMModel
-from models.dialect_normalizer import DialectNormalizer
-from models.timeline_predictor import TimelinePredictor
-from models.corruption_detector import CorruptionDetector
-from utils.lss_calculator import LSSCalculator
-from utils.ipc_mapper import IPCMapper
-from utils.document_generator import DocumentGenerator
-from utils.preprocessing import TextPreprocessor
+from utils.analysis_pipeline import build_components, ANALYSIS_OUTPUTS, PIPELINE_COMPONENTS
+from utils.stage_executor import StageExecutor, ExecutorSaturated, StageTimeout, ComponentVersionMismatch
+from utils.fast_json import FastJSONEncoder, dumps
+from utils.metrics import MetricsMiddleware, MetricsRegistry
+from utils.history_store import HistoryError
+from utils.legal_search import MAX_QUERY_LENGTH, LegalSearchError
+from utils.rule_store import RulesError, RulesVersionMiddleware
+from utils.single_flight import SingleFlight, SingleFlightOverflow
+
+STARTED_AT = time.perf_counter()
 
 app = FastAPI(title="EquiCourt API", version="1.0.0")
 
@@ -21,25 +27,234 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Rules-Version"],
+)
+
+COMPONENT_SETTINGS = {
+    "cache_url": os.environ.get("EQUICOURT_CACHE_URL", "memory://"),
+    "cache_max_entries": int(os.environ.get("EQUICOURT_CACHE_MAX_ENTRIES", "4096")),
+    "cache_ttl_seconds": float(os.environ.get("EQUICOURT_CACHE_TTL_SECONDS", "600")),
+    "eccm_model_path": os.environ.get("EQUICOURT_ECCM_MODEL_PATH") or None,
+    "eccm_max_batch_size": int(os.environ.get("EQUICOURT_ECCM_MAX_BATCH_SIZE", "16")),
+    "eccm_max_wait_ms": float(os.environ.get("EQUICOURT_ECCM_MAX_WAIT_MS", "5")),
+    "eccm_max_queue_size": int(os.environ.get("EQUICOURT_ECCM_MAX_QUEUE_SIZE", "256")),
+    "eccm_timeout_seconds": float(os.environ.get("EQUICOURT_ECCM_TIMEOUT_SECONDS", "2")),
+    "legal_index_path": os.environ.get("EQUICOURT_LEGAL_INDEX_PATH") or None,
+    "rules_path": os.environ.get("EQUICOURT_RULES_PATH") or None,
+    "rules_watch_interval": float(os.environ.get("EQUICOURT_RULES_WATCH_SECONDS", "2")),
+    "history_path": os.environ.get("EQUICOURT_HISTORY_PATH") or None,
+    "history_max_queue_size": int(os.environ.get("EQUICOURT_HISTORY_MAX_QUEUE_SIZE", "10000"))
+}
+HISTORY_ENABLED = os.environ.get("EQUICOURT_HISTORY", "1").lower() in ("1", "true", "yes")
+PRELOAD = os.environ.get(
+    "EQUICOURT_PRELOAD", "1" if COMPONENT_SETTINGS["eccm_model_path"] else "0"
+).lower() in ("1", "true", "yes")
+
+components = build_components(**COMPONENT_SETTINGS)
+rules = components.proxy("rules")
+artifacts = components.proxy("artifacts")
+normalizer = components.proxy("normalizer")
+eccm_model = components.proxy("eccm_model")
+lss_calculator = components.proxy("lss_calculator")
+ipc_mapper = components.proxy("ipc_mapper")
+doc_generator = components.proxy("doc_generator")
+timeline_predictor = components.proxy("timeline_predictor")
+corruption_detector = components.proxy("corruption_detector")
+preprocessor = components.proxy("preprocessor")
+legal_corpus = components.proxy("legal_corpus")
+legal_search = components.proxy("legal_search")
+result_cache = components.proxy("result_cache")
+pipeline = components.proxy("pipeline")
+history_store = components.proxy("history_store")
+
+executor = StageExecutor(
+    components,
+    mode=os.environ.get("EQUICOURT_EXECUTOR_MODE", "thread"),
+    max_workers=int(os.environ.get("EQUICOURT_EXECUTOR_WORKERS", "0")) or None,
+    max_pending=int(os.environ.get("EQUICOURT_EXECUTOR_MAX_PENDING", "64")),
+    timeout_seconds=float(os.environ.get("EQUICOURT_STAGE_TIMEOUT_SECONDS", "10")),
+    retry_after_seconds=int(os.environ.get("EQUICOURT_RETRY_AFTER_SECONDS", "1")),
+    factory=build_components,
+    factory_kwargs=COMPONENT_SETTINGS
+)
+single_flight = SingleFlight(
+    max_waiters=int(os.environ.get("EQUICOURT_SINGLE_FLIGHT_MAX_WAITERS", "64")),
+    retry_after_seconds=int(os.environ.get("EQUICOURT_RETRY_AFTER_SECONDS", "1"))
+)
+encoder = FastJSONEncoder(fragment_for=lambda value: artifacts.fragment_for(value))
+BATCH_TIMEOUT_SECONDS = float(os.environ.get("EQUICOURT_BATCH_TIMEOUT_SECONDS", "60"))
+
+def executor_tasks():
+    stats = executor.stats()
+    return [
+        (("in_flight",), stats["in_flight"]),
+        (("queued",), max(0, stats["in_flight"] - stats["max_workers"])),
+        (("capacity",), stats["max_pending"])
+    ]
+
+def executor_events():
+    stats = executor.stats()
+    return [(("completed",), stats["completed"]), (("rejected",), stats["rejected"]),
+            (("timeout",), stats["timeouts"])]
+
+def cache_lookups():
+    lookups = []
+    if components.is_loaded("result_cache"):
+        lookups += [(("result", "hit"), result_cache.hits), (("result", "miss"), result_cache.misses)]
+    if components.is_loaded("pipeline"):
+        scan = pipeline.scan.cache_info()
+        lookups += [(("keyword_scan", "hit"), scan.hits), (("keyword_scan", "miss"), scan.misses)]
+    return lookups
+
+def cache_hit_ratio():
+    totals = {}
+    for (cache, outcome), count in cache_lookups():
+        totals.setdefault(cache, {})[outcome] = count
+    return [((cache,), counts["hit"] / (counts["hit"] + counts["miss"]))
+            for cache, counts in totals.items() if counts["hit"] + counts["miss"]]
+
+def single_flight_outcomes():
+    stats = single_flight.stats()
+    return [(("executed",), stats["executions"]), (("coalesced",), stats["coalesced"]),
+            (("rejected",), stats["rejected"]), (("failed",), stats["failures"])]
+
+def history_writes():
+    if not components.is_loaded("history_store"):
+        return []
+    stats = history_store.stats()
+    return [(("written",), stats["written"]), (("dropped",), stats["dropped"]), (("failed",), stats["failed"])]
+
+def model_queue_depth():
+    if not components.is_loaded("eccm_model") or eccm_model.transformer_batcher is None:
+        return []
+    return [((), eccm_model.transformer_batcher.stats()["queue_depth"])]
+
+metrics = MetricsRegistry()
+http_requests = metrics.counter("http_requests_total", "HTTP requests by endpoint and status", ["endpoint", "status"])
+http_errors = metrics.counter("http_errors_total", "HTTP 4xx/5xx responses by endpoint", ["endpoint", "kind"])
+http_latency = metrics.histogram("http_request_duration_seconds", "HTTP request latency", ["endpoint"])
+http_in_flight = metrics.gauge("http_requests_in_flight", "Requests currently being served")
+stage_latency = metrics.histogram("stage_duration_seconds", "Executor stage call latency", ["stage"])
+stage_errors = metrics.counter("stage_errors_total", "Executor stage failures by reason", ["stage", "reason"])
+pipeline_stage_latency = metrics.histogram(
+    "pipeline_stage_duration_seconds", "Complete-analysis stage latency", ["stage"]
+)
+metrics.collected("executor_tasks", "Stage executor occupancy", ["state"], executor_tasks)
+metrics.collected("executor_events_total", "Stage executor task outcomes", ["outcome"], executor_events, "counter")
+metrics.collected("cache_lookups_total", "Cache lookups by outcome", ["cache", "outcome"], cache_lookups, "counter")
+metrics.collected("cache_hit_ratio", "Cache hit ratio since start", ["cache"], cache_hit_ratio)
+metrics.collected("single_flight_total", "Deduplicated computations by outcome", ["outcome"],
+                  single_flight_outcomes, "counter")
+metrics.collected("single_flight_in_flight", "Distinct computations being shared", [],
+                  lambda: [((), single_flight.stats()["in_flight"])])
+metrics.collected("history_writes_total", "History store records by outcome", ["outcome"],
+                  history_writes, "counter")
+metrics.collected("model_queue_depth", "Transformer micro-batcher queue depth", [], model_queue_depth)
+
+app.add_middleware(
+    MetricsMiddleware,
+    requests=http_requests,
+    errors=http_errors,
+    latency=http_latency,
+    in_flight=http_in_flight
 )
+app.add_middleware(RulesVersionMiddleware, version=lambda: rules.version)
+
+async def run_stage(component: str, method: str, *args, timeout: Optional[float] = None,
+                    pinned=None, **kwargs):
+    stage = f"{component}.{method}"
+    started = time.perf_counter()
+    version = pinned.rules_version if pinned is not None else rules.version
+    key = SingleFlight.key(component, method, args, tuple(sorted(kwargs.items())), timeout, version)
+    try:
+        result = await single_flight.run(
+            key, lambda: executor.call(component, method, *args, timeout=timeout, pinned=pinned, **kwargs)
+        )
+    except (ExecutorSaturated, SingleFlightOverflow) as e:
+        stage_errors.inc(stage, "saturated")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, please retry",
+            headers={"Retry-After": str(e.retry_after_seconds)}
+        )
+    except ComponentVersionMismatch as e:
+        stage_errors.inc(stage, "rules_reload")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Rules are being reloaded, please retry: {str(e)}",
+            headers={"Retry-After": str(executor.retry_after_seconds)}
+        )
+    except StageTimeout as e:
+        stage_errors.inc(stage, "timeout")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception:
+        stage_errors.inc(stage, "error")
+        raise
+    stage_latency.observe(time.perf_counter() - started, stage)
+    return result
 
-normalizer = DialectNormalizer()
-eccm_model = ECCMModel()
-lss_calculator = LSSCalculator()
-ipc_mapper = IPCMapper()
-doc_generator = DocumentGenerator()
-timeline_predictor = TimelinePredictor()
-corruption_detector = CorruptionDetector()
-preprocessor = TextPreprocessor()
+def record_stage_timings(timings: Dict[str, float]):
+    for name, elapsed_ms in timings.items():
+        pipeline_stage_latency.observe(elapsed_ms / 1000, name)
+
+def parse_include(include: Optional[str]) -> Optional[List[str]]:
+    if not include:
+        return None
+    requested = [name.strip() for name in include.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in ANALYSIS_OUTPUTS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown outputs: {', '.join(unknown)}. Available: {', '.join(ANALYSIS_OUTPUTS)}"
+        )
+    return requested
+
+startup_state = {"ready": False, "error": None, "ready_ms": None, "task": None}
+
+async def preload_components():
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, components.preload, PIPELINE_COMPONENTS)
+        await loop.run_in_executor(None, eccm_model.warm_up)
+        await executor.warm_up(PIPELINE_COMPONENTS)
+    except Exception as e:
+        startup_state["error"] = str(e)
+        return
+    mark_ready()
+
+def mark_ready():
+    startup_state["ready"] = True
+    startup_state["ready_ms"] = round((time.perf_counter() - STARTED_AT) * 1000, 3)
+
+@app.on_event("startup")
+async def prepare_workers():
+    if HISTORY_ENABLED:
+        components["history_store"]
+    if PRELOAD:
+        startup_state["task"] = asyncio.create_task(preload_components())
+    else:
+        mark_ready()
+
+@app.on_event("shutdown")
+async def shutdown_executor():
+    executor.shutdown()
+    if components.is_loaded("history_store"):
+        history_store.close()
 
 class ComplaintRequest(BaseModel):
     text: str
     language: Optional[str] = "auto"
 
+class BatchComplaintRequest(BaseModel):
+    complaints: List[ComplaintRequest]
+
 class ClassificationRequest(BaseModel):
     text: str
     category: str
 
+class IpcBnsRequest(BaseModel):
+    ipc_section: str
+
 class DraftRequest(BaseModel):
     complaint_text: str
     category: str
@@ -48,23 +263,130 @@ class DraftRequest(BaseModel):
     ipc_sections: List[str]
     complainant_info: Optional[Dict] = None
 
+class BulkDraftRequest(BaseModel):
+    drafts: List[DraftRequest]
+
 @app.get("/")
 async def root():
     return {"message": "EquiCourt API is running"}
 
+@app.get("/ready")
+async def ready():
+    if startup_state["error"]:
+        raise HTTPException(status_code=503, detail=f"Startup error: {startup_state['error']}")
+    if not startup_state["ready"]:
+        raise HTTPException(status_code=503, detail="Warming up", headers={"Retry-After": "1"})
+    if components.is_loaded("eccm_model") and eccm_model.transformer is not None and eccm_model.transformer.load_error:
+        raise HTTPException(status_code=503, detail=f"Transformer error: {eccm_model.transformer.load_error}")
+    return {
+        "status": "ready",
+        "preload": PRELOAD,
+        "ready_ms": startup_state["ready_ms"],
+        **components.stats()
+    }
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return result_cache.stats()
+
+@app.get("/executor/stats")
+async def executor_stats():
+    return executor.stats()
+
+@app.get("/serialization/stats")
+async def serialization_stats():
+    return encoder.stats()
+
+@app.get("/single-flight/stats")
+async def single_flight_stats():
+    return single_flight.stats()
+
+@app.get("/rules")
+async def rules_info():
+    return {**rules.describe(), "watcher": components["rule_watcher"].stats()}
+
+@app.post("/rules/reload")
+async def reload_rules():
+    watcher = components["rule_watcher"]
+    try:
+        reloaded = await asyncio.get_running_loop().run_in_executor(None, watcher.reload)
+    except (OSError, RulesError) as e:
+        raise HTTPException(status_code=422, detail=f"Rules reload error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rules reload error: {str(e)}")
+    return {"reloaded": reloaded, **rules.describe()}
+
+def require_history():
+    if not HISTORY_ENABLED:
+        raise HTTPException(status_code=404, detail="History store is disabled")
+
+@app.get("/history")
+async def complaint_history(limit: int = 50, cursor: Optional[str] = None, category: Optional[str] = None,
+                            severity_level: Optional[str] = None, since: Optional[str] = None,
+                            until: Optional[str] = None, text_hash: Optional[str] = None):
+    require_history()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: history_store.query(
+            limit=limit, cursor=cursor, category=category, severity_level=severity_level,
+            since=since, until=until, text_hash=text_hash
+        ))
+    except HistoryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"History query error: {str(e)}")
+
+@app.get("/history/stats")
+async def history_stats():
+    require_history()
+    return history_store.stats()
+
+@app.get("/analytics")
+async def analytics(days: int = 30):
+    require_history()
+    try:
+        snapshot = await asyncio.get_running_loop().run_in_executor(None, history_store.analytics_snapshot, days)
+        return encoder.response(snapshot)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Analytics error: {str(e)}")
+
+@app.get("/history/{record_id}")
+async def complaint_history_record(record_id: int):
+    require_history()
+    try:
+        record = await asyncio.get_running_loop().run_in_executor(None, history_store.get, record_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"History query error: {str(e)}")
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"History record {record_id} not found")
+    return encoder.response(record)
+
+@app.get("/model/stats")
+async def model_stats():
+    return eccm_model.model_stats()
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return Response(content=metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/summary")
+async def metrics_summary():
+    return metrics.summary()
+
 @app.post("/normalize")
 async def normalize_text(request: ComplaintRequest):
     try:
-        normalized_result = normalizer.normalize(request.text, request.language)
+        normalized_result = await run_stage("pipeline", "normalize", request.text, request.language)
         return normalized_result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Normalization error: {str(e)}")
 
 @app.post("/classify")
 async def classify_complaint(request: ComplaintRequest):
     try:
-        normalized = normalizer.normalize(request.text, request.language)
-        classification_result = eccm_model.predict(normalized["normalized_text"])
+        normalized = await run_stage("pipeline", "normalize", request.text, request.language)
+        classification_result = await run_stage("pipeline", "classify", normalized["normalized_text"])
         
         return {
             "category": classification_result["category"],
@@ -73,33 +395,34 @@ async def classify_complaint(request: ComplaintRequest):
             "explanation": classification_result["explanation"],
             "normalized_text": normalized["normalized_text"]
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Classification error: {str(e)}")
 
 @app.post("/severity")
-async def calculate_severity(request: ClassificationRequest):
+async def calculate_severity(request: ClassificationRequest, include_factors: bool = True):
     try:
-        severity_result = lss_calculator.calculate_score(
-            request.text, 
-            request.category
-        )
+        severity_result = await run_stage("pipeline", "score", request.text, request.category, include_factors)
         
         ipc_sections = ipc_mapper.get_sections_for_category(request.category)
         
-        return {
-            "score": severity_result["score"],
-            "level": severity_result["level"],
-            "factors": severity_result["factors"],
-            "suggested_ipc": ipc_sections,
-            "risk_assessment": severity_result["risk_assessment"]
-        }
+        response = {"score": severity_result["score"], "level": severity_result["level"]}
+        if include_factors:
+            response["factors"] = severity_result["factors"]
+        response["suggested_ipc"] = ipc_sections
+        response["risk_assessment"] = severity_result["risk_assessment"]
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Severity calculation error: {str(e)}")
 
 @app.post("/generate-fir")
 async def generate_fir_draft(request: DraftRequest):
     try:
-        draft_result = doc_generator.generate_fir_draft(
+        draft_result = await run_stage(
+            "doc_generator", "generate_fir_draft",
             complaint_text=request.complaint_text,
             category=request.category,
             severity_score=request.severity_score,
@@ -109,27 +432,48 @@ async def generate_fir_draft(request: DraftRequest):
         )
         
         return draft_result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Draft generation error: {str(e)}")
 
+FIR_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "zip": "application/zip"}
+
+@app.post("/generate-fir/bulk")
+async def generate_fir_bulk(request: BulkDraftRequest, format: str = "ndjson"):
+    if format not in FIR_EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}. Use ndjson or zip")
+    
+    drafts = (
+        {
+            "complaint_text": draft.complaint_text,
+            "category": draft.category,
+            "severity_score": draft.severity_score,
+            "severity_level": draft.severity_level,
+            "ipc_sections": draft.ipc_sections,
+            "complainant_info": draft.complainant_info or {}
+        }
+        for draft in request.drafts
+    )
+    headers = {"Content-Disposition": "attachment; filename=fir_drafts.zip"} if format == "zip" else None
+    return StreamingResponse(
+        doc_generator.iter_fir_export(drafts, format),
+        media_type=FIR_EXPORT_MEDIA_TYPES[format],
+        headers=headers
+    )
+
 @app.post("/legal-mapping")
 async def get_legal_mapping(request: ClassificationRequest):
     try:
-        sections = ipc_mapper.get_detailed_sections(request.category)
-        evidence_checklist = ipc_mapper.get_evidence_checklist(request.category)
-        
-        return {
-            "ipc_sections": sections,
-            "evidence_checklist": evidence_checklist,
-            "required_documents": ["ID Proof", "Address Proof", "Complaint Affidavit"]
-        }
+        return Response(content=artifacts.fragment("legal_mapping", request.category), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Legal mapping error: {str(e)}")
 
 @app.post("/explain")
 async def explain_prediction(request: Dict):
     try:
-        highlights = eccm_model.explain_prediction(
+        highlights = await run_stage(
+            "pipeline", "explain",
             request["original_text"], 
             request["classification"]["category"]
         )
@@ -141,6 +485,8 @@ async def explain_prediction(request: Dict):
                 "Pattern matching based on legal categories"
             ]
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Explanation error: {str(e)}")
 
@@ -166,46 +512,202 @@ async def assess_corruption_risk(request: Dict):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Corruption risk assessment error: {str(e)}")
 
+def record_history(text: str, language: str, response: Dict, rules_version: str):
+    if HISTORY_ENABLED:
+        history_store.record(text, language, response, rules_version)
+
 @app.post("/analyze-complete")
-async def analyze_complete_pipeline(request: ComplaintRequest):
+async def analyze_complete_pipeline(request: ComplaintRequest, include: Optional[str] = None):
     try:
-        normalized = normalizer.normalize(request.text, request.language)
-        classification = eccm_model.predict(normalized["normalized_text"])
-        severity = lss_calculator.calculate_score(
-            normalized["normalized_text"], 
-            classification["category"]
-        )
-        legal_mapping = {
-            "ipc_sections": ipc_mapper.get_detailed_sections(classification["category"]),
-            "evidence_checklist": ipc_mapper.get_evidence_checklist(classification["category"]),
-            "required_documents": ["ID Proof", "Address Proof", "Complaint Affidavit"]
-        }
-        highlights = eccm_model.explain_prediction(
-            normalized["normalized_text"], 
-            classification["category"]
-        )
-        timeline = timeline_predictor.predict_timeline(
-            classification["category"], 
-            severity["score"]
-        )
-        corruption_risk = corruption_detector.assess_risk(
-            classification["category"],
-            severity["score"]
-        )
+        requested = parse_include(include) or ANALYSIS_OUTPUTS
         
-        return {
-            "normalization": normalized,
-            "classification": classification,
-            "severity": severity,
-            "legal": legal_mapping,
-            "explanation": {"highlights": highlights},
-            "timeline_prediction": timeline,
-            "corruption_risk": corruption_risk
-        }
+        pinned = components["pipeline"]
+        rules_version = pinned.rules_version
         
+        async def analyze():
+            graph = pinned.stage_graph(request.text, request.language, run_stage)
+            started = time.perf_counter()
+            results, timings = await graph.run(requested)
+            record_stage_timings(timings)
+            
+            response = {name: results[name] for name in ANALYSIS_OUTPUTS if name in requested}
+            response["rules_version"] = rules_version
+            return response, {"stages_ms": timings, "total_ms": round((time.perf_counter() - started) * 1000, 3)}
+        
+        key = SingleFlight.key("analyze-complete", request.text, request.language, tuple(requested), rules_version)
+        try:
+            response, timings = await single_flight.run(key, analyze)
+        except SingleFlightOverflow as e:
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please retry",
+                headers={"Retry-After": str(e.retry_after_seconds)}
+            )
+        record_history(request.text, request.language, response, rules_version)
+        return encoder.response(response, timings=timings, headers={"X-Rules-Version": rules_version})
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Complete analysis error: {str(e)}")
 
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+def format_event(event: str, body: bytes, stream_format: str) -> bytes:
+    if stream_format == "sse":
+        return b"event: " + event.encode("utf-8") + b"\ndata: " + body + b"\n\n"
+    return body + b"\n"
+
+async def stream_analysis(graph, requested: List[str], stream_format: str, rules_version: str,
+                          request: ComplaintRequest):
+    started = time.perf_counter()
+    timings = {}
+    results = {}
+    try:
+        async for name, result, elapsed_ms in graph.run_iter(requested):
+            timings[name] = elapsed_ms
+            pipeline_stage_latency.observe(elapsed_ms / 1000, name)
+            if name in requested:
+                results[name] = result
+                body = b"".join([
+                    b'{"stage":', dumps(name),
+                    b',"elapsed_ms":', dumps(elapsed_ms),
+                    b',"result":', encoder.encode(result), b"}"
+                ])
+                yield format_event(name, body, stream_format)
+    except HTTPException as e:
+        error = {"stage": "error", "status_code": e.status_code, "error": e.detail}
+        yield format_event("error", dumps(error), stream_format)
+        return
+    except Exception as e:
+        error = {"stage": "error", "status_code": 500, "error": f"Complete analysis error: {str(e)}"}
+        yield format_event("error", dumps(error), stream_format)
+        return
+    
+    response = {name: results[name] for name in ANALYSIS_OUTPUTS if name in results}
+    response["rules_version"] = rules_version
+    record_history(request.text, request.language, response, rules_version)
+    done = {
+        "stage": "done",
+        "rules_version": rules_version,
+        "timings": {"stages_ms": timings, "total_ms": round((time.perf_counter() - started) * 1000, 3)}
+    }
+    yield format_event("done", dumps(done), stream_format)
+
+@app.post("/analyze-complete/stream")
+async def analyze_complete_stream(request: ComplaintRequest, include: Optional[str] = None,
+                                  format: str = "ndjson"):
+    if format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported stream format: {format}. Use ndjson or sse")
+    
+    requested = parse_include(include) or ANALYSIS_OUTPUTS
+    try:
+        pinned = components["pipeline"]
+        graph = pinned.stage_graph(request.text, request.language, run_stage)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Complete analysis error: {str(e)}")
+    
+    return StreamingResponse(
+        stream_analysis(graph, requested, format, pinned.rules_version, request),
+        media_type=STREAM_MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Rules-Version": pinned.rules_version}
+    )
+
+@app.post("/analyze-batch")
+async def analyze_batch_pipeline(request: BatchComplaintRequest, include_factors: bool = True):
+    try:
+        pinned = components["pipeline"]
+        rules_version = pinned.rules_version
+        results = await run_stage(
+            "pipeline", "analyze_batch",
+            [(complaint.text, complaint.language) for complaint in request.complaints],
+            include_factors,
+            timeout=BATCH_TIMEOUT_SECONDS,
+            pinned=pinned
+        )
+        failed = 0
+        for complaint, result in zip(request.complaints, results):
+            if result["status"] == "ok":
+                record_history(complaint.text, complaint.language, {**result["result"], "rules_version": rules_version},
+                               rules_version)
+            else:
+                failed += 1
+        
+        return encoder.response({
+            "results": results,
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "rules_version": rules_version
+        }, headers={"X-Rules-Version": rules_version})
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch analysis error: {str(e)}")
+
+@app.post("/ipc-bns")
+async def compare_ipc_bns(request: IpcBnsRequest):
+    try:
+        mapping = legal_corpus.get_by_ipc(request.ipc_section)
+        if mapping is None:
+            raise HTTPException(status_code=404, detail=f"IPC section {request.ipc_section} is not in the mapping database")
+        return mapping
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"IPC-BNS lookup error: {str(e)}")
+
+@app.get("/ipc-bns")
+async def list_ipc_bns(bns: Optional[str] = None, category: Optional[str] = None):
+    try:
+        if bns:
+            return legal_corpus.get_by_bns(bns)
+        if category:
+            return legal_corpus.get_by_category(category)
+        return {"metadata": legal_corpus.metadata, "categories": legal_corpus.categories()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"IPC-BNS lookup error: {str(e)}")
+
+@app.get("/legal-acts")
+async def get_legal_acts(category: Optional[str] = None):
+    try:
+        return legal_corpus.acts(category)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Legal acts error: {str(e)}")
+
+@app.get("/legal-corpus/search")
+async def search_legal_corpus(q: str, kind: Optional[str] = None, limit: int = 20):
+    if len(q) > MAX_QUERY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Query must be at most {MAX_QUERY_LENGTH} characters")
+    try:
+        records = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: legal_corpus.search(q, kind=kind, limit=limit)
+        )
+        return [
+            {"kind": record["kind"], "key": record["key"], "title": record["title"], "document": record["document"]}
+            for record in records
+        ]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Legal corpus search error: {str(e)}")
+
+@app.get("/legal-corpus/stats")
+async def legal_corpus_stats():
+    return {**legal_corpus.stats(), "search_index": legal_search.stats()}
+
+@app.get("/legal-search")
+async def search_legal(q: str, kind: Optional[str] = None, page: int = 1, page_size: int = 10,
+                       fuzzy: bool = True):
+    if page < 1 or not 1 <= page_size <= 100:
+        raise HTTPException(status_code=400, detail="page must be >= 1 and page_size between 1 and 100")
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: legal_search.search(q, kind=kind, page=page, page_size=page_size, fuzzy=fuzzy)
+        )
+    except LegalSearchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Legal search error: {str(e)}")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
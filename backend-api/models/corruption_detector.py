@@ -1,13 +1,24 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from utils.artifact_registry import ArtifactRegistry, FrozenDict, default_registry
 
 class CorruptionDetector:
-    def __init__(self):
+    def __init__(self, artifacts: Optional[ArtifactRegistry] = None):
+        self.artifacts = artifacts or default_registry()
         self.risk_factors = {
             "high_value_cases": ["fraud", "cybercrime"],
             "bureaucratic_hurdles": ["all"],
             "evidence_sensitivity": ["assault", "harassment"],
             "witness_intimidation_risk": ["assault", "theft"]
         }
+        self._assessments = {
+            risk_score: self._build_assessment(risk_score)
+            for risk_score in {
+                round(category_points + severity_points, 2)
+                for category_points in (0, 0.2, 0.3)
+                for severity_points in (0, 0.2, 0.3)
+            }
+        }
     
     def assess_risk(self, category: str, severity_score: int) -> Dict[str, Any]:
         risk_score = 0
@@ -22,33 +33,19 @@ class CorruptionDetector:
         elif severity_score > 50:
             risk_score += 0.2
         
+        return self._assessments[round(risk_score, 2)]
+    
+    def _build_assessment(self, risk_score: float) -> FrozenDict:
         if risk_score >= 0.5:
             risk_level = "High"
-            recommendations = [
-                "File complaint directly with higher authorities",
-                "Maintain duplicate copies of all documents",
-                "Use official email for all communications",
-                "Seek assistance from anti-corruption helpline if needed"
-            ]
         elif risk_score >= 0.3:
             risk_level = "Medium"
-            recommendations = [
-                "Follow up regularly on case status",
-                "Document all interactions with officials",
-                "Use transparent payment methods if any fees",
-                "Consult with legal aid services"
-            ]
         else:
             risk_level = "Low"
-            recommendations = [
-                "Follow standard procedures",
-                "Maintain proper documentation",
-                "Be aware of your rights as complainant"
-            ]
         
-        return {
-            "risk_score": round(risk_score, 2),
+        return self.artifacts.register(FrozenDict({
+            "risk_score": risk_score,
             "risk_level": risk_level,
-            "recommendations": recommendations,
-            "factors_considered": ["case_category", "severity", "common_risk_patterns"]
-        }
\ No newline at end of file
+            "recommendations": self.artifacts.corruption_recommendations[risk_level],
+            "factors_considered": self.artifacts.corruption_factors
+        }))
\ No newline at end of file
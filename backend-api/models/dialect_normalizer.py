@@ -1,36 +1,67 @@
 import re
-from typing import Dict, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from utils.rule_store import RuleSet, default_rules
+from utils.versioning import rules_fingerprint
 
 class DialectNormalizer:
-    def __init__(self):
-        self.dialect_mappings = {
-            "mobile": "mobile phone",
-            "phone": "mobile phone", 
-            "gadi": "vehicle",
-            "paise": "money",
-            "chor": "thief",
-            "maar": "beat",
-            "gussa": "anger",
-            "thief": "thief",
-            "robber": "robber",
-            "snatcher": "snatcher",
-            "guy": "person",
-            "stuff": "items",
-            "thing": "object"
-        }
+    def __init__(self, rules: Optional[RuleSet] = None):
+        rules = rules or default_rules()
+        self.dialect_mappings = dict(rules.dialect_mappings)
+        self.regional_indicators = {language: list(words) for language, words in rules.regional_indicators.items()}
+        self.spelling_corrections = dict(rules.spelling_corrections)
+        self.formalizations = dict(rules.formalizations)
         
-        self.regional_indicators = {
-            "hindi": ["mobile", "gadi", "paise", "chor", "maar"],
-            "urdu": ["mobile", "gadi"],
-            "bengali": ["churi", "gari"]
-        }
+        self.compile()
+    
+    def compile(self):
+        self.rules_version = rules_fingerprint(
+            self.dialect_mappings, self.regional_indicators,
+            self.spelling_corrections, self.formalizations
+        )
+        self._whitespace_pattern = re.compile(r'\s+')
+        self._token_pattern = re.compile(r'\S+')
+        self._spelling_pattern, self._spelling_replace = self._compile_stage(
+            self.spelling_corrections, r'\b', r'\b'
+        )
+        self._dialect_pattern, self._dialect_replace = self._compile_stage(
+            self.dialect_mappings, r'(?<!\S)', r'(?!\S)', per_term_fallback=False
+        )
+        self._formal_pattern, self._formal_replace = self._compile_stage(
+            self.formalizations, r'\b', r'\b'
+        )
+        self._phrase_window = max([
+            len(term.split())
+            for table in (self.spelling_corrections, self.dialect_mappings, self.formalizations)
+            for term in table
+        ] + [1])
+    
+    def _compile_stage(self, table: Dict[str, str], prefix: str, suffix: str, per_term_fallback: bool = True):
+        lookup = {term.lower(): replacement for term, replacement in table.items()}
+        if not lookup:
+            return re.compile(r'(?!)'), None
+        
+        alternation = "|".join(re.escape(term) for term in sorted(lookup, key=len, reverse=True))
+        pattern = re.compile(prefix + "(?:" + alternation + ")" + suffix, flags=re.IGNORECASE)
+        fallbacks = [
+            (re.compile(re.escape(term), flags=re.IGNORECASE), replacement) for term, replacement in table.items()
+        ] if per_term_fallback else []
+        
+        def replace(match):
+            term = match.group(0)
+            replacement = lookup.get(term.lower())
+            if replacement is None:
+                replacement = next(
+                    (replacement for candidate, replacement in fallbacks if candidate.fullmatch(term)), term
+                )
+            return replacement
+        
+        return pattern, replace
     
     def normalize(self, text: str, language: str = "auto") -> Dict[str, Any]:
         detected_language = self._detect_language(text) if language == "auto" else language
         
-        cleaned_text = self._clean_text(text)
-        normalized_text = self._replace_dialect_words(cleaned_text)
-        formal_text = self._formalize_language(normalized_text)
+        formal_text = self._normalize_text(text)
         
         return {
             "normalized_text": formal_text,
@@ -40,6 +71,68 @@ class DialectNormalizer:
             "confidence": 0.85
         }
     
+    def normalize_batch(self, texts: List[str], languages: List[str]) -> List[Dict[str, Any]]:
+        return [self.normalize(text, language) for text, language in zip(texts, languages)]
+    
+    def normalize_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        stream = self._collapse_whitespace_stream(chunks)
+        stream = self._substitute_stream(stream, self._spelling_pattern, self._spelling_replace)
+        stream = self._substitute_stream(stream, self._dialect_pattern, self._dialect_replace)
+        return self._substitute_stream(stream, self._formal_pattern, self._formal_replace)
+    
+    def _normalize_text(self, text: str) -> str:
+        cleaned_text = self._clean_text(text)
+        normalized_text = self._replace_dialect_words(cleaned_text)
+        return self._formalize_language(normalized_text)
+    
+    def _collapse_whitespace_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        pending = ""
+        started = False
+        
+        for chunk in chunks:
+            pending += chunk
+            end = len(pending.rstrip())
+            if end == 0:
+                continue
+            
+            piece = self._whitespace_pattern.sub(' ', pending[:end])
+            if not started:
+                piece = piece.lstrip()
+                started = True
+            pending = pending[end:]
+            yield piece
+    
+    def _substitute_stream(self, chunks: Iterable[str], pattern, replace) -> Iterator[str]:
+        buffer = ""
+        
+        for chunk in chunks:
+            buffer += chunk
+            tokens = list(self._token_pattern.finditer(buffer))
+            if len(tokens) <= self._phrase_window:
+                continue
+            
+            cut = tokens[-self._phrase_window].start()
+            pieces = []
+            consumed = 0
+            for match in pattern.finditer(buffer):
+                if match.start() >= cut:
+                    break
+                if match.end() > cut:
+                    cut = match.start()
+                    break
+                pieces.append(buffer[consumed:match.start()])
+                pieces.append(replace(match))
+                consumed = match.end()
+            pieces.append(buffer[consumed:cut])
+            
+            buffer = buffer[cut:]
+            piece = "".join(pieces)
+            if piece:
+                yield piece
+        
+        if buffer:
+            yield pattern.sub(replace, buffer)
+    
     def _detect_language(self, text: str) -> str:
         text_lower = text.lower()
         
@@ -50,48 +143,12 @@ class DialectNormalizer:
         return "english"
     
     def _clean_text(self, text: str) -> str:
-        text = re.sub(r'\s+', ' ', text)
-        
-        replacements = {
-            "fone": "phone",
-            "mob": "mobile",
-            "thnaks": "thanks",
-            "pls": "please",
-            "ur": "your"
-        }
-        
-        for wrong, correct in replacements.items():
-            text = re.sub(r'\b' + wrong + r'\b', correct, text, flags=re.IGNORECASE)
-        
+        text = self._whitespace_pattern.sub(' ', text)
+        text = self._spelling_pattern.sub(self._spelling_replace, text)
         return text.strip()
     
     def _replace_dialect_words(self, text: str) -> str:
-        words = text.split()
-        normalized_words = []
-        
-        for word in words:
-            normalized_word = self.dialect_mappings.get(word.lower(), word)
-            normalized_words.append(normalized_word)
-        
-        return ' '.join(normalized_words)
+        return self._dialect_pattern.sub(self._dialect_replace, text)
     
     def _formalize_language(self, text: str) -> str:
-        formalizations = {
-            "my": "the complainant's",
-            "i": "the complainant",
-            "me": "the complainant",
-            "he": "the accused",
-            "she": "the accused",
-            "they": "the accused persons",
-            "took": "appropriated",
-            "stole": "unlawfully took",
-            "beat": "assaulted",
-            "hit": "struck",
-            "ran away": "fled the scene"
-        }
-        
-        formal_text = text
-        for informal, formal in formalizations.items():
-            formal_text = re.sub(r'\b' + informal + r'\b', formal, formal_text, flags=re.IGNORECASE)
-        
-        return formal_text
\ No newline at end of file
+        return self._formal_pattern.sub(self._formal_replace, text)
\ No newline at end of file
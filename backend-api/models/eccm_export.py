@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.corpus import SENTENCES, complaint_text
+from models.inference_backends import INT8_FILENAME, ONNX_FILENAME, load_backend
+
+EXPORT_FORMATS = ["onnx", "int8"]
+MANIFEST_FILENAME = "export_manifest.json"
+PARITY_TEXT_COUNT = 64
+
+class ParityError(Exception):
+    pass
+
+def _load_float_model(model_path: str):
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path, torchscript=True)
+    model.eval()
+    return tokenizer, model
+
+def _example_inputs(tokenizer, texts: List[str], max_length: int):
+    encoded = tokenizer(texts, padding=True, truncation=True, max_length=max_length, return_tensors="pt")
+    return encoded["input_ids"], encoded["attention_mask"]
+
+def export_onnx(model, example_inputs, output_path: str, opset: int = 14):
+    import torch
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            example_inputs,
+            output_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"}
+            },
+            opset_version=opset
+        )
+
+def export_int8(model, example_inputs, output_path: str):
+    import torch
+
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    with torch.no_grad():
+        traced = torch.jit.trace(quantized, example_inputs, strict=False)
+    traced.save(output_path)
+
+def read_eval_file(path: str) -> List[Dict[str, str]]:
+    examples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                examples.append({"text": record["text"], "label": record.get("label")})
+    return examples
+
+def default_parity_examples(count: int = PARITY_TEXT_COUNT) -> List[Dict[str, str]]:
+    texts = list(SENTENCES[:count])
+    for seed in range(count - len(texts)):
+        texts.append(complaint_text(256 if seed % 2 == 0 else 1024, seed))
+    return [{"text": text, "label": None} for text in texts]
+
+def _predict(backend, tokenizer, texts: List[str], max_length: int, batch_size: int = 32) -> np.ndarray:
+    predictions = []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(texts[start:start + batch_size], padding=True, truncation=True,
+                            max_length=max_length, return_tensors="np")
+        encoded = {name: np.asarray(values, dtype=np.int64) for name, values in encoded.items()}
+        predictions.append(backend.logits(encoded).argmax(axis=-1))
+    return np.concatenate(predictions) if predictions else np.zeros(0, dtype=np.int64)
+
+def check_parity(model_path: str, candidate_dir: str, formats: List[str], examples: List[Dict[str, str]],
+                 labels: List[str], max_drift: float, max_length: int) -> Dict[str, Dict[str, float]]:
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    texts = [example["text"] for example in examples]
+    reference = _predict(load_backend("torch", model_path), tokenizer, texts, max_length)
+
+    label_index = {label: index for index, label in enumerate(labels)}
+    gold = [label_index.get(str(example["label"]).lower()) for example in examples]
+    labelled = all(index is not None for index in gold)
+    if labelled:
+        gold = np.asarray(gold)
+        reference_score = float((reference == gold).mean())
+    else:
+        gold = reference
+        reference_score = 1.0
+
+    report = {}
+    for name in formats:
+        predictions = _predict(load_backend(name, candidate_dir), tokenizer, texts, max_length)
+        score = float((predictions == gold).mean())
+        report[name] = {
+            "metric": "accuracy" if labelled else "agreement",
+            "float": round(reference_score, 4),
+            "exported": round(score, 4),
+            "drift": round(reference_score - score, 4),
+            "agreement_with_float": round(float((predictions == reference).mean()), 4)
+        }
+
+    failed = [name for name, result in report.items() if result["drift"] > max_drift]
+    if failed:
+        raise ParityError(f"Exported model drifted more than {max_drift} for: {', '.join(failed)} ({report})")
+    return report
+
+def export_model(model_path: str, output_dir: str, formats: List[str], eval_file: Optional[str] = None,
+                 max_drift: float = 0.01, max_length: int = 256) -> Dict:
+    unknown = [name for name in formats if name not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown export formats: {', '.join(unknown)}")
+
+    tokenizer, model = _load_float_model(model_path)
+    labels = [model.config.id2label[index].lower() for index in range(model.config.num_labels)]
+    examples = read_eval_file(eval_file) if eval_file else default_parity_examples()
+    example_inputs = _example_inputs(tokenizer, [example["text"] for example in examples[:4]], max_length)
+
+    os.makedirs(output_dir, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix=".export-", dir=output_dir)
+    try:
+        tokenizer.save_pretrained(staging_dir)
+        model.config.save_pretrained(staging_dir)
+
+        exporters = {"onnx": (export_onnx, ONNX_FILENAME), "int8": (export_int8, INT8_FILENAME)}
+        timings = {}
+        for name in formats:
+            started = time.perf_counter()
+            export, filename = exporters[name]
+            export(model, example_inputs, os.path.join(staging_dir, filename))
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+        parity = check_parity(model_path, staging_dir, formats, examples, labels, max_drift, max_length)
+
+        manifest = {
+            "source_model": os.path.abspath(model_path),
+            "formats": formats,
+            "labels": labels,
+            "max_length": max_length,
+            "max_drift": max_drift,
+            "eval_examples": len(examples),
+            "export_ms": timings,
+            "parity": parity
+        }
+        with open(os.path.join(staging_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        for filename in os.listdir(staging_dir):
+            os.replace(os.path.join(staging_dir, filename), os.path.join(output_dir, filename))
+        return manifest
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the ECCM transformer to ONNX / int8 and check parity")
+    parser.add_argument("--model-path", required=True)
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--formats", nargs="+", default=EXPORT_FORMATS, choices=EXPORT_FORMATS)
+    parser.add_argument("--eval-file", help="JSONL file with 'text' and 'label' fields, "
+                                            f"defaults to {PARITY_TEXT_COUNT} built-in complaints checked for agreement")
+    parser.add_argument("--max-drift", type=float, default=0.01)
+    parser.add_argument("--max-length", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = export_model(args.model_path, args.output_dir, args.formats, args.eval_file,
+                                args.max_drift, args.max_length)
+    except ParityError as e:
+        print(f"Parity check failed, nothing was published: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(manifest["parity"], indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,99 +1,290 @@
+import heapq
 import re
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+import numpy as np
+
+from utils.keyword_matcher import KeywordMatcher, MatchResult
+from utils.keyword_matrix import presence_matrix, membership_matrix
+from utils.rule_store import RuleSet, default_rules
+from utils.versioning import rules_fingerprint
+from models.transformer_classifier import BatcherSaturated, MicroBatcher, TransformerClassifier
 
 class ECCMModel:
-    def __init__(self):
+    def __init__(self, highlight_top_k: Optional[int] = 5, rules: Optional[RuleSet] = None):
+        rules = rules or default_rules()
         self.categories = {
-            "theft": {
-                "keywords": ["stolen", "theft", "robbery", "snatched", "missing", "taken"],
-                "subcategories": ["Petty Theft", "Burglary", "Robbery", "Vehicle Theft"]
-            },
-            "assault": {
-                "keywords": ["assault", "beaten", "hit", "attacked", "violence", "hurt"],
-                "subcategories": ["Physical Assault", "Verbal Abuse", "Domestic Violence"]
-            },
-            "harassment": {
-                "keywords": ["harassment", "threat", "stalk", "bully", "intimidate"],
-                "subcategories": ["Sexual Harassment", "Cyber Harassment", "Workplace Harassment"]
-            },
-            "fraud": {
-                "keywords": ["fraud", "cheat", "scam", "fake", "duped", "forged"],
-                "subcategories": ["Online Fraud", "Financial Fraud", "Identity Theft"]
-            },
-            "cybercrime": {
-                "keywords": ["hack", "cyber", "online", "phishing", "malware", "account"],
-                "subcategories": ["Hacking", "Cyber Bullying", "Online Fraud"]
-            }
+            category: {"keywords": list(data["keywords"]), "subcategories": list(data["subcategories"])}
+            for category, data in rules.categories.items()
         }
+        self.subcategory_hints = {
+            category: [(subcategory, list(words)) for subcategory, words in hints]
+            for category, hints in rules.subcategory_hints.items()
+        }
+        self.strong_keywords = set(rules.strong_keywords)
+        self.highlight_top_k = highlight_top_k
+        self._word_pattern = re.compile(r'\b\w+\b')
+        self._word_char_pattern = re.compile(r'\w')
+        
+        self.transformer: Optional[TransformerClassifier] = None
+        self.transformer_batcher: Optional[MicroBatcher] = None
+        self.transformer_timeout = 2.0
+        self._fallback_lock = threading.Lock()
+        self.fallbacks = {"not_loaded": 0, "saturated": 0, "timeout": 0, "error": 0}
+        
+        self.compile()
     
-    def predict(self, text: str) -> Dict[str, Any]:
-        text_lower = text.lower()
+    def compile(self):
+        self.rules_version = rules_fingerprint(
+            self.categories, self.subcategory_hints, self.strong_keywords,
+            self.transformer.model_path if self.transformer else None
+        )
+        self._highlight_keywords = {
+            category: set(data["keywords"]) for category, data in self.categories.items()
+        }
+        
+        self.matcher = KeywordMatcher(self.keyword_vocabulary())
+        self._category_names = list(self.categories)
+        self._keywords, self._membership = membership_matrix(
+            {name: data["keywords"] for name, data in self.categories.items()}
+        )
+        self._keyword_counts = np.maximum(self._membership.sum(axis=0), 1)
+    
+    def keyword_vocabulary(self) -> List[str]:
+        vocabulary = [keyword for data in self.categories.values() for keyword in data["keywords"]]
+        for hints in self.subcategory_hints.values():
+            for _, words in hints:
+                vocabulary.extend(words)
+        return vocabulary
+    
+    def use_matcher(self, matcher: KeywordMatcher):
+        self.matcher = matcher
+    
+    def enable_transformer(self, classifier: TransformerClassifier, max_batch_size: int = 16,
+                           max_wait_ms: float = 5.0, max_queue_size: int = 256,
+                           timeout_seconds: float = 2.0):
+        if self.transformer_batcher is not None:
+            self.transformer_batcher.close()
+        
+        self.transformer = classifier
+        self.transformer_timeout = timeout_seconds
+        self.transformer_batcher = MicroBatcher(
+            classifier.classify_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            name="eccm-micro-batcher"
+        )
+        self.compile()
+    
+    def adopt_transformer(self, previous: "ECCMModel"):
+        if previous.transformer is None:
+            return
+        
+        self.transformer = previous.transformer
+        self.transformer_batcher = previous.transformer_batcher
+        self.transformer_timeout = previous.transformer_timeout
+        self.compile()
+    
+    def warm_up(self):
+        for text in TransformerClassifier.warm_up_texts:
+            self.predict(text)
+            self.explain_prediction(text, "theft")
+        
+        if self.transformer is not None:
+            self.transformer.warm_up(batch_sizes=(1, self.transformer_batcher.max_batch_size))
+    
+    def model_stats(self) -> Dict[str, Any]:
+        with self._fallback_lock:
+            fallbacks = dict(self.fallbacks)
+        
+        if self.transformer is None:
+            return {"mode": "keyword", "fallbacks": fallbacks}
+        
+        return {
+            "mode": "transformer",
+            "model_path": self.transformer.model_path,
+            "loaded": self.transformer.is_loaded,
+            "backend": self.transformer.backend_name,
+            "backend_timings_ms": self.transformer.backend_timings,
+            "warmed_up": self.transformer.warmed_up,
+            "load_error": self.transformer.load_error,
+            "batcher": self.transformer_batcher.stats(),
+            "fallbacks": fallbacks
+        }
+    
+    def predict(self, text: str, matches: Optional[MatchResult] = None) -> Dict[str, Any]:
+        if matches is None:
+            matches = self.matcher.scan(text)
+        
+        if self.transformer is not None:
+            probabilities = self._transformer_scores(self._submit_to_transformer([text])[0])
+            if probabilities is not None:
+                return self._transformer_result(probabilities, matches)
         
         scores = {}
         for category, data in self.categories.items():
-            keyword_matches = sum(1 for keyword in data["keywords"] if keyword in text_lower)
-            scores[category] = keyword_matches / len(data["keywords"])
+            keyword_matches = sum(1 for keyword in data["keywords"] if keyword in matches)
+            scores[category] = keyword_matches / len(data["keywords"]) if data["keywords"] else 0.0
         
         best_category = max(scores, key=scores.get)
         confidence = scores[best_category]
         
-        subcategory = self._determine_subcategory(text_lower, best_category)
-        explanation = self._generate_explanation(text_lower, best_category)
+        subcategory = self._determine_subcategory(matches, best_category)
+        explanation = self._generate_explanation(matches, best_category)
         
         return {
             "category": best_category.title(),
             "confidence": max(0.7, confidence),
             "subcategory": subcategory,
             "explanation": explanation,
-            "all_scores": scores
+            "all_scores": scores,
+            "model": "keyword"
         }
     
-    def _determine_subcategory(self, text: str, category: str) -> str:
-        if category == "theft":
-            if any(word in text for word in ["mobile", "phone", "wallet"]):
-                return "Petty Theft"
-            elif any(word in text for word in ["car", "bike", "vehicle"]):
-                return "Vehicle Theft"
-            elif any(word in text for word in ["house", "home", "break-in"]):
-                return "Burglary"
-        
-        elif category == "assault":
-            if any(word in text for word in ["wife", "husband", "domestic"]):
-                return "Domestic Violence"
-            elif any(word in text for word in ["punch", "hit", "physical"]):
-                return "Physical Assault"
+    def predict_batch(self, texts: List[str], matches: Optional[List[MatchResult]] = None) -> List[Dict[str, Any]]:
+        if matches is None:
+            matches = [self.matcher.scan(text) for text in texts]
+        
+        if self.transformer is None:
+            return self._keyword_predict_batch(matches)
+        
+        probabilities = [self._transformer_scores(future) for future in self._submit_to_transformer(texts)]
+        if any(scores is None for scores in probabilities):
+            keyword_results = self._keyword_predict_batch(matches)
+        else:
+            keyword_results = [None] * len(texts)
+        
+        return [
+            self._transformer_result(scores, text_matches) if scores is not None else keyword_result
+            for scores, text_matches, keyword_result in zip(probabilities, matches, keyword_results)
+        ]
+    
+    def _keyword_predict_batch(self, matches: List[MatchResult]) -> List[Dict[str, Any]]:
+        presence = presence_matrix(matches, self._keywords)
+        score_matrix = (presence @ self._membership) / self._keyword_counts
+        best_indices = score_matrix.argmax(axis=1)
+        
+        results = []
+        for text_matches, row, best_index in zip(matches, score_matrix, best_indices):
+            best_category = self._category_names[best_index]
+            scores = {name: float(score) for name, score in zip(self._category_names, row)}
+            
+            results.append({
+                "category": best_category.title(),
+                "confidence": max(0.7, scores[best_category]),
+                "subcategory": self._determine_subcategory(text_matches, best_category),
+                "explanation": self._generate_explanation(text_matches, best_category),
+                "all_scores": scores,
+                "model": "keyword"
+            })
+        
+        return results
+    
+    def _submit_to_transformer(self, texts: List[str]) -> List[Any]:
+        if not self.transformer.is_loaded:
+            self._count_fallback("not_loaded", len(texts))
+            return [None] * len(texts)
+        
+        futures = []
+        for text in texts:
+            try:
+                futures.append(self.transformer_batcher.submit(text))
+            except BatcherSaturated:
+                self._count_fallback("saturated")
+                futures.append(None)
+        return futures
+    
+    def _transformer_scores(self, future) -> Optional[Dict[str, float]]:
+        if future is None:
+            return None
+        
+        try:
+            probabilities = future.result(timeout=self.transformer_timeout)
+        except FutureTimeout:
+            future.cancel()
+            self._count_fallback("timeout")
+            return None
+        except Exception:
+            self._count_fallback("error")
+            return None
+        
+        scores = {label: float(score) for label, score in probabilities.items() if label in self.categories}
+        return scores or None
+    
+    def _transformer_result(self, scores: Dict[str, float], matches: MatchResult) -> Dict[str, Any]:
+        best_category = max(scores, key=scores.get)
+        
+        return {
+            "category": best_category.title(),
+            "confidence": scores[best_category],
+            "subcategory": self._determine_subcategory(matches, best_category),
+            "explanation": self._generate_explanation(matches, best_category),
+            "all_scores": scores,
+            "model": "transformer"
+        }
+    
+    def _count_fallback(self, reason: str, count: int = 1):
+        with self._fallback_lock:
+            self.fallbacks[reason] += count
+    
+    def _determine_subcategory(self, matches: MatchResult, category: str) -> str:
+        for subcategory, words in self.subcategory_hints.get(category, []):
+            if any(word in matches for word in words):
+                return subcategory
         
         return self.categories[category]["subcategories"][0]
     
-    def _generate_explanation(self, text: str, category: str) -> str:
-        keywords_found = [keyword for keyword in self.categories[category]["keywords"] 
-                         if keyword in text]
+    def _generate_explanation(self, matches: MatchResult, category: str) -> str:
+        keywords_found = matches.found(self.categories[category]["keywords"])
         
         if keywords_found:
             return f"Classification based on keywords: {', '.join(keywords_found)}"
         else:
             return "Classification based on contextual patterns in the complaint"
     
-    def explain_prediction(self, text: str, category: str) -> List[Dict[str, Any]]:
-        highlights = []
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        category_keywords = self.categories.get(category.lower(), {}).get("keywords", [])
-        
-        current_pos = 0
-        for word in words:
-            start = text.lower().find(word, current_pos)
-            if start != -1:
-                end = start + len(word)
-                current_pos = end
-                
-                if word in category_keywords:
-                    weight = 0.8 if word in ["stolen", "assault", "fraud", "harassment"] else 0.6
-                    highlights.append({
-                        "start": start,
-                        "end": end,
-                        "weight": weight,
-                        "reason": f"Key '{category}' keyword"
-                    })
-        
-        return highlights[:5]
\ No newline at end of file
+    def explain_prediction(self, text: str, category: str, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        top_k = self.highlight_top_k if top_k is None else top_k
+        highlights = self.iter_highlights(text, category)
+        
+        if top_k is None:
+            return sorted(highlights, key=self._highlight_rank)
+        return heapq.nsmallest(top_k, highlights, key=self._highlight_rank)
+    
+    def iter_highlights(self, text: str, category: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        category_keywords = self._highlight_keywords.get(category.lower(), set())
+        if not category_keywords:
+            return
+        
+        reason = f"Key '{category}' keyword"
+        for match in self._word_pattern.finditer(text):
+            word = match.group(0).lower()
+            if word in category_keywords:
+                yield {
+                    "start": offset + match.start(),
+                    "end": offset + match.end(),
+                    "weight": 0.8 if word in self.strong_keywords else 0.6,
+                    "reason": reason
+                }
+    
+    def explain_prediction_stream(self, chunks: Iterable[str], category: str) -> Iterator[Dict[str, Any]]:
+        buffer = ""
+        offset = 0
+        
+        for chunk in chunks:
+            buffer += chunk
+            cut = len(buffer)
+            while cut and self._word_char_pattern.match(buffer, cut - 1):
+                cut -= 1
+            
+            yield from self.iter_highlights(buffer[:cut], category, offset)
+            offset += cut
+            buffer = buffer[cut:]
+        
+        yield from self.iter_highlights(buffer, category, offset)
+    
+    @staticmethod
+    def _highlight_rank(highlight: Dict[str, Any]):
+        return (-highlight["weight"], highlight["start"])
@@ -0,0 +1,123 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+ONNX_FILENAME = "model.onnx"
+INT8_FILENAME = "model.int8.pt"
+FLOAT_WEIGHT_FILENAMES = ("model.safetensors", "pytorch_model.bin")
+BACKEND_PREFERENCE = ["onnx", "int8", "torch"]
+
+class InferenceBackend:
+    name = "base"
+
+    def logits(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        raise NotImplementedError
+
+class TorchBackend(InferenceBackend):
+    name = "torch"
+
+    def __init__(self, model_path: str):
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        self._torch = torch
+        self._model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        self._model.eval()
+
+    def logits(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        inputs = {name: self._torch.from_numpy(values) for name, values in encoded.items()}
+        with self._torch.inference_mode():
+            return self._model(**inputs).logits.numpy()
+
+class TorchScriptBackend(InferenceBackend):
+    name = "int8"
+
+    def __init__(self, model_path: str):
+        import torch
+
+        self._torch = torch
+        self._model = torch.jit.load(os.path.join(model_path, INT8_FILENAME), map_location="cpu")
+        self._model.eval()
+
+    def logits(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        input_ids = self._torch.from_numpy(encoded["input_ids"])
+        attention_mask = self._torch.from_numpy(encoded["attention_mask"])
+        with self._torch.inference_mode():
+            return self._model(input_ids, attention_mask)[0].numpy()
+
+class OnnxBackend(InferenceBackend):
+    name = "onnx"
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self._session = onnxruntime.InferenceSession(
+            os.path.join(model_path, ONNX_FILENAME),
+            options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [model_input.name for model_input in self._session.get_inputs()]
+
+    def logits(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        inputs = {name: encoded[name].astype(np.int64) for name in self._input_names if name in encoded}
+        return self._session.run(None, inputs)[0]
+
+def _importable(module: str) -> bool:
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+def available_backends(model_path: str) -> List[str]:
+    available = []
+    if os.path.exists(os.path.join(model_path, ONNX_FILENAME)) and _importable("onnxruntime"):
+        available.append("onnx")
+    if os.path.exists(os.path.join(model_path, INT8_FILENAME)) and _importable("torch"):
+        available.append("int8")
+    if any(os.path.exists(os.path.join(model_path, name)) for name in FLOAT_WEIGHT_FILENAMES) \
+            and _importable("torch"):
+        available.append("torch")
+    return available
+
+def load_backend(name: str, model_path: str, num_threads: Optional[int] = None) -> InferenceBackend:
+    if name == "onnx":
+        return OnnxBackend(model_path, num_threads)
+    if name == "int8":
+        return TorchScriptBackend(model_path)
+    if name == "torch":
+        return TorchBackend(model_path)
+    raise ValueError(f"Unknown inference backend: {name}")
+
+def select_fastest_backend(model_path: str, candidates: List[str], probe: Dict[str, np.ndarray],
+                           num_threads: Optional[int] = None,
+                           rounds: int = 3) -> Tuple[InferenceBackend, Dict[str, float]]:
+    timings: Dict[str, float] = {}
+    best: Optional[InferenceBackend] = None
+    errors: Dict[str, str] = {}
+
+    for name in candidates:
+        try:
+            backend = load_backend(name, model_path, num_threads)
+            backend.logits(probe)
+            started = time.perf_counter()
+            for _ in range(rounds):
+                backend.logits(probe)
+        except Exception as e:
+            errors[name] = str(e)
+            continue
+
+        timings[name] = round((time.perf_counter() - started) * 1000 / rounds, 3)
+        if best is None or timings[name] < timings[best.name]:
+            best = backend
+
+    if best is None:
+        raise RuntimeError(f"No inference backend could be loaded: {errors}")
+    return best, timings
@@ -1,7 +1,10 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from utils.artifact_registry import ArtifactRegistry, default_registry
 
 class TimelinePredictor:
-    def __init__(self):
+    def __init__(self, artifacts: Optional[ArtifactRegistry] = None):
+        self.artifacts = artifacts or default_registry()
         self.category_timelines = {
             "Theft": {"min_days": 30, "max_days": 180, "complexity_factors": ["value", "evidence"]},
             "Assault": {"min_days": 60, "max_days": 365, "complexity_factors": ["injury", "witnesses"]},
@@ -20,12 +23,8 @@ class TimelinePredictor:
         return {
             "estimated_duration_days": predicted_days,
             "confidence": 0.7,
-            "factors": ["case complexity", "evidence availability", "legal procedures"],
-            "stages": [
-                {"stage": "FIR Registration", "days": "1-7 days"},
-                {"stage": "Initial Investigation", "days": "1-2 weeks"},
-                {"stage": "Evidence Collection", "days": "2-4 weeks"},
-                {"stage": "Chargesheet Filing", "days": f"3-8 weeks"},
-                {"stage": "Court Proceedings", "days": f"3-{predicted_days//30} months"}
-            ]
+            "factors": self.artifacts.timeline_factors,
+            "stages": self.artifacts.timeline_stages + (
+                {"stage": "Court Proceedings", "days": f"3-{predicted_days//30} months"},
+            )
         }
\ No newline at end of file
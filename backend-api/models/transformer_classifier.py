@@ -0,0 +1,207 @@
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.inference_backends import InferenceBackend, available_backends, select_fastest_backend
+
+class BatcherSaturated(Exception):
+    pass
+
+class MicroBatcher:
+    def __init__(self, handler: Callable[[List[Any]], List[Any]], max_batch_size: int = 16,
+                 max_wait_ms: float = 5.0, max_queue_size: int = 256, name: str = "micro-batcher"):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+        self.rejected = 0
+        self.largest_batch = 0
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        if self._closed:
+            raise BatcherSaturated("Batcher is closed")
+
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((item, future))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            raise BatcherSaturated("Batch queue is full")
+        return future
+
+    def _collect(self) -> List:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = [entry for entry in self._collect() if entry is not None]
+            if not batch:
+                if self._closed:
+                    return
+                continue
+
+            pending = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not pending:
+                continue
+
+            try:
+                outputs = self.handler([item for item, _ in pending])
+                for (_, future), output in zip(pending, outputs):
+                    future.set_result(output)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+
+            with self._lock:
+                self.batches += 1
+                self.items += len(pending)
+                self.largest_batch = max(self.largest_batch, len(pending))
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "items": self.items,
+                "rejected": self.rejected,
+                "largest_batch": self.largest_batch,
+                "mean_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0
+            }
+
+    def close(self):
+        self._closed = True
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+class TransformerClassifier:
+    warm_up_texts = [
+        "My mobile phone was stolen at the market",
+        "The accused assaulted the complainant and ran away",
+        "Someone hacked my online account and made a fraudulent transfer"
+    ]
+
+    def __init__(self, model_path: str, labels: Optional[List[str]] = None,
+                 max_length: int = 256, num_threads: Optional[int] = None, backend: str = "auto"):
+        self.model_path = model_path
+        self.labels = labels
+        self.max_length = max_length
+        self.num_threads = num_threads
+        self.backend = backend
+        self.backend_timings: Dict[str, float] = {}
+        self.load_error: Optional[str] = None
+        self.warmed_up = False
+        self._tokenizer = None
+        self._runner: Optional[InferenceBackend] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def backend_name(self) -> Optional[str]:
+        return self._runner.name if self._runner is not None else None
+
+    def load(self):
+        with self._lock:
+            if self._runner is not None:
+                return
+
+            try:
+                from transformers import AutoConfig, AutoTokenizer
+
+                if self.num_threads and "torch" in sys.modules:
+                    sys.modules["torch"].set_num_threads(self.num_threads)
+
+                tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+                if self.labels is None:
+                    config = AutoConfig.from_pretrained(self.model_path)
+                    self.labels = [config.id2label[index].lower() for index in range(config.num_labels)]
+
+                if self.backend == "auto":
+                    candidates = available_backends(self.model_path) or ["torch"]
+                else:
+                    candidates = [self.backend]
+
+                probe = self._encode(tokenizer, self.warm_up_texts)
+                runner, timings = select_fastest_backend(
+                    self.model_path, candidates, probe, num_threads=self.num_threads
+                )
+            except Exception as e:
+                self.load_error = str(e)
+                raise
+
+            self._tokenizer = tokenizer
+            self._runner = runner
+            self.backend_timings = timings
+            self.load_error = None
+
+    def load_in_background(self) -> threading.Thread:
+        def load_quietly():
+            try:
+                self.load()
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=load_quietly, name="eccm-transformer-loader", daemon=True)
+        thread.start()
+        return thread
+
+    def warm_up(self, batch_sizes: Tuple[int, ...] = (1, 4, 16), rounds: int = 2):
+        self.load()
+        for batch_size in batch_sizes:
+            texts = [self.warm_up_texts[index % len(self.warm_up_texts)] for index in range(batch_size)]
+            for _ in range(rounds):
+                self.classify_batch(texts)
+        self.warmed_up = True
+
+    def _encode(self, tokenizer, texts: List[str]) -> Dict[str, np.ndarray]:
+        encoded = tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np"
+        )
+        return {name: np.asarray(values, dtype=np.int64) for name, values in encoded.items()}
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        if not self.is_loaded:
+            self.load()
+
+        logits = self._runner.logits(self._encode(self._tokenizer, texts))
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exponentials = np.exp(logits)
+        probabilities = exponentials / exponentials.sum(axis=-1, keepdims=True)
+
+        return [dict(zip(self.labels, row.tolist())) for row in probabilities]
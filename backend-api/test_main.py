@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+TEXTS = [
+    "My mobile phone was stolen from my bag while I was travelling in the bus near the market.",
+    "He attacked my brother in the street and threatened to kill him if he went to the police.",
+    "A caller said he was from the bank and took paise from my account using a fake link."
+]
+
+@pytest.fixture(scope="module")
+def client():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("EQUICOURT_HISTORY", "0")
+        patch.setenv("EQUICOURT_RULES_WATCH_SECONDS", "0")
+        import main
+        yield TestClient(main.app)
+
+def buffered(client, text, include=None):
+    params = {"include": include} if include else {}
+    response = client.post("/analyze-complete", json={"text": text}, params=params)
+    assert response.status_code == 200
+    body = response.json()
+    body.pop("timings")
+    return body
+
+def streamed_ndjson(client, text, include=None):
+    params = {"include": include} if include else {}
+    response = client.post("/analyze-complete/stream", json={"text": text}, params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+def streamed_sse(client, text):
+    response = client.post("/analyze-complete/stream", json={"text": text}, params={"format": "sse"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+def assembled(events):
+    assert events[-1]["stage"] == "done"
+    response = {event["stage"]: event["result"] for event in events[:-1]}
+    response["rules_version"] = events[-1]["rules_version"]
+    return response
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_ndjson_stream_matches_the_buffered_response(client, text):
+    events = streamed_ndjson(client, text)
+    assert assembled(events) == buffered(client, text)
+    assert set(events[-1]["timings"]["stages_ms"]) >= {event["stage"] for event in events[:-1]}
+
+def test_stream_respects_include(client):
+    events = streamed_ndjson(client, TEXTS[0], include="classification,timeline_prediction")
+    assert [event["stage"] for event in events[:-1]] == ["classification", "timeline_prediction"]
+    assert assembled(events) == buffered(client, TEXTS[0], include="classification,timeline_prediction")
+
+def test_sse_stream_carries_the_same_events(client):
+    events = streamed_sse(client, TEXTS[1])
+    assert all(name == body["stage"] for name, body in events)
+    assert assembled([body for _, body in events]) == buffered(client, TEXTS[1])
+
+def test_stream_rejects_unknown_formats_and_outputs(client):
+    assert client.post("/analyze-complete/stream", json={"text": TEXTS[0]},
+                       params={"format": "xml"}).status_code == 400
+    assert client.post("/analyze-complete/stream", json={"text": TEXTS[0]},
+                       params={"include": "verdict"}).status_code == 400
@@ -0,0 +1,58 @@
+from utils import stage_executor
+from utils.analysis_pipeline import PIPELINE_COMPONENTS, build_components
+
+TEXT = "Someone hacked my online account and made a fraudulent transfer"
+
+class FakeClassifier:
+    model_path = "fake-model"
+    load_error = None
+
+    def __init__(self):
+        self.loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    def classify_batch(self, texts):
+        return [{"harassment": 0.9, "fraud": 0.1} for _ in texts]
+
+def test_keyword_fallbacks_are_not_cached_while_the_transformer_loads():
+    components = build_components()
+    classifier = FakeClassifier()
+    components["eccm_model"].enable_transformer(classifier, max_wait_ms=0)
+    pipeline, cache = components["pipeline"], components["result_cache"]
+
+    assert pipeline.classify(TEXT)["model"] == "keyword"
+    assert pipeline.classify(TEXT)["model"] == "keyword"
+    assert cache.hits == 0
+
+    classifier.loaded = True
+    result = pipeline.classify(TEXT)
+    assert result["model"] == "transformer" and result["category"] == "Harassment"
+    assert pipeline.classify(TEXT) == result
+    assert cache.hits == 1
+    components["eccm_model"].transformer_batcher.close()
+
+def test_keyword_results_are_cached_without_a_transformer():
+    components = build_components()
+    pipeline, cache = components["pipeline"], components["result_cache"]
+
+    first = pipeline.classify(TEXT)
+    assert first["model"] == "keyword"
+    assert pipeline.classify(TEXT) == first
+    assert cache.hits == 1
+
+def test_preload_and_worker_warm_up_only_build_pipeline_components(tmp_path, monkeypatch):
+    monkeypatch.setattr(stage_executor, "_worker_components", None)
+    history_path = tmp_path / "history.sqlite3"
+    components = build_components(history_path=str(history_path))
+    components.preload(PIPELINE_COMPONENTS)
+
+    stage_executor._init_worker(build_components, {"history_path": str(history_path)})
+    stage_executor._warm_up_worker(PIPELINE_COMPONENTS)
+
+    for loaded in [components.loaded(), stage_executor._worker_components.loaded()]:
+        assert set(PIPELINE_COMPONENTS) <= set(loaded)
+        assert "history_store" not in loaded and "legal_corpus" not in loaded
+    assert not history_path.exists()
@@ -0,0 +1,99 @@
+import json
+import pickle
+
+import pytest
+
+from models.corruption_detector import CorruptionDetector
+from utils.artifact_registry import (
+    DEFAULT_EVIDENCE_CHECKLIST, EVIDENCE_CHECKLISTS, REQUIRED_DOCUMENTS, ArtifactRegistry, FrozenDict,
+    dump_fragment, freeze
+)
+from utils.rule_store import default_rules
+
+CATEGORIES = ["Theft", "Assault", "Harassment", "Fraud", "Cybercrime"]
+
+@pytest.fixture(scope="module")
+def registry():
+    return ArtifactRegistry()
+
+def plain(value):
+    return json.loads(json.dumps(value))
+
+def test_entries_are_read_only(registry):
+    mapping = registry.legal_mapping("Theft")
+    with pytest.raises(TypeError):
+        mapping["ipc_sections"] = ()
+    with pytest.raises(TypeError):
+        mapping.update({})
+    assert isinstance(mapping["evidence_checklist"], tuple)
+
+def test_frozen_values_survive_pickle_and_json(registry):
+    mapping = registry.legal_mapping("Fraud")
+    restored = pickle.loads(pickle.dumps(mapping))
+    assert isinstance(restored, FrozenDict) and restored == mapping
+    assert json.loads(json.dumps(mapping)) == plain(mapping)
+
+@pytest.mark.parametrize("category", CATEGORIES + ["Unknown", None])
+def test_legal_mappings_match_the_source_tables(registry, category):
+    expected = {
+        "ipc_sections": default_rules().ipc_sections.get(category, []),
+        "evidence_checklist": EVIDENCE_CHECKLISTS.get(category, DEFAULT_EVIDENCE_CHECKLIST),
+        "required_documents": REQUIRED_DOCUMENTS
+    }
+    assert plain(registry.legal_mapping(category)) == expected
+    assert json.loads(registry.fragment("legal_mapping", category)) == expected
+
+def test_fragments_are_served_only_for_the_registered_instance(registry):
+    mapping = registry.legal_mapping("Assault")
+    assert registry.fragment_for(mapping) == dump_fragment(mapping)
+    assert registry.fragment_for(freeze(plain(mapping))) is None
+    assert registry.fragment_for(dict(mapping)) is None
+
+def scoring_assessment(category, severity_score):
+    risk_score = 0
+    if category in ["Fraud", "Cybercrime"]:
+        risk_score += 0.3
+    elif category in ["Assault"]:
+        risk_score += 0.2
+    if severity_score > 80:
+        risk_score += 0.3
+    elif severity_score > 50:
+        risk_score += 0.2
+
+    if risk_score >= 0.5:
+        risk_level = "High"
+        recommendations = [
+            "File complaint directly with higher authorities",
+            "Maintain duplicate copies of all documents",
+            "Use official email for all communications",
+            "Seek assistance from anti-corruption helpline if needed"
+        ]
+    elif risk_score >= 0.3:
+        risk_level = "Medium"
+        recommendations = [
+            "Follow up regularly on case status",
+            "Document all interactions with officials",
+            "Use transparent payment methods if any fees",
+            "Consult with legal aid services"
+        ]
+    else:
+        risk_level = "Low"
+        recommendations = [
+            "Follow standard procedures",
+            "Maintain proper documentation",
+            "Be aware of your rights as complainant"
+        ]
+    return {
+        "risk_score": round(risk_score, 2),
+        "risk_level": risk_level,
+        "recommendations": recommendations,
+        "factors_considered": ["case_category", "severity", "common_risk_patterns"]
+    }
+
+@pytest.mark.parametrize("severity_score", [0, 50, 51, 80, 81, 100])
+@pytest.mark.parametrize("category", CATEGORIES + ["Unknown"])
+def test_precomputed_corruption_assessments_match_scoring(registry, category, severity_score):
+    detector = CorruptionDetector(registry)
+    assessment = detector.assess_risk(category, severity_score)
+    assert plain(assessment) == scoring_assessment(category, severity_score)
+    assert registry.fragment_for(assessment) == dump_fragment(assessment)
@@ -0,0 +1,55 @@
+import re
+
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from models.dialect_normalizer import DialectNormalizer
+from utils.rule_store import default_rules
+
+CASE_VARIANTS = [
+    "İ lost MY fone and ur mob",
+    "ſhe ſtole it, they RAN AWAY",
+    "The CHOR beat me   near the   thana, pls help",
+    "ı was hit by Gadi wala",
+]
+
+def reference_normalize(rules, text):
+    text = re.sub(r'\s+', ' ', text)
+    for wrong, correct in rules.spelling_corrections.items():
+        text = re.sub(r'\b' + re.escape(wrong) + r'\b', correct, text, flags=re.IGNORECASE)
+    text = text.strip()
+    text = ' '.join(rules.dialect_mappings.get(word.lower(), word) for word in text.split())
+    for informal, formal in rules.formalizations.items():
+        text = re.sub(r'\b' + re.escape(informal) + r'\b', formal, text, flags=re.IGNORECASE)
+    return text
+
+@pytest.mark.parametrize("text", SENTENCES + CASE_VARIANTS)
+def test_compiled_stages_match_per_term_substitution(text):
+    normalizer = DialectNormalizer()
+    assert normalizer.normalize(text, "en")["normalized_text"] == reference_normalize(default_rules(), text)
+
+def chunked(text, size):
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+STREAM_TEXTS = SENTENCES + CASE_VARIANTS + [
+    "  they RAN   away with my fone \n\n pls  ",
+    "he ran\taway",
+    "   ",
+    "",
+]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 1000])
+@pytest.mark.parametrize("text", STREAM_TEXTS)
+def test_streamed_normalization_matches_buffered_at_every_chunk_size(text, size):
+    normalizer = DialectNormalizer()
+    streamed = "".join(normalizer.normalize_stream(chunked(text, size)))
+    assert streamed == normalizer.normalize(text, "en")["normalized_text"]
+
+def test_phrases_split_across_chunks_are_replaced_once():
+    normalizer = DialectNormalizer()
+    pieces = list(normalizer.normalize_stream(["they ran", " ", "away", " and hit ", "me"]))
+    assert "".join(pieces) == "the accused persons fled the scene and struck the complainant"
+    assert all(piece for piece in pieces)
+
+def test_whitespace_only_chunks_produce_nothing():
+    assert list(DialectNormalizer().normalize_stream(["   ", "\n", ""])) == []
@@ -0,0 +1,57 @@
+import re
+
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from models.eccm_model import ECCMModel
+
+CATEGORIES = ["Theft", "Assault", "Fraud", "Harassment", "Cybercrime"]
+
+def scanning_highlights(model, text, category):
+    highlights = []
+    category_keywords = model.categories.get(category.lower(), {}).get("keywords", [])
+    current_pos = 0
+    for word in re.findall(r'\b\w+\b', text.lower()):
+        start = text.lower().find(word, current_pos)
+        if start != -1:
+            end = start + len(word)
+            current_pos = end
+            if word in category_keywords:
+                weight = 0.8 if word in ["stolen", "assault", "fraud", "harassment"] else 0.6
+                highlights.append({"start": start, "end": end, "weight": weight,
+                                   "reason": f"Key '{category}' keyword"})
+    return highlights
+
+@pytest.fixture(scope="module")
+def model():
+    return ECCMModel()
+
+@pytest.mark.parametrize("category", CATEGORIES)
+@pytest.mark.parametrize("text", SENTENCES)
+def test_all_highlights_match_the_scanning_implementation(model, text, category):
+    highlights = model.explain_prediction(text, category, top_k=None)
+    assert sorted(highlights, key=lambda item: item["start"]) == scanning_highlights(model, text, category)
+
+def test_top_k_keeps_the_heaviest_highlights():
+    model = ECCMModel(highlight_top_k=2)
+    text = "My bag went missing, the phone was stolen and the theft was reported as robbery"
+    everything = list(model.iter_highlights(text, "Theft"))
+
+    top = model.explain_prediction(text, "Theft")
+    assert len(everything) > 2 and len(top) == 2
+    assert top == sorted(everything, key=lambda item: (-item["weight"], item["start"]))[:2]
+    assert top[0]["weight"] == 0.8 and text[top[0]["start"]:top[0]["end"]] == "stolen"
+
+def test_offsets_index_the_original_text_after_case_folding(model):
+    text = "İİ İstanbul: my phone was STOLEN, the bag went Missing"
+    highlights = model.explain_prediction(text, "Theft", top_k=None)
+    assert [text[item["start"]:item["end"]] for item in highlights] == ["STOLEN", "Missing"]
+
+@pytest.mark.parametrize("size", [1, 4, 9])
+def test_streamed_highlights_match_the_whole_text(model, size):
+    text = " ".join(SENTENCES[:4])
+    chunks = [text[start:start + size] for start in range(0, len(text), size)]
+    assert list(model.explain_prediction_stream(chunks, "Theft")) == list(model.iter_highlights(text, "Theft"))
+
+def test_unknown_category_has_no_highlights(model):
+    assert model.explain_prediction("my phone was stolen", "Unknown") == []
@@ -0,0 +1,112 @@
+import json
+import random
+
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from utils.factor_model import FactorModel
+from utils.keyword_matcher import KeywordMatcher
+from utils.lss_calculator import LSSCalculator
+
+CATEGORIES = ["Theft", "Assault", "Harassment", "Fraud", "Cybercrime", "Other"]
+
+def reference_score(calculator, matches, category):
+    factor_scores = {}
+    total_score = 0
+
+    for factor_name, factor_data in calculator.factors.items():
+        evidence = matches.found(factor_data["keywords"])
+        factor_score = min(1.0, len(evidence) * 0.3)
+
+        factor_scores[factor_name] = {
+            "score": factor_score,
+            "weight": factor_data["weight"],
+            "contribution": factor_score * factor_data["weight"],
+            "evidence": evidence
+        }
+
+        total_score += factor_scores[factor_name]["contribution"]
+
+    category_weight = calculator.category_weights.get(category, 1.0)
+    final_score = min(100, total_score * category_weight * 100)
+    return final_score, {
+        "score": round(final_score),
+        "level": calculator._get_severity_level(final_score),
+        "factors": factor_scores,
+        "category_weight": category_weight,
+        "risk_assessment": calculator._assess_risk(final_score, category)
+    }
+
+@pytest.fixture(scope="module")
+def calculator():
+    return LSSCalculator()
+
+@pytest.fixture(scope="module")
+def texts(calculator):
+    every_keyword = " ".join(calculator.keyword_vocabulary())
+    return SENTENCES + ["", every_keyword, "armed gang with a knife and a gun beat people in the crowd"]
+
+@pytest.fixture(scope="module")
+def combinations(calculator):
+    generator = random.Random(0)
+    groups = [data["keywords"] for data in calculator.factors.values()]
+    return [
+        " ".join(keyword for keywords in groups for keyword in generator.sample(keywords, generator.randint(0, len(keywords))))
+        for _ in range(2000)
+    ]
+
+def cases(texts):
+    return [(text, category) for text in texts for category in CATEGORIES]
+
+def test_single_scores_match_the_reference(calculator, texts):
+    for text, category in cases(texts):
+        matches = calculator.matcher.scan(text)
+        assert calculator.calculate_score(text, category) == reference_score(calculator, matches, category)[1]
+
+def test_batch_scores_match_the_reference(calculator, texts):
+    pairs = cases(texts)
+    batch_texts, categories = [text for text, _ in pairs], [category for _, category in pairs]
+    matches = [calculator.matcher.scan(text) for text in batch_texts]
+    expected = [reference_score(calculator, row, category) for row, category in zip(matches, categories)]
+
+    results = calculator.calculate_score_batch(batch_texts, categories)
+    assert json.dumps(results, sort_keys=True) == json.dumps([result for _, result in expected], sort_keys=True)
+    assert calculator.score_array(batch_texts, categories).tolist() == [score for score, _ in expected]
+
+def test_batch_sums_factors_in_the_reference_order(calculator, combinations):
+    categories = [CATEGORIES[index % len(CATEGORIES)] for index in range(len(combinations))]
+    matches = [calculator.matcher.scan(text) for text in combinations]
+    expected = [reference_score(calculator, row, category)[0] for row, category in zip(matches, categories)]
+    assert calculator.score_array(combinations, categories, matches=matches).tolist() == expected
+
+def test_factors_are_omitted_on_request(calculator, texts):
+    pairs = cases(texts)
+    batch_texts, categories = [text for text, _ in pairs], [category for _, category in pairs]
+    full = calculator.calculate_score_batch(batch_texts, categories)
+    lean = calculator.calculate_score_batch(batch_texts, categories, include_factors=False)
+
+    for with_factors, without_factors in zip(full, lean):
+        assert "factors" not in without_factors
+        assert {key: value for key, value in with_factors.items() if key != "factors"} == without_factors
+    for (text, category), with_factors in zip(pairs, full):
+        single = calculator.calculate_score(text, category, include_factors=False)
+        assert single == {key: value for key, value in with_factors.items() if key != "factors"}
+
+def test_evidence_saturates_and_unknown_categories_use_the_default_weight():
+    model = FactorModel(
+        {"weapon": {"weight": 0.5, "keywords": ["knife", "gun", "armed", "blade"]},
+         "place": {"weight": 0.25, "keywords": ["street"]}},
+        {"Assault": 2.0}
+    )
+    matches = KeywordMatcher(["knife", "gun", "armed", "blade", "street"]).scan("armed with a knife, a gun and a blade")
+
+    factor_scores, category_weight, score = model.score_one(matches, "Unknown")
+    assert factor_scores == [1.0, 0.0] and category_weight == 1.0 and score == 50.0
+    batch_scores, batch_weights, batch_totals = model.score([matches, matches], ["Unknown", "Assault"])
+    assert batch_scores.tolist() == [[1.0, 0.0], [1.0, 0.0]]
+    assert batch_weights.tolist() == [1.0, 2.0] and batch_totals.tolist() == [50.0, 100.0]
+    assert model.breakdown(factor_scores, matches)["weapon"]["evidence"] == ["knife", "gun", "armed", "blade"]
+
+def test_empty_batches_score_to_empty_arrays(calculator):
+    assert calculator.calculate_score_batch([], []) == []
+    assert calculator.score_array([], []).shape == (0,)
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pytest
+
+from utils import fast_json
+from utils.analysis_pipeline import build_components
+from utils.fast_json import FastJSONEncoder, dumps
+
+VALUE = {
+    "text": "चोरी – stolen",
+    "score": np.float32(0.5),
+    "count": np.int64(3),
+    "tags": ("a", "b"),
+    "labels": {"x"},
+    1: [None, True, 2.5],
+}
+EXPECTED = {"text": "चोरी – stolen", "score": 0.5, "count": 3, "tags": ["a", "b"], "labels": ["x"],
+            "1": [None, True, 2.5]}
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_dumps_handles_numpy_sets_tuples_and_non_string_keys(monkeypatch, backend):
+    if backend == "json":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    assert json.loads(dumps(VALUE)) == EXPECTED
+
+class Registry:
+    def __init__(self, *values):
+        self.fragments = {id(value): (value, b'"spliced-' + str(index).encode() + b'"')
+                          for index, value in enumerate(values)}
+
+    def fragment_for(self, value):
+        entry = self.fragments.get(id(value))
+        return entry[1] if entry is not None and entry[0] is value else None
+
+def test_registered_values_are_spliced_down_to_the_splice_depth():
+    shallow, deep = {"kind": "shallow"}, {"kind": "deep"}
+    encoder = FastJSONEncoder(fragment_for=Registry(shallow, deep).fragment_for, splice_depth=2)
+    content = {"result": {"shallow": shallow, "nested": {"deep": deep}}, "copy": dict(shallow)}
+
+    response = encoder.response(content)
+    assert json.loads(response.body) == {
+        "result": {"shallow": "spliced-0", "nested": {"deep": {"kind": "deep"}}},
+        "copy": {"kind": "shallow"}
+    }
+    assert encoder.fragments_spliced == 1
+
+def test_response_appends_timings_and_headers():
+    encoder = FastJSONEncoder()
+    response = encoder.response({"a": 1}, timings={"total_ms": 2.0}, status_code=201,
+                                headers={"X-Rules-Version": "v1+abc"})
+    body = json.loads(response.body)
+    assert response.status_code == 201 and body["a"] == 1
+    assert body["timings"]["total_ms"] == 2.0 and "serialization_ms" in body["timings"]
+    assert response.headers["X-Rules-Version"] == "v1+abc"
+    assert response.headers["Server-Timing"].startswith("serialize;dur=")
+    assert json.loads(encoder.response({}).body) == {}
+    assert encoder.stats()["responses"] == 2
+
+def test_cached_pipeline_results_keep_their_fragments():
+    components = build_components()
+    pipeline, artifacts = components["pipeline"], components["artifacts"]
+    encoder = FastJSONEncoder(fragment_for=artifacts.fragment_for)
+    text = "Someone beat me with a rod and took my wallet"
+
+    encoder.response(pipeline.analyze(text, "en"))
+    first = encoder.fragments_spliced
+    hits = components["result_cache"].hits
+    cached = encoder.response(pipeline.analyze(text, "en"))
+
+    assert components["result_cache"].hits > hits
+    assert first > 0 and encoder.fragments_spliced == 2 * first
+    assert json.loads(cached.body) == json.loads(json.dumps(pipeline.analyze(text, "en"), default=list))
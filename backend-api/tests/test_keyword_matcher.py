@@ -0,0 +1,48 @@
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from models.eccm_model import ECCMModel
+from utils.keyword_matcher import KeywordMatcher
+from utils.lss_calculator import LSSCalculator
+
+def substring_hits(keywords, text):
+    lowered = text.lower()
+    hits = set()
+    for keyword in keywords:
+        start = lowered.find(keyword)
+        while start != -1:
+            hits.add((start, start + len(keyword), keyword))
+            start = lowered.find(keyword, start + 1)
+    return hits
+
+def test_overlapping_keywords_are_all_reported():
+    matcher = KeywordMatcher(["he", "she", "his", "hers"])
+    result = matcher.scan("ushers")
+
+    assert set(result.hits) == {(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")}
+    assert result.found(["his", "hers", "he"]) == ["hers", "he"]
+
+def test_keywords_are_lowercased_and_deduplicated():
+    matcher = KeywordMatcher(["Knife", "knife", "", "GUN"])
+    assert matcher.keywords == ["knife", "gun"]
+    assert "knife" in matcher.scan("A KNIFE and a Gun")
+
+def test_keywords_added_after_compiling_are_matched():
+    matcher = KeywordMatcher(["theft"])
+    matcher.add("stolen")
+    assert matcher.scan("bike stolen").to_list() == [{"start": 5, "end": 11, "keyword": "stolen"}]
+
+def test_offsets_point_into_the_original_text_when_lowercasing_changes_length():
+    text = "İİ chor stole my phone"
+    result = KeywordMatcher(["chor", "stole"]).scan(text)
+    assert [text[start:end] for start, end, _ in result.hits] == ["chor", "stole"]
+
+@pytest.mark.parametrize("text", SENTENCES)
+def test_hits_match_substring_search_over_the_model_vocabulary(text):
+    vocabulary = ECCMModel().keyword_vocabulary() + LSSCalculator().keyword_vocabulary()
+    matcher = KeywordMatcher(vocabulary)
+    keywords = set(matcher.keywords)
+
+    result = matcher.scan(text)
+    assert set(result.hits) == substring_hits(keywords, text)
+    assert result.keywords == {keyword for keyword in keywords if keyword in text.lower()}
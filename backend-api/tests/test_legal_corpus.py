@@ -0,0 +1,104 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from utils.legal_corpus import (
+    IPC_BNS_PATH, LEGAL_ACTS_PATH, LegalCorpus, build_corpus_file, load_records, normalize_section_code,
+    open_legal_corpus, record_text, tokenize
+)
+
+@pytest.fixture(scope="module")
+def records():
+    return load_records()[1]
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    corpus = LegalCorpus(build_corpus_file(str(tmp_path_factory.mktemp("corpus") / "corpus.bin")))
+    yield corpus
+    corpus.close()
+
+def test_every_record_is_served_from_the_index(corpus, records):
+    assert corpus.record_count == len(records)
+    assert corpus.records(range(len(records))) == records
+    for record in records:
+        if record["kind"] == "section":
+            assert corpus.get_by_ipc(record["key"]) == record["document"]
+
+@pytest.mark.parametrize("code", ["IPC 379", "sec. 379", "Section 379", "u/s 379", " 379 "])
+def test_section_codes_are_normalized(corpus, code):
+    assert normalize_section_code(code) == "379"
+    assert corpus.get_by_ipc(code)["ipc_section"] == "379"
+
+def test_secondary_tables_match_a_scan_of_the_records(corpus, records):
+    sections = [record["document"] for record in records if record["kind"] == "section"]
+    bns_code = normalize_section_code(sections[0]["bns"]["code"])
+    assert corpus.get_by_bns(bns_code) == [
+        section for section in sections if normalize_section_code(section["bns"]["code"]) == bns_code
+    ]
+    for category in {section["category"] for section in sections}:
+        assert corpus.get_by_category(category.upper()) == [
+            section for section in sections if section["category"] == category
+        ]
+    acts = [record["document"] for record in records if record["kind"] == "act"]
+    assert corpus.acts() == acts
+    assert corpus.acts("criminal law") == [act for act in acts if act["category"].lower() == "criminal law"]
+
+@pytest.mark.parametrize("query, kind", [
+    ("murder", None),
+    ("punishment fine", None),
+    ("criminal procedure", "act"),
+    ("theft property", "section"),
+    ("nonexistentterm", None),
+    ("", None),
+])
+def test_search_matches_a_scan_for_records_containing_every_term(corpus, records, query, kind):
+    tokens = set(tokenize(query))
+    expected = [
+        record for record in records
+        if tokens and tokens <= set(tokenize(record_text(record))) and kind in (None, record["kind"])
+    ]
+    assert corpus.search(query, kind=kind, limit=len(records)) == expected
+    assert corpus.search(query, kind=kind, limit=2) == expected[:2]
+
+def test_keys_are_listed_by_prefix(corpus):
+    keys = corpus.keys("term", "pun")
+    assert keys and keys == sorted(keys) and all(key.startswith("pun") for key in keys)
+    assert corpus.keys("term", "zzzz") == []
+
+@pytest.fixture
+def datasets(tmp_path):
+    ipc_bns, acts = tmp_path / "ipc_bns.json", tmp_path / "legal_acts.json"
+    shutil.copy(IPC_BNS_PATH, ipc_bns)
+    shutil.copy(LEGAL_ACTS_PATH, acts)
+    return str(ipc_bns), str(acts)
+
+def test_open_reuses_a_matching_index_and_rebuilds_a_stale_one(datasets, tmp_path):
+    index_path = str(tmp_path / "index.bin")
+    first = open_legal_corpus(*datasets, index_path=index_path)
+    built = os.stat(index_path).st_mtime_ns
+    second = open_legal_corpus(*datasets, index_path=index_path)
+    assert os.stat(index_path).st_mtime_ns == built and second.fingerprint == first.fingerprint
+
+    with open(datasets[1], "r", encoding="utf-8") as f:
+        acts = json.load(f)
+    acts.append({"id": 999, "name": "Test Act", "category": "Testing"})
+    with open(datasets[1], "w", encoding="utf-8") as f:
+        json.dump(acts, f)
+
+    third = open_legal_corpus(*datasets, index_path=index_path)
+    assert third.fingerprint != first.fingerprint
+    assert third.acts("testing")[0]["name"] == "Test Act"
+    for corpus in (first, second, third):
+        corpus.close()
+
+def test_a_corrupt_index_is_rebuilt(datasets, tmp_path):
+    index_path = tmp_path / "index.bin"
+    index_path.write_bytes(b"not a corpus")
+    with pytest.raises(ValueError, match="not a legal corpus index"):
+        LegalCorpus(str(index_path))
+
+    corpus = open_legal_corpus(*datasets, index_path=str(index_path))
+    assert corpus.get_by_ipc("302")["ipc"]["title"] == "Murder"
+    corpus.close()
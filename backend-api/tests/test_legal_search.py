@@ -0,0 +1,100 @@
+import json
+import math
+import shutil
+from collections import Counter
+
+import pytest
+
+from utils.legal_corpus import IPC_BNS_PATH, LEGAL_ACTS_PATH, load_records, record_text, tokenize
+from utils.legal_search import MAX_QUERY_LENGTH, LegalSearchError, LegalSearchIndex
+
+@pytest.fixture
+def datasets(tmp_path):
+    ipc_bns, acts = tmp_path / "ipc_bns.json", tmp_path / "legal_acts.json"
+    shutil.copy(IPC_BNS_PATH, ipc_bns)
+    shutil.copy(LEGAL_ACTS_PATH, acts)
+    return str(ipc_bns), str(acts)
+
+@pytest.fixture(scope="module")
+def index():
+    return LegalSearchIndex(check_interval_seconds=3600)
+
+def bm25_ranking(query, kind=None, k1=1.2, b=0.75, title_boost=2):
+    documents = {}
+    for record in load_records()[1]:
+        terms = Counter(tokenize(record_text(record)))
+        for token in tokenize(record["title"]):
+            terms[token] += title_boost - 1
+        documents[f"{record['kind']}:{record['key']}"] = (record, terms)
+
+    average = sum(sum(terms.values()) for _, terms in documents.values()) / len(documents)
+    scores = {}
+    for token in dict.fromkeys(tokenize(query)):
+        frequency = sum(1 for _, terms in documents.values() if token in terms)
+        if not frequency:
+            continue
+        idf = math.log(1 + (len(documents) - frequency + 0.5) / (frequency + 0.5))
+        for doc_id, (record, terms) in documents.items():
+            if token in terms and kind in (None, record["kind"]):
+                norm = 1 - b + b * sum(terms.values()) / average
+                tf = terms[token]
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + k1 * norm)
+    return sorted(((round(score, 4), doc_id) for doc_id, score in scores.items()), key=lambda item: (-item[0], item[1]))
+
+def ranking(response):
+    return [(result["score"], f"{result['kind']}:{result['key']}") for result in response["results"]]
+
+@pytest.mark.parametrize("query, kind", [
+    ("murder", None),
+    ("punishment for theft of property", None),
+    ("criminal procedure code", "act"),
+    ("dowry death cruelty", "section"),
+])
+def test_exact_term_scores_match_bm25(index, query, kind):
+    expected = bm25_ranking(query, kind)
+    page_one = index.search(query, kind=kind, page_size=5, prefix=False, fuzzy=False)
+    page_two = index.search(query, kind=kind, page=2, page_size=5, prefix=False, fuzzy=False)
+
+    assert ranking(page_one) == pytest.approx(expected[:5])
+    assert ranking(page_two) == pytest.approx(expected[5:10])
+    if page_one["exhaustive"]:
+        assert page_one["matched"] == len(expected)
+
+def test_prefixes_and_typos_expand_to_indexed_terms(index):
+    assert index.expand("murd")["murder"] == pytest.approx(0.7)
+    assert index.expand("murdr") == {"murder": pytest.approx(0.5)}
+    response = index.search("murdr")
+    assert response["expansions"] == {"murdr": ["murder"]}
+    assert response["results"][0]["score"] > 0
+
+def test_long_tokens_skip_fuzzy_matching_and_long_queries_are_refused(index):
+    assert index.expand("murder" * 4) == {}
+    assert index._term_deletes("x" * 40) == set()
+    with pytest.raises(LegalSearchError):
+        index.search("murder " * (MAX_QUERY_LENGTH // 7 + 1))
+
+def index_state(index):
+    return (index._documents, index._lengths, index._postings, index._terms, index._deletes, index._total_length)
+
+def test_incremental_refresh_matches_a_fresh_build(datasets):
+    index = LegalSearchIndex(*datasets, check_interval_seconds=3600)
+    added = index.documents_added
+    with open(datasets[0], "r", encoding="utf-8") as f:
+        mappings = json.load(f)
+    with open(datasets[1], "r", encoding="utf-8") as f:
+        acts = json.load(f)
+
+    mappings["302"]["ipc"]["title"] = "Culpable homicide amounting to murder"
+    removed = next(key for key in mappings if key not in ("302",) and isinstance(mappings[key], dict)
+                   and "ipc" in mappings[key])
+    del mappings[removed]
+    acts.append({"id": 999, "name": "Zebra Crossing Act", "category": "Traffic", "summary": "Pedestrian rules"})
+    with open(datasets[0], "w", encoding="utf-8") as f:
+        json.dump(mappings, f)
+    with open(datasets[1], "w", encoding="utf-8") as f:
+        json.dump(acts, f)
+
+    assert index.refresh() == {"added_or_updated": 2, "removed": 1}
+    assert (index.documents_added - added, index.documents_updated, index.documents_removed) == (1, 1, 1)
+    assert index_state(index) == index_state(LegalSearchIndex(*datasets))
+    assert index.search("zebra")["results"][0]["title"] == "Zebra Crossing Act"
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from utils.stage_executor import ExecutorSaturated, StageExecutor, StageTimeout
+
+class Component:
+    def __init__(self, name="live"):
+        self.name = name
+        self.release = threading.Event()
+
+    def echo(self, value, suffix=""):
+        return f"{self.name}:{value}{suffix}"
+
+    def block(self):
+        self.release.wait(5)
+        return "released"
+
+def test_calls_run_on_the_pool_and_release_their_slot():
+    executor = StageExecutor({"component": Component()}, max_workers=2)
+    assert asyncio.run(executor.call("component", "echo", 1, suffix="!")) == "live:1!"
+    assert asyncio.run(executor.call("component", "echo", 2, pinned=Component("pinned"))) == "pinned:2"
+
+    stats = executor.stats()
+    assert stats["in_flight"] == 0 and stats["completed"] == 2
+    executor.shutdown()
+
+def test_calls_beyond_max_pending_are_rejected():
+    component = Component()
+    executor = StageExecutor({"component": component}, max_workers=2, max_pending=1, retry_after_seconds=3)
+
+    async def overload():
+        blocked = asyncio.ensure_future(executor.call("component", "block"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ExecutorSaturated) as rejected:
+            await executor.call("component", "echo", 1)
+        component.release.set()
+        return rejected.value, await blocked
+
+    rejected, result = asyncio.run(overload())
+    assert rejected.retry_after_seconds == 3 and result == "released"
+    assert executor.stats()["rejected"] == 1
+    executor.shutdown()
+
+def test_slow_calls_time_out_and_free_the_slot_when_they_finish():
+    component = Component()
+    executor = StageExecutor({"component": component}, max_workers=1, timeout_seconds=0.05)
+
+    with pytest.raises(StageTimeout, match="component.block"):
+        asyncio.run(executor.call("component", "block"))
+    assert executor.stats()["timeouts"] == 1
+    component.release.set()
+    assert asyncio.run(executor.call("component", "echo", 1)) == "live:1"
+    assert executor.stats()["in_flight"] == 0
+    executor.shutdown()
+
+@pytest.mark.parametrize("options, message", [
+    ({"mode": "fiber"}, "Unsupported executor mode"),
+    ({"mode": "process"}, "picklable component factory"),
+])
+def test_invalid_configurations_are_refused(options, message):
+    with pytest.raises(ValueError, match=message):
+        StageExecutor({}, **options)
+
+@pytest.fixture(scope="module")
+def app_module():
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("EQUICOURT_HISTORY", "0")
+        patch.setenv("EQUICOURT_RULES_WATCH_SECONDS", "0")
+        import main
+        yield main
+
+@pytest.mark.parametrize("options, status", [
+    ({"max_pending": 0}, 503),
+    ({"timeout_seconds": 0}, 504),
+])
+def test_routes_map_saturation_to_503_and_timeouts_to_504(app_module, monkeypatch, options, status):
+    executor = StageExecutor(app_module.components, **options)
+    monkeypatch.setattr(app_module, "executor", executor)
+
+    response = TestClient(app_module.app).post(
+        "/analyze-complete", json={"text": f"My phone was stolen ({status})"}
+    )
+    assert response.status_code == status
+    if status == 503:
+        assert response.headers["Retry-After"] == str(executor.retry_after_seconds)
+    executor.shutdown()
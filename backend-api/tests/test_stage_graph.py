@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from utils.analysis_pipeline import build_components
+from utils.fast_json import dumps
+from utils.stage_graph import Stage, StageGraph
+
+def constant(value):
+    async def run(results):
+        return value
+    return run
+
+def diamond():
+    return StageGraph([
+        Stage("report", constant("report"), ["left", "right"]),
+        Stage("left", constant("left"), ["source"]),
+        Stage("right", constant("right"), ["source"]),
+        Stage("source", constant("source")),
+        Stage("unused", constant("unused"))
+    ])
+
+def test_plan_orders_dependencies_first_and_prunes_unrequested_stages():
+    graph = diamond()
+    assert graph.plan() == ["source", "left", "right", "report", "unused"]
+    assert graph.plan(["right"]) == ["source", "right"]
+    with pytest.raises(KeyError, match="missing"):
+        graph.plan(["missing"])
+
+@pytest.mark.parametrize("stages, message", [
+    ([Stage("a", constant(1), ["ghost"])], "unknown stages: ghost"),
+    ([Stage("a", constant(1), ["b"]), Stage("b", constant(2), ["a"])], "cycle"),
+])
+def test_invalid_graphs_are_refused(stages, message):
+    with pytest.raises(ValueError, match=message):
+        StageGraph(stages)
+
+def test_independent_stages_run_concurrently():
+    left_started, right_started = asyncio.Event(), asyncio.Event()
+
+    async def left(results):
+        left_started.set()
+        await asyncio.wait_for(right_started.wait(), 1)
+        return results["source"] + "-left"
+
+    async def right(results):
+        right_started.set()
+        await asyncio.wait_for(left_started.wait(), 1)
+        return results["source"] + "-right"
+
+    async def report(results):
+        return results["left"] + "+" + results["right"]
+
+    graph = StageGraph([
+        Stage("source", constant("s")),
+        Stage("left", left, ["source"]),
+        Stage("right", right, ["source"]),
+        Stage("report", report, ["left", "right"])
+    ])
+    results, timings = asyncio.run(graph.run())
+    assert results == {"source": "s", "left": "s-left", "right": "s-right", "report": "s-left+s-right"}
+    assert set(timings) == set(results)
+
+def test_run_iter_yields_stages_as_they_finish():
+    async def slow(results):
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    graph = StageGraph([Stage("slow", slow), Stage("fast", constant("fast"))])
+
+    async def collect():
+        return [name async for name, _, _ in graph.run_iter()]
+
+    assert asyncio.run(collect()) == ["fast", "slow"]
+
+def test_a_failing_stage_cancels_its_siblings():
+    cancelled = []
+
+    async def failing(results):
+        raise RuntimeError("stage failed")
+
+    async def sibling(results):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    graph = StageGraph([Stage("failing", failing), Stage("sibling", sibling)])
+
+    async def run():
+        with pytest.raises(RuntimeError, match="stage failed"):
+            await graph.run()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert cancelled == [True]
+
+@pytest.mark.parametrize("text", SENTENCES[:6])
+def test_pipeline_graph_matches_the_sequential_analysis(text):
+    pipeline = build_components()["pipeline"]
+
+    async def call(component, method, *args, pinned=None, **kwargs):
+        return getattr(pinned, method)(*args, **kwargs)
+
+    results, _ = asyncio.run(pipeline.stage_graph(text, "auto", call).run())
+    assert json.loads(dumps(results)) == json.loads(dumps(pipeline.analyze(text, "auto")))
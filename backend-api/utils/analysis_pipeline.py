@@ -0,0 +1,326 @@
+import functools
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple
+
+from utils.lazy_components import LazyComponents
+from utils.result_cache import ResultCache
+from utils.stage_graph import Stage, StageGraph
+
+ANALYSIS_OUTPUTS = [
+    "normalization",
+    "classification",
+    "severity",
+    "legal",
+    "explanation",
+    "timeline_prediction",
+    "corruption_risk"
+]
+
+PIPELINE_COMPONENTS = ["normalizer", "eccm_model", "lss_calculator", "ipc_mapper", "pipeline"]
+
+class AnalysisPipeline:
+    def __init__(self, normalizer, keyword_matcher, eccm_model, lss_calculator, ipc_mapper,
+                 timeline_predictor, corruption_detector, cache: Optional[ResultCache] = None,
+                 rules_version: Optional[str] = None):
+        self.normalizer = normalizer
+        self.keyword_matcher = keyword_matcher
+        self.eccm_model = eccm_model
+        self.lss_calculator = lss_calculator
+        self.ipc_mapper = ipc_mapper
+        self.timeline_predictor = timeline_predictor
+        self.corruption_detector = corruption_detector
+        self.cache = cache
+        self.rules_version = rules_version
+        self.scan = functools.lru_cache(maxsize=256)(keyword_matcher.scan)
+
+    def normalize(self, text: str, language: str = "auto") -> Dict[str, Any]:
+        return self._cached(
+            "normalize", self.normalizer.rules_version, (text, language),
+            lambda: self.normalizer.normalize(text, language)
+        )
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        return self._cached(
+            "classify", self.eccm_model.rules_version, (text,),
+            lambda: self.eccm_model.predict(text, self.scan(text)),
+            cacheable=lambda result: self.eccm_model.transformer is None or result["model"] == "transformer"
+        )
+
+    def score(self, text: str, category: str, include_factors: bool = True) -> Dict[str, Any]:
+        parts = (text, category) if include_factors else (text, category, "without_factors")
+        return self._cached(
+            "severity", self.lss_calculator.rules_version, parts,
+            lambda: self.lss_calculator.calculate_score(text, category, self.scan(text), include_factors)
+        )
+
+    def explain(self, text: str, category: str) -> List[Dict[str, Any]]:
+        return self._cached(
+            "explain", self.eccm_model.rules_version, (text, category, self.eccm_model.highlight_top_k),
+            lambda: self.eccm_model.explain_prediction(text, category)
+        )
+
+    def analyze(self, text: str, language: str = "auto") -> Dict[str, Any]:
+        normalized = self.normalize(text, language)
+        normalized_text = normalized["normalized_text"]
+        classification = self.classify(normalized_text)
+        severity = self.score(normalized_text, classification["category"])
+        return self._assemble(normalized, classification, severity)
+
+    def analyze_batch(self, items: List[Tuple[str, str]], include_factors: bool = True) -> List[Dict[str, Any]]:
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+        normalized_items = []
+        for index, (text, language) in enumerate(items):
+            try:
+                normalized_items.append((index, self.normalize(text, language)))
+            except Exception as e:
+                outcomes[index] = self._error(index, "Normalization error", e)
+
+        try:
+            texts = [normalized["normalized_text"] for _, normalized in normalized_items]
+            matches = [self.scan(text) for text in texts]
+            classifications = self.eccm_model.predict_batch(texts, matches)
+            severities = self.lss_calculator.calculate_score_batch(
+                texts,
+                [classification["category"] for classification in classifications],
+                matches,
+                include_factors
+            )
+            scored = list(zip(normalized_items, classifications, severities))
+        except Exception:
+            scored = self._score_individually(normalized_items, outcomes, include_factors)
+
+        for (index, normalized), classification, severity in scored:
+            try:
+                outcomes[index] = {
+                    "index": index,
+                    "status": "ok",
+                    "result": self._assemble(normalized, classification, severity)
+                }
+            except Exception as e:
+                outcomes[index] = self._error(index, "Complete analysis error", e)
+
+        return outcomes
+
+    def legal_mapping(self, category: str) -> Dict[str, Any]:
+        return self.ipc_mapper.artifacts.legal_mapping(category)
+
+    def predict_timeline(self, category: str, severity_score: int) -> Dict[str, Any]:
+        return self.timeline_predictor.predict_timeline(category, severity_score)
+
+    def assess_corruption_risk(self, category: str, severity_score: int) -> Dict[str, Any]:
+        return self.corruption_detector.assess_risk(category, severity_score)
+
+    def stage_graph(self, text: str, language: str,
+                    call: Callable[..., Awaitable[Any]]) -> StageGraph:
+        async def normalization(results):
+            return await call("pipeline", "normalize", text, language, pinned=self)
+
+        async def classification(results):
+            return await call("pipeline", "classify", results["normalization"]["normalized_text"], pinned=self)
+
+        async def severity(results):
+            return await call(
+                "pipeline", "score",
+                results["normalization"]["normalized_text"],
+                results["classification"]["category"],
+                pinned=self
+            )
+
+        async def legal(results):
+            return self.legal_mapping(results["classification"]["category"])
+
+        async def explanation(results):
+            highlights = await call(
+                "pipeline", "explain",
+                results["normalization"]["normalized_text"],
+                results["classification"]["category"],
+                pinned=self
+            )
+            return {"highlights": highlights}
+
+        async def timeline_prediction(results):
+            return self.predict_timeline(results["classification"]["category"], results["severity"]["score"])
+
+        async def corruption_risk(results):
+            return self.assess_corruption_risk(results["classification"]["category"], results["severity"]["score"])
+
+        return StageGraph([
+            Stage("normalization", normalization),
+            Stage("classification", classification, ["normalization"]),
+            Stage("severity", severity, ["normalization", "classification"]),
+            Stage("legal", legal, ["classification"]),
+            Stage("explanation", explanation, ["normalization", "classification"]),
+            Stage("timeline_prediction", timeline_prediction, ["classification", "severity"]),
+            Stage("corruption_risk", corruption_risk, ["classification", "severity"])
+        ])
+
+    def _assemble(self, normalized: Dict[str, Any], classification: Dict[str, Any],
+                  severity: Dict[str, Any]) -> Dict[str, Any]:
+        highlights = self.explain(normalized["normalized_text"], classification["category"])
+        timeline = self.predict_timeline(classification["category"], severity["score"])
+        corruption_risk = self.assess_corruption_risk(classification["category"], severity["score"])
+
+        return {
+            "normalization": normalized,
+            "classification": classification,
+            "severity": severity,
+            "legal": self.legal_mapping(classification["category"]),
+            "explanation": {"highlights": highlights},
+            "timeline_prediction": timeline,
+            "corruption_risk": corruption_risk
+        }
+
+    def _cached(self, namespace: str, version: str, parts: Tuple, compute: Callable[[], Any],
+                cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        if self.cache is None:
+            return compute()
+        key = self.cache.make_key(namespace, version, *parts)
+        return self.cache.get_or_compute(key, compute, cacheable)
+
+    def _score_individually(self, normalized_items, outcomes, include_factors: bool = True) -> List[Tuple]:
+        scored = []
+        for index, normalized in normalized_items:
+            try:
+                classification = self.classify(normalized["normalized_text"])
+                severity = self.score(normalized["normalized_text"], classification["category"], include_factors)
+                scored.append(((index, normalized), classification, severity))
+            except Exception as e:
+                outcomes[index] = self._error(index, "Classification error", e)
+        return scored
+
+    def _error(self, index: int, prefix: str, error: Exception) -> Dict[str, Any]:
+        return {"index": index, "status": "error", "error": f"{prefix}: {str(error)}"}
+
+def build_components(cache_url: Optional[str] = None, cache_max_entries: int = 4096,
+                     cache_ttl_seconds: Optional[float] = 600.0,
+                     eccm_model_path: Optional[str] = None,
+                     eccm_max_batch_size: int = 16, eccm_max_wait_ms: float = 5.0,
+                     eccm_max_queue_size: int = 256, eccm_timeout_seconds: float = 2.0,
+                     legal_index_path: Optional[str] = None, rules_path: Optional[str] = None,
+                     rules_watch_interval: float = 0.0, history_path: Optional[str] = None,
+                     history_max_queue_size: int = 10000) -> LazyComponents:
+    def rule_watcher(components):
+        from utils.rule_store import RULE_DEPENDENTS, RULES_PATH, RuleWatcher
+        watcher = RuleWatcher(
+            rules_path or RULES_PATH,
+            on_change=lambda rules: lazy.rebuild(RULE_DEPENDENTS, {"rules": rules}),
+            interval_seconds=rules_watch_interval
+        )
+        watcher.load()
+        watcher.start()
+        return watcher
+
+    def rules(components):
+        return components["rule_watcher"].load()
+
+    def artifacts(components):
+        from utils.artifact_registry import ArtifactRegistry
+        return ArtifactRegistry(components["rules"].ipc_sections)
+
+    def normalizer(components):
+        from models.dialect_normalizer import DialectNormalizer
+        return DialectNormalizer(components["rules"])
+
+    def eccm_model(components):
+        from models.eccm_model import ECCMModel
+        model = ECCMModel(rules=components["rules"])
+        previous = components.previous("eccm_model")
+        if previous is not None:
+            model.adopt_transformer(previous)
+        elif eccm_model_path:
+            from models.transformer_classifier import TransformerClassifier
+            classifier = TransformerClassifier(eccm_model_path)
+            model.enable_transformer(
+                classifier,
+                max_batch_size=eccm_max_batch_size,
+                max_wait_ms=eccm_max_wait_ms,
+                max_queue_size=eccm_max_queue_size,
+                timeout_seconds=eccm_timeout_seconds
+            )
+            classifier.load_in_background()
+        return model
+
+    def lss_calculator(components):
+        from utils.lss_calculator import LSSCalculator
+        return LSSCalculator(components["artifacts"], components["rules"])
+
+    def ipc_mapper(components):
+        from utils.ipc_mapper import IPCMapper
+        return IPCMapper(components["artifacts"])
+
+    def doc_generator(components):
+        from utils.document_generator import DocumentGenerator
+        return DocumentGenerator(components["artifacts"])
+
+    def timeline_predictor(components):
+        from models.timeline_predictor import TimelinePredictor
+        return TimelinePredictor(components["artifacts"])
+
+    def corruption_detector(components):
+        from models.corruption_detector import CorruptionDetector
+        return CorruptionDetector(components["artifacts"])
+
+    def preprocessor(components):
+        from utils.preprocessing import TextPreprocessor
+        return TextPreprocessor()
+
+    def legal_corpus(components):
+        from utils.legal_corpus import open_legal_corpus
+        return open_legal_corpus(index_path=legal_index_path)
+
+    def legal_search(components):
+        from utils.legal_search import LegalSearchIndex
+        return LegalSearchIndex()
+
+    def keyword_matcher(components):
+        from utils.keyword_matcher import KeywordMatcher
+        eccm, lss = components["eccm_model"], components["lss_calculator"]
+        matcher = KeywordMatcher(eccm.keyword_vocabulary() + lss.keyword_vocabulary())
+        eccm.use_matcher(matcher)
+        lss.use_matcher(matcher)
+        return matcher
+
+    def result_cache(components):
+        from utils.cache_backends import create_cache_backend
+        return ResultCache(
+            backend=create_cache_backend(cache_url, max_entries=cache_max_entries),
+            ttl_seconds=cache_ttl_seconds
+        )
+
+    def history_store(components):
+        from utils.history_store import HISTORY_PATH, HistoryStore
+        return HistoryStore(history_path or HISTORY_PATH, max_queue_size=history_max_queue_size)
+
+    def pipeline(components):
+        return AnalysisPipeline(
+            components["normalizer"],
+            components["keyword_matcher"],
+            components["eccm_model"],
+            components["lss_calculator"],
+            components["ipc_mapper"],
+            components["timeline_predictor"],
+            components["corruption_detector"],
+            cache=components["result_cache"],
+            rules_version=components["rules"].version
+        )
+
+    lazy = LazyComponents({
+        "rule_watcher": rule_watcher,
+        "rules": rules,
+        "artifacts": artifacts,
+        "normalizer": normalizer,
+        "eccm_model": eccm_model,
+        "lss_calculator": lss_calculator,
+        "ipc_mapper": ipc_mapper,
+        "doc_generator": doc_generator,
+        "timeline_predictor": timeline_predictor,
+        "corruption_detector": corruption_detector,
+        "preprocessor": preprocessor,
+        "legal_corpus": legal_corpus,
+        "legal_search": legal_search,
+        "keyword_matcher": keyword_matcher,
+        "result_cache": result_cache,
+        "history_store": history_store,
+        "pipeline": pipeline
+    }, refresh=lambda components: components["rule_watcher"].check())
+    return lazy
@@ -0,0 +1,292 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+UNKNOWN = "unknown"
+HISTOGRAM_BUCKETS = 10
+MAX_TREND_DAYS = 366
+LOG_RETENTION_BATCHES = 10000
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_aggregates (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        severity_level TEXT NOT NULL,
+        corruption_risk_level TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        severity_score_sum REAL NOT NULL,
+        severity_score_count INTEGER NOT NULL,
+        timeline_days_sum REAL NOT NULL,
+        timeline_days_count INTEGER NOT NULL,
+        corruption_risk_sum REAL NOT NULL,
+        corruption_risk_count INTEGER NOT NULL,
+        PRIMARY KEY (day, category, severity_level, corruption_risk_level)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS severity_histogram (
+        category TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (category, bucket)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS aggregate_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        cells TEXT NOT NULL,
+        buckets TEXT NOT NULL
+    )
+    """
+]
+
+UPSERT_DAILY = """
+    INSERT INTO daily_aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (day, category, severity_level, corruption_risk_level) DO UPDATE SET
+        count = count + excluded.count,
+        severity_score_sum = severity_score_sum + excluded.severity_score_sum,
+        severity_score_count = severity_score_count + excluded.severity_score_count,
+        timeline_days_sum = timeline_days_sum + excluded.timeline_days_sum,
+        timeline_days_count = timeline_days_count + excluded.timeline_days_count,
+        corruption_risk_sum = corruption_risk_sum + excluded.corruption_risk_sum,
+        corruption_risk_count = corruption_risk_count + excluded.corruption_risk_count
+"""
+
+UPSERT_HISTOGRAM = """
+    INSERT INTO severity_histogram VALUES (?, ?, ?)
+    ON CONFLICT (category, bucket) DO UPDATE SET count = count + excluded.count
+"""
+
+BACKFILL_DAILY = """
+    SELECT day, COALESCE(category, ?), COALESCE(severity_level, ?), COALESCE(corruption_risk_level, ?),
+           COUNT(*), COALESCE(SUM(severity_score), 0), COUNT(severity_score),
+           COALESCE(SUM(timeline_days), 0), COUNT(timeline_days),
+           COALESCE(SUM(corruption_risk_score), 0), COUNT(corruption_risk_score)
+    FROM analyses GROUP BY 1, 2, 3, 4
+"""
+
+BACKFILL_HISTOGRAM = """
+    SELECT COALESCE(category, ?), MIN(severity_score / 10, ?), COUNT(*)
+    FROM analyses WHERE severity_score IS NOT NULL GROUP BY 1, 2
+"""
+
+def _bucket_label(bucket: int) -> str:
+    return f"{bucket * 10}-{bucket * 10 + 9}" if bucket < HISTOGRAM_BUCKETS - 1 else f"{bucket * 10}-100"
+
+def _mean(total: float, count: int) -> Optional[float]:
+    return round(total / count, 2) if count else None
+
+class Rollup:
+    __slots__ = ("count", "severity_sum", "severity_count", "timeline_sum", "timeline_count",
+                 "corruption_sum", "corruption_count", "categories", "severity_levels", "corruption_levels")
+
+    def __init__(self):
+        self.count = 0
+        self.severity_sum = 0.0
+        self.severity_count = 0
+        self.timeline_sum = 0.0
+        self.timeline_count = 0
+        self.corruption_sum = 0.0
+        self.corruption_count = 0
+        self.categories: Dict[str, int] = {}
+        self.severity_levels: Dict[str, int] = {}
+        self.corruption_levels: Dict[str, int] = {}
+
+    def add(self, key: Tuple, cell: List):
+        _, category, severity_level, corruption_level = key
+        count = cell[0]
+        self.count += count
+        self.severity_sum += cell[1]
+        self.severity_count += cell[2]
+        self.timeline_sum += cell[3]
+        self.timeline_count += cell[4]
+        self.corruption_sum += cell[5]
+        self.corruption_count += cell[6]
+        self.categories[category] = self.categories.get(category, 0) + count
+        self.severity_levels[severity_level] = self.severity_levels.get(severity_level, 0) + count
+        self.corruption_levels[corruption_level] = self.corruption_levels.get(corruption_level, 0) + count
+
+    def means(self) -> Dict[str, Optional[float]]:
+        return {
+            "severity_score": _mean(self.severity_sum, self.severity_count),
+            "timeline_days": _mean(self.timeline_sum, self.timeline_count),
+            "corruption_risk_score": _mean(self.corruption_sum, self.corruption_count)
+        }
+
+class AnalyticsAggregator:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = Rollup()
+        self.by_category: Dict[str, Rollup] = {}
+        self.by_day: Dict[str, Rollup] = {}
+        self.histogram: Dict[str, List[int]] = {}
+        self.updated_at: Optional[float] = None
+        self.log_id: Optional[int] = None
+        self.full_reloads = 0
+        self._snapshots: Dict[Tuple[int, date], Dict[str, Any]] = {}
+
+    @staticmethod
+    def create_schema(connection: sqlite3.Connection):
+        for statement in SCHEMA:
+            connection.execute(statement)
+
+    @staticmethod
+    def deltas(rows: Iterable[Tuple]) -> Tuple[Dict[Tuple, List], Dict[Tuple[str, int], int]]:
+        cells: Dict[Tuple, List] = {}
+        buckets: Dict[Tuple[str, int], int] = {}
+        for row in rows:
+            day, category, severity_score, severity_level = row[1], row[5] or UNKNOWN, row[7], row[8] or UNKNOWN
+            timeline_days, corruption_score, corruption_level = row[9], row[10], row[11] or UNKNOWN
+            key = (day, category, severity_level, corruption_level)
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = [0, 0.0, 0, 0.0, 0, 0.0, 0]
+            cell[0] += 1
+            if severity_score is not None:
+                cell[1] += severity_score
+                cell[2] += 1
+                bucket = (category, min(int(severity_score) // 10, HISTOGRAM_BUCKETS - 1))
+                buckets[bucket] = buckets.get(bucket, 0) + 1
+            if timeline_days is not None:
+                cell[3] += timeline_days
+                cell[4] += 1
+            if corruption_score is not None:
+                cell[5] += corruption_score
+                cell[6] += 1
+        return cells, buckets
+
+    @staticmethod
+    def persist(connection: sqlite3.Connection, cells: Dict[Tuple, List], buckets: Dict[Tuple[str, int], int]):
+        connection.executemany(UPSERT_DAILY, [key + tuple(cell) for key, cell in cells.items()])
+        connection.executemany(UPSERT_HISTOGRAM, [key + (count,) for key, count in buckets.items()])
+        log_id = connection.execute(
+            "INSERT INTO aggregate_log (cells, buckets) VALUES (?, ?)",
+            (json.dumps([list(key) + cell for key, cell in cells.items()]),
+             json.dumps([list(key) + [count] for key, count in buckets.items()]))
+        ).lastrowid
+        connection.execute("DELETE FROM aggregate_log WHERE id <= ?", (log_id - LOG_RETENTION_BATCHES,))
+
+    @staticmethod
+    def backfill(connection: sqlite3.Connection):
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            if connection.execute("SELECT 1 FROM daily_aggregates LIMIT 1").fetchone() is None:
+                connection.execute(
+                    f"INSERT INTO daily_aggregates {BACKFILL_DAILY}", (UNKNOWN, UNKNOWN, UNKNOWN)
+                )
+                connection.execute("DELETE FROM severity_histogram")
+                connection.execute(
+                    f"INSERT INTO severity_histogram {BACKFILL_HISTOGRAM}", (UNKNOWN, HISTOGRAM_BUCKETS - 1)
+                )
+
+    def refresh(self, connection: sqlite3.Connection):
+        connection.execute("BEGIN")
+        try:
+            if self.log_id is not None:
+                rows = connection.execute(
+                    "SELECT id, cells, buckets FROM aggregate_log WHERE id > ? ORDER BY id", (self.log_id,)
+                ).fetchall()
+                if not rows or rows[0][0] == self.log_id + 1:
+                    for log_id, cells, buckets in rows:
+                        self.apply({tuple(row[:4]): row[4:] for row in json.loads(cells)},
+                                   {(row[0], row[1]): row[2] for row in json.loads(buckets)})
+                        self.log_id = log_id
+                    return
+
+            log_id = connection.execute("SELECT COALESCE(MAX(id), 0) FROM aggregate_log").fetchone()[0]
+            self.reload(connection)
+            self.log_id = log_id
+        finally:
+            connection.commit()
+
+    def reload(self, connection: sqlite3.Connection):
+        cells = {tuple(row[:4]): list(row[4:]) for row in connection.execute("SELECT * FROM daily_aggregates")}
+        buckets = {(row[0], row[1]): row[2] for row in connection.execute("SELECT * FROM severity_histogram")}
+        with self._lock:
+            self.total = Rollup()
+            self.by_category = {}
+            self.by_day = {}
+            self.histogram = {}
+            self.full_reloads += 1
+        self.apply(cells, buckets)
+
+    def apply(self, cells: Dict[Tuple, List], buckets: Dict[Tuple[str, int], int]):
+        with self._lock:
+            for key, cell in cells.items():
+                self.total.add(key, cell)
+                day, category = key[0], key[1]
+                rollup = self.by_category.get(category)
+                if rollup is None:
+                    rollup = self.by_category[category] = Rollup()
+                rollup.add(key, cell)
+                rollup = self.by_day.get(day)
+                if rollup is None:
+                    rollup = self.by_day[day] = Rollup()
+                rollup.add(key, cell)
+            for (category, bucket), count in buckets.items():
+                histogram = self.histogram.get(category)
+                if histogram is None:
+                    histogram = self.histogram[category] = [0] * HISTOGRAM_BUCKETS
+                histogram[bucket] += count
+            self.updated_at = time.time()
+            self._snapshots = {}
+
+    def snapshot(self, days: int = 30, today: Optional[date] = None) -> Dict[str, Any]:
+        days = max(1, min(days, MAX_TREND_DAYS))
+        key = (days, today or datetime.now(timezone.utc).date())
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._snapshots[key] = self._build(*key)
+            return snapshot
+
+    def _build(self, days: int, today: date) -> Dict[str, Any]:
+        total = self.total
+        histogram = [0] * HISTOGRAM_BUCKETS
+        for counts in self.histogram.values():
+            for bucket, count in enumerate(counts):
+                histogram[bucket] += count
+
+        trend = []
+        for offset in range(days - 1, -1, -1):
+            day = (today - timedelta(days=offset)).isoformat()
+            rollup = self.by_day.get(day)
+            if rollup is None:
+                continue
+            trend.append({
+                "day": day,
+                "count": rollup.count,
+                "categories": dict(rollup.categories),
+                "severity_levels": dict(rollup.severity_levels),
+                "corruption_risk_levels": dict(rollup.corruption_levels),
+                "means": rollup.means()
+            })
+
+        return {
+            "total": total.count,
+            "updated_at": self.updated_at,
+            "means": total.means(),
+            "categories": {
+                category: {
+                    "count": rollup.count,
+                    "share": round(rollup.count / total.count, 4) if total.count else 0.0,
+                    "severity_levels": dict(rollup.severity_levels),
+                    "corruption_risk_levels": dict(rollup.corruption_levels),
+                    "means": rollup.means(),
+                    "severity_histogram": {
+                        _bucket_label(bucket): count
+                        for bucket, count in enumerate(self.histogram.get(category, [0] * HISTOGRAM_BUCKETS))
+                    }
+                }
+                for category, rollup in self.by_category.items()
+            },
+            "severity_levels": dict(total.severity_levels),
+            "severity_histogram": {_bucket_label(bucket): count for bucket, count in enumerate(histogram)},
+            "corruption_risk_levels": dict(total.corruption_levels),
+            "trend_days": days,
+            "daily": trend
+        }
@@ -0,0 +1,267 @@
+import functools
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from utils.rule_store import default_rules
+from utils.versioning import rules_fingerprint
+
+EVIDENCE_CHECKLISTS = {
+    "Theft": [
+        "Proof of ownership (receipts, bills)",
+        "Witness statements",
+        "CCTV footage if available",
+        "Police complaint copy",
+        "Description of stolen items"
+    ],
+    "Assault": [
+        "Medical examination report",
+        "Photographs of injuries",
+        "Witness statements",
+        "Weapon used (if any)",
+        "Clothing with blood stains"
+    ],
+    "Harassment": [
+        "Screenshots of messages/calls",
+        "Witness statements",
+        "Audio/video recordings",
+        "Email communications"
+    ],
+    "Fraud": [
+        "Bank statements",
+        "Transaction records",
+        "Communication evidence",
+        "Identity proof of accused"
+    ],
+    "Cybercrime": [
+        "Screenshots of online activity",
+        "IP addresses",
+        "Email headers",
+        "Device information"
+    ]
+}
+
+DEFAULT_EVIDENCE_CHECKLIST = [
+    "Document all relevant evidence",
+    "Collect witness information",
+    "Preserve digital evidence",
+    "Medical reports if applicable"
+]
+
+RECOMMENDED_ACTIONS = {
+    "High": [
+        "File FIR immediately at nearest police station",
+        "Preserve all physical and digital evidence",
+        "Seek medical attention if injured",
+        "Inform family and legal counsel",
+        "Follow up with investigating officer within 24 hours"
+    ],
+    "Medium": [
+        "File police complaint within 48 hours",
+        "Document all evidence systematically",
+        "Consult with legal advisor",
+        "Maintain record of all communications",
+        "Follow up as per police guidance"
+    ],
+    "Low": [
+        "File general diary entry",
+        "Attempt mediation if appropriate",
+        "Consult local authorities",
+        "Document the incident for records",
+        "Seek legal advice for further action"
+    ]
+}
+
+DEFAULT_RECOMMENDED_ACTIONS = ["Consult local authorities for guidance"]
+
+RISK_ASSESSMENTS = {
+    "Critical": {
+        "level": "Critical",
+        "recommendation": "Immediate police intervention required",
+        "timeline": "Within 24 hours",
+        "actions": ["File FIR immediately", "Preserve evidence", "Seek medical attention if injured"]
+    },
+    "Moderate": {
+        "level": "Moderate",
+        "recommendation": "Police complaint recommended",
+        "timeline": "Within 48 hours",
+        "actions": ["File police complaint", "Document evidence", "Consult legal advisor"]
+    },
+    "Low": {
+        "level": "Low",
+        "recommendation": "Can file general diary or civil complaint",
+        "timeline": "Within 7 days",
+        "actions": ["File general diary", "Attempt mediation", "Consult local authorities"]
+    }
+}
+
+CORRUPTION_RECOMMENDATIONS = {
+    "High": [
+        "File complaint directly with higher authorities",
+        "Maintain duplicate copies of all documents",
+        "Use official email for all communications",
+        "Seek assistance from anti-corruption helpline if needed"
+    ],
+    "Medium": [
+        "Follow up regularly on case status",
+        "Document all interactions with officials",
+        "Use transparent payment methods if any fees",
+        "Consult with legal aid services"
+    ],
+    "Low": [
+        "Follow standard procedures",
+        "Maintain proper documentation",
+        "Be aware of your rights as complainant"
+    ]
+}
+
+CORRUPTION_FACTORS = ["case_category", "severity", "common_risk_patterns"]
+
+REQUIRED_DOCUMENTS = ["ID Proof", "Address Proof", "Complaint Affidavit"]
+
+TIMELINE_FACTORS = ["case complexity", "evidence availability", "legal procedures"]
+
+TIMELINE_STAGES = [
+    {"stage": "FIR Registration", "days": "1-7 days"},
+    {"stage": "Initial Investigation", "days": "1-2 weeks"},
+    {"stage": "Evidence Collection", "days": "2-4 weeks"},
+    {"stage": "Chargesheet Filing", "days": "3-8 weeks"}
+]
+
+class FrozenDict(dict):
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Artifact registry entries are read-only")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        items = tuple(freeze(item) for item in value)
+        return value if all(item is original for item, original in zip(items, value)) else items
+    return value
+
+def dump_fragment(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+class ArtifactRegistry:
+    def __init__(self, ipc_sections: Optional[Dict[str, Any]] = None):
+        if ipc_sections is None:
+            ipc_sections = default_rules().ipc_sections
+        self.version = rules_fingerprint(
+            ipc_sections, EVIDENCE_CHECKLISTS, DEFAULT_EVIDENCE_CHECKLIST, RECOMMENDED_ACTIONS,
+            DEFAULT_RECOMMENDED_ACTIONS, RISK_ASSESSMENTS, CORRUPTION_RECOMMENDATIONS,
+            CORRUPTION_FACTORS, REQUIRED_DOCUMENTS, TIMELINE_FACTORS, TIMELINE_STAGES
+        )
+
+        self.ipc_sections = freeze(ipc_sections)
+        self.ipc_codes = FrozenDict(
+            (category, tuple(section["code"] for section in sections))
+            for category, sections in self.ipc_sections.items()
+        )
+        self.evidence_checklists = freeze(EVIDENCE_CHECKLISTS)
+        self.default_evidence_checklist = freeze(DEFAULT_EVIDENCE_CHECKLIST)
+        self.recommended_actions = freeze(RECOMMENDED_ACTIONS)
+        self.default_recommended_actions = freeze(DEFAULT_RECOMMENDED_ACTIONS)
+        self.risk_assessments = freeze(RISK_ASSESSMENTS)
+        self.corruption_recommendations = freeze(CORRUPTION_RECOMMENDATIONS)
+        self.corruption_factors = freeze(CORRUPTION_FACTORS)
+        self.required_documents = freeze(REQUIRED_DOCUMENTS)
+        self.timeline_factors = freeze(TIMELINE_FACTORS)
+        self.timeline_stages = freeze(TIMELINE_STAGES)
+
+        self.legal_mappings = FrozenDict(
+            (category, self._legal_mapping(category))
+            for category in set(self.ipc_sections) | set(self.evidence_checklists)
+        )
+        self.default_legal_mapping = self._legal_mapping(None)
+
+        self._bullets = {
+            ("evidence_checklist", key): self._bullet_list(items)
+            for key, items in list(self.evidence_checklists.items()) + [(None, self.default_evidence_checklist)]
+        }
+        self._bullets.update({
+            ("recommended_actions", key): self._bullet_list(items)
+            for key, items in list(self.recommended_actions.items()) + [(None, self.default_recommended_actions)]
+        })
+
+        self._fragments: Dict[Tuple[str, Optional[str]], bytes] = {}
+        for name, table, default in [
+            ("legal_mapping", self.legal_mappings, self.default_legal_mapping),
+            ("evidence_checklist", self.evidence_checklists, self.default_evidence_checklist),
+            ("recommended_actions", self.recommended_actions, self.default_recommended_actions),
+            ("risk_assessment", self.risk_assessments, None),
+            ("corruption_recommendations", self.corruption_recommendations, None)
+        ]:
+            for key, value in table.items():
+                self._fragments[(name, key)] = dump_fragment(value)
+            if default is not None:
+                self._fragments[(name, None)] = dump_fragment(default)
+        self._fragments[("required_documents", None)] = dump_fragment(self.required_documents)
+
+        self._fragment_index: Dict[int, Tuple[Any, bytes]] = {}
+        for table in [self.legal_mappings, self.evidence_checklists, self.recommended_actions,
+                      self.risk_assessments, self.corruption_recommendations]:
+            for value in table.values():
+                self.register(value)
+        for value in [self.default_legal_mapping, self.default_evidence_checklist,
+                      self.default_recommended_actions, self.corruption_factors, self.required_documents,
+                      self.timeline_factors, self.timeline_stages]:
+            self.register(value)
+
+    def _legal_mapping(self, category: Optional[str]) -> FrozenDict:
+        return FrozenDict({
+            "ipc_sections": self.ipc_sections.get(category, ()),
+            "evidence_checklist": self.evidence_checklist(category),
+            "required_documents": self.required_documents
+        })
+
+    @staticmethod
+    def _bullet_list(items: Tuple[str, ...]) -> str:
+        return "\n".join(f"- {item}" for item in items)
+
+    def evidence_checklist(self, category: Optional[str]) -> Tuple[str, ...]:
+        return self.evidence_checklists.get(category, self.default_evidence_checklist)
+
+    def recommended_actions_for(self, severity_level: Optional[str]) -> Tuple[str, ...]:
+        return self.recommended_actions.get(severity_level, self.default_recommended_actions)
+
+    def legal_mapping(self, category: Optional[str]) -> FrozenDict:
+        return self.legal_mappings.get(category, self.default_legal_mapping)
+
+    def bullets(self, name: str, key: Optional[str]) -> str:
+        return self._bullets.get((name, key), self._bullets[(name, None)])
+
+    def register(self, value: Any) -> Any:
+        if id(value) not in self._fragment_index:
+            self._fragment_index[id(value)] = (value, dump_fragment(value))
+        return value
+
+    def fragment_for(self, value: Any) -> Optional[bytes]:
+        entry = self._fragment_index.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+        return None
+
+    def fragment(self, name: str, key: Optional[str] = None) -> bytes:
+        fragment = self._fragments.get((name, key))
+        if fragment is None:
+            fragment = self._fragments[(name, None)]
+        return fragment
+
+@functools.lru_cache(maxsize=None)
+def default_registry() -> ArtifactRegistry:
+    return ArtifactRegistry()
@@ -0,0 +1,356 @@
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.analysis_pipeline import build_components
+from utils.stage_executor import _init_worker, _invoke_in_worker
+
+INPUT_FORMATS = ["csv", "jsonl"]
+OUTPUT_FORMATS = ["jsonl", "csv", "parquet"]
+CHECKPOINT_VERSION = 2
+
+class CheckpointMismatch(Exception):
+    pass
+
+def available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def detect_format(path: str, choices: List[str]) -> str:
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    extension = {"ndjson": "jsonl", "json": "jsonl", "pq": "parquet"}.get(extension, extension)
+    if extension not in choices:
+        raise ValueError(f"Cannot infer format from '{path}', pass one of: {', '.join(choices)}")
+    return extension
+
+def require_parquet_engine():
+    if not any(importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+        raise ImportError("Parquet output needs pyarrow or fastparquet, install one or use --output-format csv")
+
+def read_chunks(path: str, input_format: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    if input_format == "csv":
+        return pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+    return pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+
+def rules_versions() -> Dict[str, str]:
+    components = build_components()
+    return {
+        "normalizer": components["normalizer"].rules_version,
+        "eccm_model": components["eccm_model"].rules_version,
+        "lss_calculator": components["lss_calculator"].rules_version
+    }
+
+def flatten_result(record: Dict[str, Any]) -> Dict[str, Any]:
+    result = record.get("result") or {}
+    classification = result.get("classification", {})
+    severity = result.get("severity", {})
+    return {
+        "id": record["id"],
+        "row": record["row"],
+        "status": record["status"],
+        "error": record.get("error"),
+        "normalized_text": result.get("normalization", {}).get("normalized_text"),
+        "category": classification.get("category"),
+        "subcategory": classification.get("subcategory"),
+        "confidence": classification.get("confidence"),
+        "model": classification.get("model"),
+        "severity_score": severity.get("score"),
+        "severity_level": severity.get("level"),
+        "corruption_risk_level": result.get("corruption_risk", {}).get("risk_level"),
+        "estimated_duration_days": result.get("timeline_prediction", {}).get("estimated_duration_days"),
+        "result_json": json.dumps(result, ensure_ascii=False) if result else None
+    }
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+        self.state: Dict[str, Any] = {}
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.state = json.load(f)
+        return True
+
+    def save(self, **updates: Any):
+        self.state.update(updates, updated_at=time.time())
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+class ResultWriter:
+    def __init__(self, path: str, output_format: str):
+        self.path = path
+        self.output_format = output_format
+
+    def intact(self, resume_state: Dict[str, Any]) -> bool:
+        if self.output_format == "jsonl":
+            return os.path.isfile(self.path) and os.path.getsize(self.path) >= resume_state["output_bytes"]
+        return all(
+            os.path.exists(os.path.join(self.path, f"part-{index:05d}.{self.output_format}"))
+            for index in range(resume_state["chunks_done"])
+        )
+
+    def prepare(self, resume_state: Optional[Dict[str, Any]]):
+        if self.output_format == "jsonl":
+            if resume_state:
+                with open(self.path, "r+b") as f:
+                    f.truncate(resume_state["output_bytes"])
+            else:
+                open(self.path, "wb").close()
+        else:
+            os.makedirs(self.path, exist_ok=True)
+            if not resume_state:
+                for name in os.listdir(self.path):
+                    if name.startswith("part-"):
+                        os.remove(os.path.join(self.path, name))
+
+    def write_chunk(self, chunk_index: int, records: List[Dict[str, Any]]) -> int:
+        if self.output_format == "jsonl":
+            with open(self.path, "ab") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+                return f.tell()
+
+        frame = pd.DataFrame([flatten_result(record) for record in records])
+        part_path = os.path.join(self.path, f"part-{chunk_index:05d}.{self.output_format}")
+        temp_path = part_path + ".tmp"
+        if self.output_format == "parquet":
+            frame.to_parquet(temp_path, index=False)
+        else:
+            frame.to_csv(temp_path, index=False)
+        os.replace(temp_path, part_path)
+        return 0
+
+class BulkProcessor:
+    def __init__(self, input_path: str, output_path: str, input_format: Optional[str] = None,
+                 output_format: Optional[str] = None, text_column: str = "text",
+                 language_column: Optional[str] = None, id_column: Optional[str] = None,
+                 chunk_size: int = 1000, workers: Optional[int] = None,
+                 checkpoint_path: Optional[str] = None, component_settings: Optional[Dict[str, Any]] = None,
+                 include_factors: bool = True, progress=sys.stderr):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.input_format = input_format or detect_format(input_path, INPUT_FORMATS)
+        self.output_format = output_format or detect_format(output_path, OUTPUT_FORMATS)
+        if self.output_format == "parquet":
+            require_parquet_engine()
+        self.text_column = text_column
+        self.language_column = language_column
+        self.id_column = id_column
+        self.chunk_size = chunk_size
+        self.workers = workers or available_cores()
+        self.checkpoint = Checkpoint(checkpoint_path or f"{output_path.rstrip(os.sep)}.checkpoint.json")
+        self.component_settings = component_settings or {}
+        self.include_factors = include_factors
+        self.progress = progress
+
+    def _input_identity(self) -> Dict[str, Any]:
+        stat = os.stat(self.input_path)
+        return {
+            "input": os.path.abspath(self.input_path),
+            "input_size": stat.st_size,
+            "input_mtime_ns": stat.st_mtime_ns
+        }
+
+    def _resume_state(self, restart: bool, versions: Dict[str, str],
+                      writer: ResultWriter) -> Optional[Dict[str, Any]]:
+        if restart or not self.checkpoint.load():
+            self.checkpoint.state = {}
+            return None
+
+        state = self.checkpoint.state
+        expected = {
+            "version": CHECKPOINT_VERSION,
+            **self._input_identity(),
+            "output_format": self.output_format,
+            "chunk_size": self.chunk_size,
+            "text_column": self.text_column,
+            "include_factors": self.include_factors,
+            "rules_versions": versions
+        }
+        mismatched = [key for key, value in expected.items() if state.get(key) != value]
+        if mismatched:
+            raise CheckpointMismatch(
+                f"Checkpoint {self.checkpoint.path} does not match this run ({', '.join(mismatched)}); "
+                f"use --restart to start over"
+            )
+        if not writer.intact(state):
+            raise CheckpointMismatch(
+                f"Output {self.output_path} is missing or shorter than checkpoint {self.checkpoint.path} "
+                f"records; use --restart to start over"
+            )
+        return state
+
+    def _items(self, frame: pd.DataFrame, first_row: int) -> Tuple[List[Tuple[str, str]], List[Any]]:
+        if self.text_column not in frame.columns:
+            raise KeyError(f"Input has no '{self.text_column}' column")
+
+        texts = frame[self.text_column].fillna("").astype(str).tolist()
+        if self.language_column and self.language_column in frame.columns:
+            languages = frame[self.language_column].fillna("auto").astype(str).tolist()
+        else:
+            languages = ["auto"] * len(texts)
+        if self.id_column and self.id_column in frame.columns:
+            ids = frame[self.id_column].tolist()
+        else:
+            ids = list(range(first_row, first_row + len(texts)))
+        return list(zip(texts, languages)), ids
+
+    def _split(self, items: List[Tuple[str, str]]) -> List[Tuple[int, List[Tuple[str, str]]]]:
+        size = max(1, -(-len(items) // self.workers))
+        return [(start, items[start:start + size]) for start in range(0, len(items), size)]
+
+    def _report(self, rows: int, started: float, resumed_rows: int, final: bool = False):
+        elapsed = time.perf_counter() - started
+        processed = rows - resumed_rows
+        throughput = processed / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{'done' if final else 'progress'}: {rows} rows ({processed} this run) "
+            f"in {elapsed:.1f}s, {throughput:.1f} rows/s",
+            file=self.progress, flush=True
+        )
+
+    def run(self, restart: bool = False) -> Dict[str, Any]:
+        versions = rules_versions()
+        writer = ResultWriter(self.output_path, self.output_format)
+        state = self._resume_state(restart, versions, writer)
+        chunks_done = state["chunks_done"] if state else 0
+        rows_done = resumed_rows = state["rows_done"] if state else 0
+
+        writer.prepare(state)
+        if state is None:
+            self.checkpoint.save(
+                version=CHECKPOINT_VERSION,
+                **self._input_identity(),
+                output=os.path.abspath(self.output_path),
+                output_format=self.output_format,
+                chunk_size=self.chunk_size,
+                text_column=self.text_column,
+                include_factors=self.include_factors,
+                rules_versions=versions,
+                chunks_done=0,
+                rows_done=0,
+                output_bytes=0,
+                errors=0
+            )
+        elif rows_done:
+            print(f"resuming after chunk {chunks_done} ({rows_done} rows)", file=self.progress, flush=True)
+
+        started = time.perf_counter()
+        errors = self.checkpoint.state.get("errors", 0)
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(build_components, self.component_settings)
+        ) as pool:
+            pending = deque()
+            chunks = read_chunks(self.input_path, self.input_format, self.chunk_size)
+            first_row = 0
+
+            for chunk_index, frame in enumerate(chunks):
+                if chunk_index < chunks_done:
+                    first_row += len(frame)
+                    continue
+
+                items, ids = self._items(frame, first_row)
+                futures = [
+                    (offset, pool.submit(_invoke_in_worker, "pipeline", "analyze_batch", (batch, self.include_factors), {}))
+                    for offset, batch in self._split(items)
+                ]
+                pending.append((chunk_index, first_row, ids, futures))
+                first_row += len(frame)
+
+                while pending and (len(pending) > 2 or all(future.done() for _, future in pending[0][3])):
+                    errors, rows_done = self._flush(pending.popleft(), writer, errors)
+                    self._report(rows_done, started, resumed_rows)
+
+            while pending:
+                errors, rows_done = self._flush(pending.popleft(), writer, errors)
+                self._report(rows_done, started, resumed_rows)
+
+        self._report(rows_done, started, resumed_rows, final=True)
+        summary = {"rows": rows_done, "errors": errors, "output": os.path.abspath(self.output_path)}
+        self.checkpoint.save(completed=True)
+        return summary
+
+    def _flush(self, entry, writer: ResultWriter, errors: int) -> Tuple[int, int]:
+        chunk_index, first_row, ids, futures = entry
+        records = []
+        for offset, future in futures:
+            for outcome in future.result():
+                position = offset + outcome["index"]
+                record = {"id": ids[position], "row": first_row + position, "status": outcome["status"]}
+                if outcome["status"] == "ok":
+                    record["result"] = outcome["result"]
+                else:
+                    record["error"] = outcome["error"]
+                    errors += 1
+                records.append(record)
+
+        output_bytes = writer.write_chunk(chunk_index, records)
+        rows_done = first_row + len(records)
+        self.checkpoint.save(chunks_done=chunk_index + 1, rows_done=rows_done,
+                             output_bytes=output_bytes, errors=errors)
+        return errors, rows_done
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-score a complaint archive with the analysis pipeline")
+    parser.add_argument("input", help="CSV or JSONL file with one complaint per row")
+    parser.add_argument("output", help="JSONL file, or a directory of CSV / Parquet part files")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS)
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--language-column")
+    parser.add_argument("--id-column")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=0, help="Defaults to the available cores")
+    parser.add_argument("--checkpoint", help="Defaults to <output>.checkpoint.json")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--no-factors", action="store_true",
+                        help="Skip the per-factor severity breakdown for faster rescoring")
+    args = parser.parse_args(argv)
+
+    try:
+        processor = BulkProcessor(
+            args.input, args.output,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            text_column=args.text_column,
+            language_column=args.language_column,
+            id_column=args.id_column,
+            chunk_size=args.chunk_size,
+            workers=args.workers or None,
+            checkpoint_path=args.checkpoint,
+            include_factors=not args.no_factors
+        )
+        summary = processor.run(restart=args.restart)
+    except (CheckpointMismatch, ImportError, KeyError, ValueError) as e:
+        print(f"Bulk processing failed: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Bulk processing failed: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+import json
+import os
+import queue
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from utils.artifact_registry import freeze
+
+class CacheBackend:
+    name = "base"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+class MemoryCacheBackend(CacheBackend):
+    name = "memory"
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else 0.0
+        value = freeze(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+class SQLiteCacheBackend(CacheBackend):
+    name = "sqlite"
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 50000, prune_interval: int = 256,
+                 touch_batch_size: int = 128):
+        self.path = path or os.path.join(tempfile.gettempdir(), "equicourt-cache.sqlite3")
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        self.touch_batch_size = touch_batch_size
+        self._local = threading.local()
+        self._writes = 0
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache_entries (accessed_at)")
+        connection.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        value, expires_at = row
+        if expires_at and expires_at < now:
+            self.delete(key)
+            return False, None
+
+        with self._lock:
+            self._touched[key] = now
+            flush = len(self._touched) >= self.touch_batch_size
+        if flush:
+            self._flush_touches()
+        return True, json.loads(value)
+
+    def _flush_touches(self):
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if not touched:
+            return
+
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in touched.items()]
+            )
+        finally:
+            connection.execute("COMMIT")
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds else 0.0
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, separators=(",", ":")), expires_at, now)
+        )
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_interval == 0
+        if prune:
+            self._prune(now)
+
+    def _prune(self, now: float):
+        self._flush_touches()
+        connection = self._connection()
+        connection.execute("DELETE FROM cache_entries WHERE expires_at > 0 AND expires_at < ?", (now,))
+        count = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                (excess,)
+            )
+            with self._lock:
+                self.evictions += excess
+
+    def delete(self, key: str):
+        self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+    def stats(self) -> Dict[str, Any]:
+        count = self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "entries": count,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions
+        }
+
+class RedisError(Exception):
+    pass
+
+class RespConnection:
+    def __init__(self, host: str, port: int, timeout: float):
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._reader = self._socket.makefile("rb")
+
+    def execute(self, *args: Any) -> Any:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._socket.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode("utf-8")
+        if prefix == b"-":
+            raise RedisError(payload.decode("utf-8"))
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply prefix: {prefix!r}")
+
+    def close(self):
+        try:
+            self._reader.close()
+            self._socket.close()
+        except OSError:
+            pass
+
+class RedisCacheBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, prefix: str = "equicourt:",
+                 timeout: float = 0.5, pool_size: int = 16):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[RespConnection]" = queue.LifoQueue(maxsize=pool_size)
+        self.reconnects = 0
+
+    def _connect(self) -> RespConnection:
+        connection = RespConnection(self.host, self.port, self.timeout)
+        try:
+            if self.password:
+                connection.execute("AUTH", self.password)
+            if self.db:
+                connection.execute("SELECT", self.db)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _execute(self, *args: Any) -> Any:
+        try:
+            connection, pooled = self._pool.get_nowait(), True
+        except queue.Empty:
+            connection, pooled = self._connect(), False
+
+        try:
+            return self._call(connection, args)
+        except (OSError, ConnectionError):
+            if not pooled:
+                raise
+        self.reconnects += 1
+        return self._call(self._connect(), args)
+
+    def _call(self, connection: RespConnection, args: Tuple) -> Any:
+        try:
+            reply = connection.execute(*args)
+        except RedisError:
+            self._release(connection)
+            raise
+        except BaseException:
+            connection.close()
+            raise
+        self._release(connection)
+        return reply
+
+    def _release(self, connection: RespConnection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _scan(self) -> Iterator[List[bytes]]:
+        cursor = "0"
+        while True:
+            cursor, keys = self._execute("SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 500)
+            cursor = cursor.decode("utf-8") if isinstance(cursor, bytes) else str(cursor)
+            yield keys
+            if cursor == "0":
+                break
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        value = self._execute("GET", self.prefix + key)
+        if value is None:
+            return False, None
+        return True, json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        payload = json.dumps(value, separators=(",", ":"))
+        if ttl_seconds:
+            self._execute("SET", self.prefix + key, payload, "PX", int(ttl_seconds * 1000))
+        else:
+            self._execute("SET", self.prefix + key, payload)
+
+    def delete(self, key: str):
+        self._execute("DEL", self.prefix + key)
+
+    def clear(self):
+        for keys in self._scan():
+            if keys:
+                self._execute("DEL", *keys)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "address": f"{self.host}:{self.port}/{self.db}",
+            "prefix": self.prefix,
+            "entries": sum(len(keys) for keys in self._scan()),
+            "reconnects": self.reconnects
+        }
+
+def create_cache_backend(url: Optional[str] = None, max_entries: int = 4096) -> CacheBackend:
+    parsed = urlparse(url or "memory://")
+    options = {name: values[-1] for name, values in parse_qs(parsed.query).items()}
+
+    if parsed.scheme == "memory":
+        return MemoryCacheBackend(max_entries=int(options.get("max_entries", max_entries)))
+    if parsed.scheme == "sqlite":
+        return SQLiteCacheBackend(
+            path=parsed.netloc + parsed.path or None,
+            max_entries=int(options.get("max_entries", max_entries))
+        )
+    if parsed.scheme == "redis":
+        return RedisCacheBackend(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=int(parsed.path.lstrip("/") or 0),
+            password=parsed.password,
+            prefix=options.get("prefix", "equicourt:")
+        )
+    raise ValueError(f"Unsupported cache backend URL: {url}")
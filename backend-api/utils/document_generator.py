@@ -1,79 +1,94 @@
+import io
+import json
+import zipfile
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+
+from jinja2 import Environment, StrictUndefined
+
+from utils.artifact_registry import ArtifactRegistry, default_registry
 
 class DocumentGenerator:
-    def __init__(self):
+    def __init__(self, artifacts: Optional[ArtifactRegistry] = None):
+        self.artifacts = artifacts or default_registry()
         self.fir_template = """
 FIR DRAFT - EQUICOURT GENERATED
 
-Police Station: {police_station}
-District: {district}
-State: {state}
+Police Station: {{ police_station }}
+District: {{ district }}
+State: {{ state }}
 
 FIR No: ______________
-Date: {current_date}
+Date: {{ current_date }}
 
 COMPLAINANT INFORMATION:
-Name: {complainant_name}
-Address: {complainant_address}
-Contact: {complainant_contact}
+Name: {{ complainant_name }}
+Address: {{ complainant_address }}
+Contact: {{ complainant_contact }}
 
 COMPLAINT DETAILS:
-Date of Incident: {incident_date}
-Time of Incident: {incident_time}
-Place of Occurrence: {incident_place}
+Date of Incident: {{ incident_date }}
+Time of Incident: {{ incident_time }}
+Place of Occurrence: {{ incident_place }}
 
 NARRATIVE:
-{complaint_text}
+{{ complaint_text }}
 
 CATEGORIZATION:
-Legal Category: {category}
-Severity Level: {severity_level}
-Severity Score: {severity_score}/100
+Legal Category: {{ category }}
+Severity Level: {{ severity_level }}
+Severity Score: {{ severity_score }}/100
 
 APPLICABLE IPC SECTIONS:
-{ipc_sections}
+{{ ipc_sections }}
 
 EVIDENCE CHECKLIST:
-{evidence_checklist}
+{{ evidence_checklist }}
 
 RECOMMENDED ACTIONS:
-{recommended_actions}
+{{ recommended_actions }}
 
 Complainant Signature: __________________
 
 Station House Officer Signature: __________________
-Date: {current_date}
+Date: {{ current_date }}
 """
+        self._template = Environment(
+            keep_trailing_newline=True,
+            autoescape=False,
+            undefined=StrictUndefined
+        ).from_string(self.fir_template)
+    
+    def _fir_context(self, complaint_text: str, category: str, severity_score: int, severity_level: str,
+                     ipc_sections: List[str], complainant_info: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "police_station": complainant_info.get("police_station", "Local Police Station"),
+            "district": complainant_info.get("district", "Your District"),
+            "state": complainant_info.get("state", "Your State"),
+            "current_date": datetime.now().strftime("%Y-%m-%d"),
+            "complainant_name": complainant_info.get("name", "Complainant Name"),
+            "complainant_address": complainant_info.get("address", "Complainant Address"),
+            "complainant_contact": complainant_info.get("contact", "Contact Information"),
+            "incident_date": complainant_info.get("incident_date", "Date of incident"),
+            "incident_time": complainant_info.get("incident_time", "Time of incident"),
+            "incident_place": complainant_info.get("incident_place", "Place of occurrence"),
+            "complaint_text": complaint_text,
+            "category": category,
+            "severity_level": severity_level,
+            "severity_score": severity_score,
+            "ipc_sections": "\n".join([f"- IPC {section}" for section in ipc_sections]),
+            "evidence_checklist": self.artifacts.bullets("evidence_checklist", category),
+            "recommended_actions": self.artifacts.bullets("recommended_actions", severity_level)
+        }
     
     def generate_fir_draft(self, complaint_text: str, category: str, 
                           severity_score: int, severity_level: str, 
                           ipc_sections: List[str], 
                           complainant_info: Dict[str, Any]) -> Dict[str, Any]:
         
-        ipc_sections_formatted = "\n".join([f"- IPC {section}" for section in ipc_sections])
-        evidence_checklist = self._get_evidence_checklist(category)
-        recommended_actions = self._get_recommended_actions(severity_level)
-        
-        fir_draft = self.fir_template.format(
-            police_station=complainant_info.get("police_station", "Local Police Station"),
-            district=complainant_info.get("district", "Your District"),
-            state=complainant_info.get("state", "Your State"),
-            current_date=datetime.now().strftime("%Y-%m-%d"),
-            complainant_name=complainant_info.get("name", "Complainant Name"),
-            complainant_address=complainant_info.get("address", "Complainant Address"),
-            complainant_contact=complainant_info.get("contact", "Contact Information"),
-            incident_date=complainant_info.get("incident_date", "Date of incident"),
-            incident_time=complainant_info.get("incident_time", "Time of incident"),
-            incident_place=complainant_info.get("incident_place", "Place of occurrence"),
-            complaint_text=complaint_text,
-            category=category,
-            severity_level=severity_level,
-            severity_score=severity_score,
-            ipc_sections=ipc_sections_formatted,
-            evidence_checklist="\n".join([f"- {item}" for item in evidence_checklist]),
-            recommended_actions="\n".join([f"- {action}" for action in recommended_actions])
-        )
+        fir_draft = self._template.render(self._fir_context(
+            complaint_text, category, severity_score, severity_level, ipc_sections, complainant_info
+        ))
         
         return {
             "fir_draft": fir_draft,
@@ -81,59 +96,69 @@ Date: {current_date}
             "severity_level": severity_level,
             "severity_score": severity_score,
             "ipc_sections": ipc_sections,
-            "evidence_checklist": evidence_checklist,
+            "evidence_checklist": self._get_evidence_checklist(category),
             "generated_date": datetime.now().isoformat(),
             "document_type": "FIR Draft"
         }
     
+    def stream_fir_draft(self, complaint_text: str, category: str, severity_score: int, severity_level: str,
+                         ipc_sections: List[str], complainant_info: Dict[str, Any]) -> Iterator[str]:
+        return self._template.generate(self._fir_context(
+            complaint_text, category, severity_score, severity_level, ipc_sections, complainant_info
+        ))
+    
+    def write_fir_draft(self, sink, **draft: Any):
+        for chunk in self.stream_fir_draft(**draft):
+            sink.write(chunk)
+    
+    def iter_fir_export(self, drafts: Iterable[Dict[str, Any]], export_format: str = "ndjson") -> Iterator[bytes]:
+        if export_format == "ndjson":
+            for index, draft in enumerate(drafts):
+                try:
+                    line = {"index": index, "status": "ok", "result": self.generate_fir_draft(**draft)}
+                except Exception as e:
+                    line = {"index": index, "status": "error", "error": f"Draft generation error: {str(e)}"}
+                yield json.dumps(line, ensure_ascii=False).encode("utf-8") + b"\n"
+        elif export_format == "zip":
+            buffer = _DrainableBuffer()
+            with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for index, draft in enumerate(drafts):
+                    try:
+                        text = "".join(self.stream_fir_draft(**draft))
+                    except Exception as e:
+                        archive.writestr(f"fir_{index:05d}.error.txt", f"Draft generation error: {str(e)}\n")
+                    else:
+                        archive.writestr(f"fir_{index:05d}.txt", text)
+                    yield buffer.drain()
+            yield buffer.drain()
+        else:
+            raise ValueError(f"Unsupported export format: {export_format}")
+    
+    def export_fir_drafts(self, drafts: Iterable[Dict[str, Any]], sink, export_format: str = "ndjson") -> int:
+        written = 0
+        for chunk in self.iter_fir_export(drafts, export_format):
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+    
     def _get_evidence_checklist(self, category: str) -> List[str]:
-        checklists = {
-            "Theft": [
-                "Proof of ownership (receipts, bills)",
-                "Witness contact information",
-                "CCTV footage request",
-                "Description of stolen items with values",
-                "Time and location details"
-            ],
-            "Assault": [
-                "Medical examination reports",
-                "Photographs of injuries",
-                "Witness statements",
-                "Weapon description",
-                "Clothing evidence"
-            ]
-        }
-        
-        return checklists.get(category, [
-            "Document all relevant evidence",
-            "Collect witness information",
-            "Preserve digital evidence",
-            "Medical reports if applicable"
-        ])
+        return self.artifacts.evidence_checklist(category)
     
     def _get_recommended_actions(self, severity_level: str) -> List[str]:
-        actions = {
-            "High": [
-                "File FIR immediately at nearest police station",
-                "Preserve all physical and digital evidence",
-                "Seek medical attention if injured",
-                "Inform family and legal counsel",
-                "Follow up with investigating officer within 24 hours"
-            ],
-            "Medium": [
-                "File police complaint within 48 hours",
-                "Document all evidence systematically",
-                "Consult with legal advisor",
-                "Maintain record of all communications",
-                "Follow up as per police guidance"
-            ],
-            "Low": [
-                "File general diary entry",
-                "Attempt mediation if appropriate",
-                "Consult local authorities",
-                "Document the incident for records",
-                "Seek legal advice for further action"
-            ]
-        }
-        
-        return actions.get(severity_level, ["Consult local authorities for guidance"])
\ No newline at end of file
+        return self.artifacts.recommended_actions_for(severity_level)
+
+class _DrainableBuffer(io.RawIOBase):
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
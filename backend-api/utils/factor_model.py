@@ -0,0 +1,116 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from utils.keyword_matcher import MatchResult
+
+class SparseMembership:
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.keywords: List[str] = []
+        self.index: Dict[str, int] = {}
+        columns: Dict[str, Dict[int, int]] = {}
+        for column, group_keywords in enumerate(groups.values()):
+            for keyword in group_keywords:
+                if keyword not in self.index:
+                    self.index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    columns[keyword] = {}
+                columns[keyword][column] = columns[keyword].get(column, 0) + 1
+
+        self.shape = (len(self.keywords), len(groups))
+        self.indptr = np.zeros(len(self.keywords) + 1, dtype=np.int64)
+        indices, data = [], []
+        for row, keyword in enumerate(self.keywords):
+            for column, count in sorted(columns[keyword].items()):
+                indices.append(column)
+                data.append(count)
+            self.indptr[row + 1] = len(indices)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.data = np.array(data, dtype=np.float64)
+        self.rows = [
+            list(zip(indices[self.indptr[row]:self.indptr[row + 1]], data[self.indptr[row]:self.indptr[row + 1]]))
+            for row in range(len(self.keywords))
+        ]
+
+    def keyword_ids(self, matches: MatchResult) -> List[int]:
+        index = self.index
+        return [index[keyword] for keyword in matches.keywords if keyword in index]
+
+    def group_counts(self, rows: np.ndarray, keyword_ids: np.ndarray, row_count: int) -> np.ndarray:
+        starts = self.indptr[keyword_ids]
+        lengths = self.indptr[keyword_ids + 1] - starts
+        total = int(lengths.sum())
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        cells = np.repeat(rows, lengths) * self.shape[1] + self.indices[offsets]
+        counts = np.bincount(cells, weights=self.data[offsets], minlength=row_count * self.shape[1])
+        return counts.reshape(row_count, self.shape[1])
+
+class FactorModel:
+    def __init__(self, factors: Dict[str, Dict[str, Any]], category_weights: Dict[str, float],
+                 evidence_step: float = 0.3, default_category_weight: float = 1.0):
+        self.factor_names = list(factors)
+        self.factor_keywords = [list(data["keywords"]) for data in factors.values()]
+        self.weights = np.array([data["weight"] for data in factors.values()], dtype=np.float64)
+        self.weight_list = [data["weight"] for data in factors.values()]
+        self.membership = SparseMembership(dict(zip(self.factor_names, self.factor_keywords)))
+        self.evidence_step = evidence_step
+
+        self.default_category_weight = default_category_weight
+        self.category_weight_map = dict(category_weights)
+        self.category_index = {category: position for position, category in enumerate(category_weights)}
+        self.category_weights = np.array(
+            list(category_weights.values()) + [default_category_weight], dtype=np.float64
+        )
+
+    def category_weight_vector(self, categories: Sequence[str]) -> np.ndarray:
+        default = len(self.category_index)
+        return self.category_weights[[self.category_index.get(category, default) for category in categories]]
+
+    def factor_scores(self, matches: Sequence[MatchResult]) -> np.ndarray:
+        rows, keyword_ids = [], []
+        for row, result in enumerate(matches):
+            ids = self.membership.keyword_ids(result)
+            rows.extend([row] * len(ids))
+            keyword_ids.extend(ids)
+        counts = self.membership.group_counts(
+            np.array(rows, dtype=np.int64), np.array(keyword_ids, dtype=np.int64), len(matches)
+        )
+        return np.minimum(1.0, counts * self.evidence_step)
+
+    def score(self, matches: Sequence[MatchResult], categories: Sequence[str]):
+        factor_scores = self.factor_scores(matches)
+        category_weights = self.category_weight_vector(categories)
+        totals = np.add.accumulate(factor_scores * self.weights, axis=1)[:, -1]
+        return factor_scores, category_weights, np.minimum(100, totals * category_weights * 100)
+
+    def score_one(self, matches: MatchResult, category: str) -> Tuple[List[float], float, float]:
+        counts = [0] * len(self.factor_names)
+        index, rows = self.membership.index, self.membership.rows
+        for keyword in matches.keywords:
+            keyword_id = index.get(keyword)
+            if keyword_id is not None:
+                for column, count in rows[keyword_id]:
+                    counts[column] += count
+
+        step = self.evidence_step
+        factor_scores = []
+        total = 0
+        for count, weight in zip(counts, self.weight_list):
+            factor_score = min(1.0, count * step)
+            factor_scores.append(factor_score)
+            total += factor_score * weight
+        category_weight = self.category_weight_map.get(category, self.default_category_weight)
+        return factor_scores, category_weight, min(100, total * category_weight * 100)
+
+    def breakdown(self, factor_scores: List[float], matches: MatchResult) -> Dict[str, Dict[str, Any]]:
+        factors = {}
+        for name, keywords, weight, factor_score in zip(
+            self.factor_names, self.factor_keywords, self.weight_list, factor_scores
+        ):
+            factors[name] = {
+                "score": factor_score,
+                "weight": weight,
+                "contribution": factor_score * weight,
+                "evidence": matches.found(keywords)
+            }
+        return factors
@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
+def _default(value: Any) -> Any:
+    if isinstance(value, float):
+        return float(value)
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+                      default=_default).encode("utf-8")
+
+class FastJSONEncoder:
+    def __init__(self, fragment_for: Optional[Callable[[Any], Optional[bytes]]] = None, splice_depth: int = 2):
+        self.fragment_for = fragment_for
+        self.splice_depth = splice_depth
+        self.backend = "orjson" if orjson is not None else "json"
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.fragments_spliced = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def _encode(self, value: Any, depth: int, out: List[bytes]) -> int:
+        if self.fragment_for is not None:
+            fragment = self.fragment_for(value)
+            if fragment is not None:
+                out.append(fragment)
+                return 1
+
+        if depth >= self.splice_depth or not isinstance(value, dict) or not value:
+            out.append(dumps(value))
+            return 0
+
+        spliced = 0
+        separator = b"{"
+        for key, item in value.items():
+            out.append(separator)
+            out.append(dumps(str(key)))
+            out.append(b":")
+            spliced += self._encode(item, depth + 1, out)
+            separator = b","
+        out.append(b"}")
+        return spliced
+
+    def encode(self, value: Any) -> bytes:
+        out: List[bytes] = []
+        self._encode(value, 0, out)
+        return b"".join(out)
+
+    def response(self, content: Dict[str, Any], timings: Optional[Dict[str, Any]] = None,
+                 status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+        started = time.perf_counter()
+        out: List[bytes] = []
+        spliced = 0
+        separator = b"{"
+        for key, item in content.items():
+            out.append(separator)
+            out.append(dumps(str(key)))
+            out.append(b":")
+            spliced += self._encode(item, 1, out)
+            separator = b","
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if timings is not None:
+            out.append(separator)
+            out.append(b'"timings":')
+            out.append(dumps({**timings, "serialization_ms": round(elapsed_ms, 3)}))
+            separator = b","
+        out.append(b"}" if separator == b"," else b"{}")
+
+        with self._lock:
+            self.responses += 1
+            self.fragments_spliced += spliced
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+        return Response(
+            content=b"".join(out),
+            status_code=status_code,
+            media_type="application/json",
+            headers={"Server-Timing": f"serialize;dur={elapsed_ms:.3f}", **(headers or {})}
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "responses": self.responses,
+                "fragments_spliced": self.fragments_spliced,
+                "total_ms": round(self.total_ms, 3),
+                "mean_ms": round(self.total_ms / self.responses, 4) if self.responses else 0.0,
+                "max_ms": round(self.max_ms, 3)
+            }
@@ -0,0 +1,296 @@
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.analytics import AnalyticsAggregator
+from utils.fast_json import dumps
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "history.sqlite3")
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS analyses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at REAL NOT NULL,
+        day TEXT NOT NULL,
+        text_hash TEXT NOT NULL,
+        text TEXT NOT NULL,
+        language TEXT,
+        category TEXT,
+        subcategory TEXT,
+        severity_score INTEGER,
+        severity_level TEXT,
+        timeline_days INTEGER,
+        corruption_risk_score REAL,
+        corruption_risk_level TEXT,
+        ipc_codes TEXT,
+        rules_version TEXT,
+        result TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_analyses_category ON analyses (category, id)",
+    "CREATE INDEX IF NOT EXISTS idx_analyses_severity_level ON analyses (severity_level, id)",
+    "CREATE INDEX IF NOT EXISTS idx_analyses_day ON analyses (day, id)",
+    "CREATE INDEX IF NOT EXISTS idx_analyses_text_hash ON analyses (text_hash, id)"
+]
+
+INSERT = """
+    INSERT INTO analyses (
+        created_at, day, text_hash, text, language, category, subcategory, severity_score, severity_level,
+        timeline_days, corruption_risk_score, corruption_risk_level, ipc_codes, rules_version, result
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SUMMARY_COLUMNS = (
+    "id, created_at, text_hash, text, language, category, subcategory, severity_score, severity_level, "
+    "timeline_days, corruption_risk_level, ipc_codes, rules_version"
+)
+
+FILTER_COLUMNS = {
+    "category": "category = ?",
+    "severity_level": "severity_level = ?",
+    "text_hash": "text_hash = ?",
+    "since": "day >= ?",
+    "until": "day <= ?"
+}
+
+class HistoryError(ValueError):
+    pass
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def day_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+def _section(result: Dict[str, Any], name: str) -> Dict[str, Any]:
+    section = result.get(name)
+    return section if isinstance(section, dict) else {}
+
+def history_row(created_at: float, text: str, language: Optional[str], result: Dict[str, Any],
+                rules_version: Optional[str]) -> Tuple:
+    classification = _section(result, "classification")
+    severity = _section(result, "severity")
+    timeline = _section(result, "timeline_prediction")
+    corruption = _section(result, "corruption_risk")
+    sections = _section(result, "legal").get("ipc_sections")
+    ipc_codes = ",".join(section["code"] for section in sections) if sections else None
+    return (
+        created_at, day_of(created_at), text_hash(text), text, language,
+        classification.get("category"), classification.get("subcategory"),
+        severity.get("score"), severity.get("level"),
+        timeline.get("estimated_duration_days"),
+        corruption.get("risk_score"), corruption.get("risk_level"),
+        ipc_codes, rules_version, dumps(result).decode("utf-8")
+    )
+
+class HistoryStore:
+    def __init__(self, path: str = HISTORY_PATH, max_batch_size: int = 256, max_wait_ms: float = 50.0,
+                 max_queue_size: int = 10000, name: str = "history-writer"):
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        with self._writer:
+            for statement in SCHEMA:
+                self._writer.execute(statement)
+            AnalyticsAggregator.create_schema(self._writer)
+        AnalyticsAggregator.backfill(self._writer)
+        self.analytics = AnalyticsAggregator()
+        self._analytics_reader = self._connect()
+        self._analytics_reader.execute("PRAGMA query_only=ON")
+        self._analytics_lock = threading.Lock()
+        self._analytics_version: Optional[int] = None
+
+        self._readers = threading.local()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.batches = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Optional[str] = None
+        self.largest_batch = 0
+        self.write_ms = 0.0
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    def record(self, text: str, language: Optional[str], result: Dict[str, Any],
+               rules_version: Optional[str] = None) -> bool:
+        if self._closed:
+            return False
+
+        try:
+            self._queue.put_nowait((time.time(), text, language, result, rules_version))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def _collect(self) -> List:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            entries = [entry for entry in batch if entry is not None]
+            if entries:
+                self._write(entries)
+            for _ in batch:
+                self._queue.task_done()
+            if self._closed and self._queue.empty():
+                self._writer.close()
+                return
+
+    def _write(self, entries: List[Tuple]):
+        started = time.perf_counter()
+        try:
+            rows = [history_row(*entry) for entry in entries]
+            cells, buckets = AnalyticsAggregator.deltas(rows)
+            with self._writer:
+                self._writer.executemany(INSERT, rows)
+                AnalyticsAggregator.persist(self._writer, cells, buckets)
+        except Exception as e:
+            with self._lock:
+                self.failed += len(entries)
+                self.last_error = str(e)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.written += len(rows)
+            self.largest_batch = max(self.largest_batch, len(rows))
+            self.write_ms += (time.perf_counter() - started) * 1000
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = 5.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def analytics_snapshot(self, days: int = 30) -> Dict[str, Any]:
+        with self._analytics_lock:
+            version = self._analytics_reader.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._analytics_version:
+                self.analytics.refresh(self._analytics_reader)
+                self._analytics_version = version
+        return self.analytics.snapshot(days)
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._readers, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            connection.execute("PRAGMA query_only=ON")
+            connection.row_factory = sqlite3.Row
+            self._readers.connection = connection
+        return connection
+
+    def query(self, limit: int = 50, cursor: Optional[str] = None, **filters: Optional[str]) -> Dict[str, Any]:
+        if limit < 1 or limit > 500:
+            raise HistoryError("limit must be between 1 and 500")
+
+        clauses, params = [], []
+        for name, value in filters.items():
+            if name not in FILTER_COLUMNS:
+                raise HistoryError(f"Unknown history filter: {name}")
+            if value is not None:
+                if name in ("since", "until"):
+                    try:
+                        datetime.strptime(value, "%Y-%m-%d")
+                    except ValueError:
+                        raise HistoryError(f"{name} must be a date in YYYY-MM-DD format")
+                clauses.append(FILTER_COLUMNS[name])
+                params.append(value)
+        if cursor is not None:
+            try:
+                before_id = int(cursor)
+            except ValueError:
+                raise HistoryError(f"Invalid cursor: {cursor}")
+            clauses.append("id < ?")
+            params.append(before_id)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._reader().execute(
+            f"SELECT {SUMMARY_COLUMNS} FROM analyses {where} ORDER BY id DESC LIMIT ?",
+            params + [limit + 1]
+        ).fetchall()
+
+        items = [self._summary(row) for row in rows[:limit]]
+        return {
+            "items": items,
+            "next_cursor": str(items[-1]["id"]) if len(rows) > limit else None
+        }
+
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        row = self._reader().execute(
+            f"SELECT {SUMMARY_COLUMNS}, result FROM analyses WHERE id = ?", (record_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {**self._summary(row), "result": json.loads(row["result"])}
+
+    @staticmethod
+    def _summary(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "timestamp": datetime.fromtimestamp(row["created_at"], timezone.utc).isoformat(),
+            "description": row["text"],
+            "text_hash": row["text_hash"],
+            "language": row["language"],
+            "category": row["category"],
+            "subcategory": row["subcategory"],
+            "severity": {"score": row["severity_score"], "level": row["severity_level"]},
+            "timeline_days": row["timeline_days"],
+            "corruption_risk_level": row["corruption_risk_level"],
+            "sections": [{"code": code} for code in row["ipc_codes"].split(",")] if row["ipc_codes"] else [],
+            "rules_version": row["rules_version"]
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "last_error": self.last_error,
+                "largest_batch": self.largest_batch,
+                "mean_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+                "mean_write_ms": round(self.write_ms / self.batches, 3) if self.batches else 0.0
+            }
@@ -0,0 +1,109 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+class MatchResult:
+    __slots__ = ("hits", "keywords")
+
+    def __init__(self, hits: List[Tuple[int, int, str]]):
+        self.hits = hits
+        self.keywords: Set[str] = {keyword for _, _, keyword in hits}
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.keywords
+
+    def found(self, keywords: Iterable[str]) -> List[str]:
+        return [keyword for keyword in keywords if keyword in self.keywords]
+
+    def to_list(self) -> List[Dict[str, object]]:
+        return [{"start": start, "end": end, "keyword": keyword} for start, end, keyword in self.hits]
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str] = ()):
+        self._keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._alphabet: Set[str] = set()
+        self._compiled = False
+        for keyword in keywords:
+            self.add(keyword)
+        self.compile()
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    def add(self, keyword: str):
+        keyword = keyword.lower()
+        if not keyword or keyword in self._keywords:
+            return
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append(keyword)
+        self._keywords.append(keyword)
+        self._alphabet.update(keyword)
+        self._compiled = False
+
+    def compile(self):
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + [
+                    keyword for keyword in self._output[self._fail[next_state]]
+                    if keyword not in self._output[next_state]
+                ]
+
+        self._compiled = True
+
+    def scan(self, text: str) -> MatchResult:
+        if not self._compiled:
+            self.compile()
+
+        lowered = text.lower()
+        positions = None
+        if len(lowered) != len(text):
+            lowered = "".join(char.lower() for char in text)
+            positions = [index for index, char in enumerate(text) for _ in char.lower()]
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        hits = []
+        state = 0
+        for index, char in enumerate(lowered):
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                start = index + 1 - len(keyword)
+                if positions is None:
+                    hits.append((start, index + 1, keyword))
+                else:
+                    hits.append((positions[start], positions[index] + 1, keyword))
+
+        return MatchResult(hits)
@@ -0,0 +1,31 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from utils.keyword_matcher import MatchResult
+
+def presence_matrix(matches: Sequence[MatchResult], keywords: Sequence[str]) -> np.ndarray:
+    columns = {keyword: column for column, keyword in enumerate(keywords)}
+    presence = np.zeros((len(matches), len(keywords)), dtype=np.int64)
+    for row, result in enumerate(matches):
+        for keyword in result.keywords:
+            column = columns.get(keyword)
+            if column is not None:
+                presence[row, column] = 1
+    return presence
+
+def membership_matrix(groups: Dict[str, List[str]]) -> Tuple[List[str], np.ndarray]:
+    keywords = []
+    index = {}
+    for group_keywords in groups.values():
+        for keyword in group_keywords:
+            if keyword not in index:
+                index[keyword] = len(keywords)
+                keywords.append(keyword)
+
+    membership = np.zeros((len(keywords), len(groups)), dtype=np.int64)
+    for column, group_keywords in enumerate(groups.values()):
+        for keyword in group_keywords:
+            membership[index[keyword], column] += 1
+
+    return keywords, membership
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+class LazyComponents(Mapping):
+    def __init__(self, factories: Dict[str, Callable[["LazyComponents"], Any]],
+                 refresh: Optional[Callable[["LazyComponents"], Any]] = None):
+        self._factories = dict(factories)
+        self._refresh = refresh
+        self._instances: Dict[str, Any] = {}
+        self._locks = {name: threading.Lock() for name in self._factories}
+        self._swap_lock = threading.Lock()
+        self.generation = 0
+        self.load_ms: Dict[str, float] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        if name not in self._factories:
+            raise KeyError(name)
+
+        with self._locks[name]:
+            while True:
+                instance = self._instances.get(name)
+                if instance is not None:
+                    return instance
+
+                generation = self.generation
+                started = time.perf_counter()
+                instance = self._factories[name](self)
+                with self._swap_lock:
+                    if generation == self.generation:
+                        self._instances[name] = instance
+                        self.load_ms[name] = round((time.perf_counter() - started) * 1000, 3)
+                        return instance
+
+    def previous(self, name: str) -> Any:
+        return None
+
+    def refresh(self):
+        if self._refresh is not None:
+            self._refresh(self)
+
+    def rebuild(self, names: Iterable[str], overrides: Optional[Dict[str, Any]] = None) -> List[str]:
+        names = [name for name in names if name in self._factories]
+        current = self._instances
+        staged = _StagedComponents(self, {
+            name: instance for name, instance in current.items() if name not in names
+        }, current)
+        staged._instances.update(overrides or {})
+
+        rebuilt = []
+        for name in names:
+            if name in current and name not in staged._instances:
+                staged[name]
+            if name in staged._instances:
+                rebuilt.append(name)
+
+        with self._swap_lock:
+            instances = {name: instance for name, instance in self._instances.items() if name not in names}
+            for name, instance in staged._instances.items():
+                instances.setdefault(name, instance)
+            self._instances = instances
+            self.generation += 1
+            self.load_ms.update(staged.load_ms)
+        return rebuilt
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def loaded(self) -> List[str]:
+        return [name for name in self._factories if name in self._instances]
+
+    def preload(self, names: Optional[Iterable[str]] = None):
+        for name in (names if names is not None else self._factories):
+            self[name]
+
+    def proxy(self, name: str) -> "ComponentProxy":
+        if name not in self._factories:
+            raise KeyError(name)
+        return ComponentProxy(self, name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "components": len(self._factories),
+            "loaded": self.loaded(),
+            "load_ms": dict(self.load_ms)
+        }
+
+class _StagedComponents(LazyComponents):
+    def __init__(self, components: LazyComponents, instances: Dict[str, Any], replaced: Dict[str, Any]):
+        super().__init__(components._factories)
+        self._instances = instances
+        self._replaced = replaced
+
+    def previous(self, name: str) -> Any:
+        return self._replaced.get(name)
+
+class ComponentProxy:
+    def __init__(self, components: LazyComponents, name: str):
+        object.__setattr__(self, "_components", components)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._components[self._name], attribute)
+
+    def __setattr__(self, attribute: str, value: Any):
+        setattr(self._components[self._name], attribute, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._components.is_loaded(self._name) else "not loaded"
+        return f"<ComponentProxy {self._name} ({state})>"
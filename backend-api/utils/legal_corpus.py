@@ -0,0 +1,385 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "assets", "datasets")
+IPC_BNS_PATH = os.path.join(DATASET_DIR, "ipc_bns.json")
+LEGAL_ACTS_PATH = os.path.join(DATASET_DIR, "legal_acts.json")
+
+MAGIC = b"EQLCORP1"
+FORMAT_VERSION = 1
+TABLES = ["ipc", "bns", "category", "act_category", "term"]
+
+SECTION_CATEGORIES = [
+    (354, 354, "Women & Children"),
+    (375, 376, "Women & Children"),
+    (299, 377, "Body Offenses"),
+    (378, 489, "Property Offenses")
+]
+SECTION_CATEGORY_OVERRIDES = {
+    "304B": "Women & Children",
+    "498A": "Women & Children",
+    "509": "Women & Children"
+}
+DEFAULT_SECTION_CATEGORY = "Public Order"
+
+_token_pattern = re.compile(r"[a-z0-9]+")
+_code_pattern = re.compile(r"^(\d+)([A-Z]*)$")
+_code_prefix_pattern = re.compile(r"^(IPC|BNS|SECTION|SEC\.?|U/S)\s*", re.IGNORECASE)
+
+def tokenize(text: str) -> List[str]:
+    return _token_pattern.findall(text.lower())
+
+def normalize_section_code(code: Any) -> str:
+    code = str(code).strip()
+    previous = None
+    while previous != code:
+        previous = code
+        code = _code_prefix_pattern.sub("", code).strip()
+    return code.replace(" ", "").upper()
+
+def section_category(code: str) -> str:
+    if code in SECTION_CATEGORY_OVERRIDES:
+        return SECTION_CATEGORY_OVERRIDES[code]
+    match = _code_pattern.match(code)
+    if match:
+        number = int(match.group(1))
+        for low, high, category in SECTION_CATEGORIES:
+            if low <= number <= high:
+                return category
+    return DEFAULT_SECTION_CATEGORY
+
+def dataset_fingerprint(*paths: str) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\x1f")
+    return digest.hexdigest()[:12]
+
+def load_records(ipc_bns_path: str = IPC_BNS_PATH,
+                 legal_acts_path: str = LEGAL_ACTS_PATH) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    with open(ipc_bns_path, "r", encoding="utf-8") as f:
+        mappings = json.load(f)
+    with open(legal_acts_path, "r", encoding="utf-8") as f:
+        acts = json.load(f)
+
+    metadata = {}
+    records = []
+    for key, entry in mappings.items():
+        if not isinstance(entry, dict) or "ipc" not in entry:
+            metadata = entry
+            continue
+        code = normalize_section_code(key)
+        records.append({
+            "kind": "section",
+            "key": code,
+            "title": entry["ipc"].get("title", ""),
+            "document": {
+                "ipc_section": code,
+                "category": entry.get("category") or section_category(code),
+                **entry
+            }
+        })
+
+    for act in acts:
+        records.append({
+            "kind": "act",
+            "key": str(act.get("id")),
+            "title": act.get("name", ""),
+            "document": act
+        })
+    return metadata, records
+
+def record_text(record: Dict[str, Any]) -> str:
+    document = record["document"]
+    if record["kind"] == "section":
+        parts = [f"ipc {record['key']}"]
+        for side in ("ipc", "bns"):
+            details = document.get(side, {})
+            parts.extend([f"{side} {details.get('code', '')}", details.get("title", ""),
+                          details.get("description", "")])
+        parts.extend(document.get("changes", []))
+        parts.append(document.get("impact", ""))
+    else:
+        parts = [document.get("name", ""), document.get("category", ""), document.get("summary", "")]
+        parts.extend(document.get("key_features", []))
+    return " ".join(str(part) for part in parts if part)
+
+def _index_entries(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+    tables: Dict[str, Dict[str, List[int]]] = {name: {} for name in TABLES}
+
+    def add(table: str, key: str, record_id: int):
+        postings = tables[table].setdefault(key, [])
+        if not postings or postings[-1] != record_id:
+            postings.append(record_id)
+
+    for record_id, record in enumerate(records):
+        document = record["document"]
+        if record["kind"] == "section":
+            add("ipc", record["key"], record_id)
+            bns_code = normalize_section_code(document.get("bns", {}).get("code", ""))
+            if _code_pattern.match(bns_code):
+                add("bns", bns_code, record_id)
+            add("category", document["category"].lower(), record_id)
+        else:
+            add("act_category", str(document.get("category", "")).lower(), record_id)
+
+        for token in sorted(set(tokenize(record_text(record)))):
+            add("term", token, record_id)
+    return tables
+
+class _BlobWriter:
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.offset = 0
+        self.blobs: Dict[str, List[int]] = {}
+
+    def add(self, name: str, payload: bytes):
+        padding = (-self.offset) % 8
+        if padding:
+            self.chunks.append(b"\0" * padding)
+            self.offset += padding
+        self.blobs[name] = [self.offset, len(payload)]
+        self.chunks.append(payload)
+        self.offset += len(payload)
+
+def build_corpus_file(output_path: str, ipc_bns_path: str = IPC_BNS_PATH,
+                      legal_acts_path: str = LEGAL_ACTS_PATH) -> str:
+    metadata, records = load_records(ipc_bns_path, legal_acts_path)
+    writer = _BlobWriter()
+
+    encoded = [json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+               for record in records]
+    record_index = np.zeros((len(encoded), 2), dtype=np.uint64)
+    position = 0
+    for record_id, payload in enumerate(encoded):
+        record_index[record_id] = (position, len(payload))
+        position += len(payload)
+    writer.add("records", b"".join(encoded))
+    writer.add("record_index", record_index.tobytes())
+
+    table_sizes = {}
+    for table, entries in _index_entries(records).items():
+        keys = sorted(entries, key=lambda key: key.encode("utf-8"))
+        key_bytes = [key.encode("utf-8") for key in keys]
+        key_index = np.zeros((len(keys), 2), dtype=np.uint64)
+        posting_index = np.zeros((len(keys), 2), dtype=np.uint64)
+        postings: List[int] = []
+        key_position = 0
+        for position, (key, raw) in enumerate(zip(keys, key_bytes)):
+            key_index[position] = (key_position, len(raw))
+            posting_index[position] = (len(postings), len(entries[key]))
+            key_position += len(raw)
+            postings.extend(entries[key])
+
+        writer.add(f"{table}.keys", b"".join(key_bytes))
+        writer.add(f"{table}.key_index", key_index.tobytes())
+        writer.add(f"{table}.posting_index", posting_index.tobytes())
+        writer.add(f"{table}.postings", np.asarray(postings, dtype=np.uint32).tobytes())
+        table_sizes[table] = len(keys)
+
+    header = json.dumps({
+        "format_version": FORMAT_VERSION,
+        "fingerprint": dataset_fingerprint(ipc_bns_path, legal_acts_path),
+        "metadata": metadata,
+        "records": len(records),
+        "tables": table_sizes,
+        "blobs": writer.blobs
+    }, ensure_ascii=False).encode("utf-8")
+    data_start = len(MAGIC) + 8 + len(header)
+    data_start += (-data_start) % 8
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".legal-corpus-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(b"\0" * (data_start - len(MAGIC) - 8 - len(header)))
+            for chunk in writer.chunks:
+                f.write(chunk)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return output_path
+
+class LegalCorpus:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a legal corpus index")
+        header_length = struct.unpack_from("<Q", self._mm, len(MAGIC))[0]
+        header_end = len(MAGIC) + 8 + header_length
+        header = json.loads(self._mm[len(MAGIC) + 8:header_end].decode("utf-8"))
+        if header["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported legal corpus format: {header['format_version']}")
+
+        self.fingerprint = header["fingerprint"]
+        self.metadata = header["metadata"]
+        self.record_count = header["records"]
+        self.table_sizes = header["tables"]
+        self._data_start = header_end + (-header_end) % 8
+        self._blobs = header["blobs"]
+
+        self._record_index = self._array("record_index", np.uint64).reshape(-1, 2)
+        self._tables = {
+            table: (
+                self._array(f"{table}.key_index", np.uint64).reshape(-1, 2),
+                self._array(f"{table}.posting_index", np.uint64).reshape(-1, 2),
+                self._array(f"{table}.postings", np.uint32),
+                self._blob_offset(f"{table}.keys")
+            )
+            for table in TABLES
+        }
+        self._records_offset = self._blob_offset("records")
+
+    def _blob_offset(self, name: str) -> int:
+        return self._data_start + self._blobs[name][0]
+
+    def _array(self, name: str, dtype) -> np.ndarray:
+        offset, length = self._blobs[name]
+        return np.frombuffer(self._mm, dtype=dtype, count=length // np.dtype(dtype).itemsize,
+                             offset=self._data_start + offset)
+
+    def _key(self, table: str, position: int) -> bytes:
+        key_index, _, _, keys_offset = self._tables[table]
+        start, length = key_index[position]
+        start = keys_offset + int(start)
+        return self._mm[start:start + int(length)]
+
+    def _search_keys(self, table: str, key: bytes) -> int:
+        low, high = 0, self.table_sizes[table]
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(table, middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _postings(self, table: str, position: int) -> np.ndarray:
+        _, posting_index, postings, _ = self._tables[table]
+        start, count = posting_index[position]
+        return postings[int(start):int(start) + int(count)]
+
+    def postings(self, table: str, key: str) -> np.ndarray:
+        raw = key.encode("utf-8")
+        position = self._search_keys(table, raw)
+        if position < self.table_sizes[table] and self._key(table, position) == raw:
+            return self._postings(table, position)
+        return np.zeros(0, dtype=np.uint32)
+
+    def keys(self, table: str, prefix: str = "") -> List[str]:
+        raw = prefix.encode("utf-8")
+        position = self._search_keys(table, raw)
+        keys = []
+        while position < self.table_sizes[table]:
+            key = self._key(table, position)
+            if not key.startswith(raw):
+                break
+            keys.append(key.decode("utf-8"))
+            position += 1
+        return keys
+
+    def record(self, record_id: int) -> Dict[str, Any]:
+        start, length = self._record_index[record_id]
+        start = self._records_offset + int(start)
+        return json.loads(self._mm[start:start + int(length)].decode("utf-8"))
+
+    def records(self, record_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self.record(int(record_id)) for record_id in record_ids]
+
+    def get_by_ipc(self, code: str) -> Optional[Dict[str, Any]]:
+        record_ids = self.postings("ipc", normalize_section_code(code))
+        return self.record(int(record_ids[0]))["document"] if len(record_ids) else None
+
+    def get_by_bns(self, code: str) -> List[Dict[str, Any]]:
+        return [record["document"] for record in self.records(self.postings("bns", normalize_section_code(code)))]
+
+    def get_by_category(self, category: str) -> List[Dict[str, Any]]:
+        return [record["document"] for record in self.records(self.postings("category", category.lower()))]
+
+    def categories(self) -> List[str]:
+        return self.metadata.get("categories") or self.keys("category")
+
+    def acts(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        if category:
+            record_ids = self.postings("act_category", category.lower())
+        else:
+            record_ids = [record_id for record_id in range(self.record_count)]
+        return [record["document"] for record in self.records(record_ids) if record["kind"] == "act"]
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        matched: Optional[np.ndarray] = None
+        for token in sorted(set(tokens), key=lambda token: len(self.postings("term", token))):
+            postings = self.postings("term", token)
+            matched = postings if matched is None else np.intersect1d(matched, postings, assume_unique=True)
+            if not len(matched):
+                return []
+
+        results = []
+        for record in self.records(matched):
+            if kind is None or record["kind"] == kind:
+                results.append(record)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "fingerprint": self.fingerprint,
+            "size_bytes": len(self._mm),
+            "records": self.record_count,
+            "tables": dict(self.table_sizes)
+        }
+
+    def close(self):
+        self._record_index = None
+        self._tables = {}
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+_build_lock = threading.Lock()
+
+def open_legal_corpus(ipc_bns_path: str = IPC_BNS_PATH, legal_acts_path: str = LEGAL_ACTS_PATH,
+                      index_path: Optional[str] = None) -> LegalCorpus:
+    fingerprint = dataset_fingerprint(ipc_bns_path, legal_acts_path)
+    path = index_path or os.path.join(tempfile.gettempdir(), f"equicourt-legal-corpus-{fingerprint}.bin")
+
+    with _build_lock:
+        if os.path.exists(path):
+            try:
+                corpus = LegalCorpus(path)
+            except (ValueError, KeyError, struct.error):
+                corpus = None
+            if corpus is not None and corpus.fingerprint == fingerprint:
+                return corpus
+            if corpus is not None:
+                corpus.close()
+        build_corpus_file(path, ipc_bns_path, legal_acts_path)
+    return LegalCorpus(path)
@@ -0,0 +1,305 @@
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.legal_corpus import IPC_BNS_PATH, LEGAL_ACTS_PATH, load_records, record_text, tokenize
+
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+MAX_QUERY_LENGTH = 512
+MAX_FUZZY_TOKEN_LENGTH = 20
+
+class LegalSearchError(ValueError):
+    pass
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {word[:index] + word[index + 1:] for word in frontier for index in range(len(word))}
+        variants |= frontier
+    return variants
+
+def edit_distance(left: str, right: str, limit: int) -> int:
+    if abs(len(left) - len(right)) > limit:
+        return limit + 1
+
+    previous = list(range(len(right) + 1))
+    for row, left_char in enumerate(left, 1):
+        current = [row]
+        for column, right_char in enumerate(right, 1):
+            current.append(min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (left_char != right_char)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+class LegalSearchIndex:
+    def __init__(self, ipc_bns_path: str = IPC_BNS_PATH, legal_acts_path: str = LEGAL_ACTS_PATH,
+                 k1: float = 1.2, b: float = 0.75, title_boost: int = 2,
+                 max_fuzzy_distance: int = 2, check_interval_seconds: float = 5.0):
+        self.paths = (ipc_bns_path, legal_acts_path)
+        self.k1 = k1
+        self.b = b
+        self.title_boost = title_boost
+        self.max_fuzzy_distance = max_fuzzy_distance
+        self.check_interval_seconds = check_interval_seconds
+
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._terms: List[str] = []
+        self._deletes: Dict[str, Set[str]] = {}
+        self._total_length = 0
+
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._next_check = 0.0
+        self.refreshes = 0
+        self.documents_added = 0
+        self.documents_updated = 0
+        self.documents_removed = 0
+        self.last_refresh_ms: Optional[float] = None
+        self.refresh_error: Optional[str] = None
+
+        self.refresh()
+
+    def _file_signature(self) -> Tuple:
+        signature = []
+        for path in self.paths:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _analyze(self, record: Dict[str, Any]) -> Counter:
+        terms = Counter(tokenize(record_text(record)))
+        for token in tokenize(record["title"]):
+            terms[token] += self.title_boost - 1
+        return terms
+
+    def refresh(self) -> Dict[str, int]:
+        with self._refresh_lock:
+            started = time.perf_counter()
+            signature = self._file_signature()
+            _, records = load_records(*self.paths)
+
+            incoming = {}
+            for record in records:
+                doc_id = f"{record['kind']}:{record['key']}"
+                payload = json.dumps(record, sort_keys=True, ensure_ascii=False)
+                incoming[doc_id] = (hashlib.sha256(payload.encode("utf-8")).hexdigest(), record)
+
+            changed = {doc_id: (digest, record, self._analyze(record))
+                       for doc_id, (digest, record) in incoming.items()
+                       if self._hashes.get(doc_id) != digest}
+            removed = [doc_id for doc_id in self._hashes if doc_id not in incoming]
+
+            with self._lock:
+                for doc_id in removed:
+                    self._remove_document(doc_id)
+                for doc_id, (digest, record, terms) in changed.items():
+                    if doc_id in self._hashes:
+                        self._remove_document(doc_id)
+                        self.documents_updated += 1
+                    else:
+                        self.documents_added += 1
+                    self._add_document(doc_id, digest, record, terms)
+                self.documents_removed += len(removed)
+
+            self._signature = signature
+            self._next_check = time.monotonic() + self.check_interval_seconds
+            self.refreshes += 1
+            self.refresh_error = None
+            self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+            return {"added_or_updated": len(changed), "removed": len(removed)}
+
+    def _add_document(self, doc_id: str, digest: str, record: Dict[str, Any], terms: Counter):
+        self._documents[doc_id] = record
+        self._hashes[doc_id] = digest
+        self._lengths[doc_id] = sum(terms.values())
+        self._total_length += self._lengths[doc_id]
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._terms, term)
+                for variant in self._term_deletes(term):
+                    self._deletes.setdefault(variant, set()).add(term)
+            postings[doc_id] = frequency
+
+    def _remove_document(self, doc_id: str):
+        record = self._documents.pop(doc_id)
+        self._hashes.pop(doc_id)
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in self._analyze(record):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
+                for variant in self._term_deletes(term):
+                    terms = self._deletes.get(variant)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._deletes[variant]
+
+    def _term_deletes(self, term: str) -> Set[str]:
+        if len(term) > MAX_FUZZY_TOKEN_LENGTH + self.max_fuzzy_distance:
+            return set()
+        return _deletes(term, self.max_fuzzy_distance)
+
+    def maybe_refresh(self):
+        if time.monotonic() < self._next_check or self._refresh_lock.locked():
+            return
+        self._next_check = time.monotonic() + self.check_interval_seconds
+
+        try:
+            if self._file_signature() == self._signature:
+                return
+        except OSError as e:
+            self.refresh_error = str(e)
+            return
+
+        def refresh_quietly():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.refresh_error = str(e)
+
+        threading.Thread(target=refresh_quietly, name="legal-search-refresh", daemon=True).start()
+
+    def _prefix_terms(self, token: str) -> List[str]:
+        expanded = []
+        for position in range(bisect.bisect_left(self._terms, token), len(self._terms)):
+            term = self._terms[position]
+            if not term.startswith(token):
+                break
+            if term != token:
+                expanded.append(term)
+        return expanded
+
+    def _fuzzy_terms(self, token: str) -> List[str]:
+        max_distance = 1 if len(token) <= 5 else self.max_fuzzy_distance
+        candidates: Set[str] = set()
+        for variant in _deletes(token, max_distance):
+            candidates |= self._deletes.get(variant, set())
+        return sorted(term for term in candidates
+                      if term != token and edit_distance(token, term, max_distance) <= max_distance)
+
+    def expand(self, token: str, prefix: bool = True, fuzzy: bool = True) -> Dict[str, float]:
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if prefix and len(token) >= 3:
+            for term in self._prefix_terms(token):
+                expansions.setdefault(term, PREFIX_WEIGHT)
+        if fuzzy and not expansions and 4 <= len(token) <= MAX_FUZZY_TOKEN_LENGTH and not token.isdigit():
+            for term in self._fuzzy_terms(token):
+                expansions[term] = FUZZY_WEIGHT
+        return expansions
+
+    def _idf(self, term: str) -> float:
+        frequency = len(self._postings[term])
+        return math.log(1 + (len(self._documents) - frequency + 0.5) / (frequency + 0.5))
+
+    def search(self, query: str, kind: Optional[str] = None, page: int = 1, page_size: int = 10,
+               prefix: bool = True, fuzzy: bool = True) -> Dict[str, Any]:
+        if len(query) > MAX_QUERY_LENGTH:
+            raise LegalSearchError(f"Query must be at most {MAX_QUERY_LENGTH} characters")
+        self.maybe_refresh()
+        needed = page * page_size
+
+        with self._lock:
+            average_length = self._total_length / len(self._documents) if self._documents else 0.0
+            expansions = {}
+            query_terms: Dict[str, Tuple[int, float]] = {}
+            for position, token in enumerate(dict.fromkeys(tokenize(query))):
+                expansions[token] = self.expand(token, prefix, fuzzy)
+                for term, weight in expansions[token].items():
+                    if query_terms.get(term, (0, 0.0))[1] < weight:
+                        query_terms[term] = (position, weight)
+
+            weighted = []
+            for term, (position, weight) in query_terms.items():
+                idf = self._idf(term)
+                weighted.append((weight * idf * (self.k1 + 1), term, position, weight * idf))
+            weighted.sort(reverse=True)
+
+            token_scores: Dict[str, Dict[int, float]] = {}
+            remaining_bound = sum(bound for bound, _, _, _ in weighted)
+            exhaustive = True
+            for bound, term, position, term_weight in weighted:
+                admit_new = True
+                if len(token_scores) >= needed:
+                    threshold = heapq.nlargest(needed, (sum(scores.values()) for scores in token_scores.values()))[-1]
+                    admit_new = remaining_bound > threshold
+                    exhaustive = exhaustive and admit_new
+                remaining_bound -= bound
+
+                for doc_id, frequency in self._postings[term].items():
+                    scores = token_scores.get(doc_id)
+                    if scores is None:
+                        if not admit_new or (kind and self._documents[doc_id]["kind"] != kind):
+                            continue
+                        scores = token_scores[doc_id] = {}
+                    length_norm = 1 - self.b + self.b * self._lengths[doc_id] / average_length
+                    score = term_weight * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+                    if score > scores.get(position, 0.0):
+                        scores[position] = score
+
+            ranked = heapq.nsmallest(
+                needed,
+                ((sum(scores.values()), doc_id) for doc_id, scores in token_scores.items()),
+                key=lambda item: (-item[0], item[1])
+            )
+            page_items = ranked[(page - 1) * page_size:needed]
+            results = [
+                {
+                    "kind": self._documents[doc_id]["kind"],
+                    "key": self._documents[doc_id]["key"],
+                    "title": self._documents[doc_id]["title"],
+                    "score": round(score, 4),
+                    "document": self._documents[doc_id]["document"]
+                }
+                for score, doc_id in page_items
+            ]
+
+        return {
+            "query": query,
+            "page": page,
+            "page_size": page_size,
+            "matched": len(token_scores),
+            "exhaustive": exhaustive,
+            "expansions": {token: sorted(terms) for token, terms in expansions.items()
+                           if set(terms) != {token}},
+            "results": results
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "terms": len(self._postings),
+                "refreshes": self.refreshes,
+                "documents_added": self.documents_added,
+                "documents_updated": self.documents_updated,
+                "documents_removed": self.documents_removed,
+                "last_refresh_ms": self.last_refresh_ms,
+                "refresh_error": self.refresh_error
+            }
@@ -1,58 +1,74 @@
-from typing import Dict, List, Any
-import re
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from utils.artifact_registry import ArtifactRegistry, default_registry
+from utils.factor_model import FactorModel
+from utils.keyword_matcher import KeywordMatcher, MatchResult
+from utils.rule_store import RuleSet, default_rules
+from utils.versioning import rules_fingerprint
 
 class LSSCalculator:
-    def __init__(self):
+    def __init__(self, artifacts: Optional[ArtifactRegistry] = None, rules: Optional[RuleSet] = None):
+        self.artifacts = artifacts or default_registry()
+        rules = rules or default_rules()
         self.factors = {
-            "violence_involved": {"weight": 0.25, "keywords": ["assault", "beat", "hit", "violence"]},
-            "weapon_mentioned": {"weight": 0.20, "keywords": ["knife", "gun", "weapon", "armed"]},
-            "public_place": {"weight": 0.15, "keywords": ["street", "market", "public", "bus", "train"]},
-            "financial_loss": {"weight": 0.15, "keywords": ["money", "cash", "valuables", "expensive"]},
-            "multiple_victims": {"weight": 0.10, "keywords": ["people", "crowd", "family", "others"]},
-            "premeditated": {"weight": 0.10, "keywords": ["planned", "followed", "waited", "targeted"]},
-            "digital_impact": {"weight": 0.05, "keywords": ["online", "social media", "digital", "cyber"]}
+            name: {"weight": data["weight"], "keywords": list(data["keywords"])}
+            for name, data in rules.factors.items()
         }
+        self.category_weights = dict(rules.category_weights)
         
-        self.category_weights = {
-            "Theft": 1.0,
-            "Assault": 1.5,
-            "Harassment": 1.2,
-            "Fraud": 1.1,
-            "Cybercrime": 1.3
-        }
+        self.compile()
     
-    def calculate_score(self, text: str, category: str) -> Dict[str, Any]:
-        text_lower = text.lower()
-        
-        factor_scores = {}
-        total_score = 0
+    def compile(self):
+        self.rules_version = rules_fingerprint(self.factors, self.category_weights, self.artifacts.version)
+        self.matcher = KeywordMatcher(self.keyword_vocabulary())
+        self.model = FactorModel(self.factors, self.category_weights)
+    
+    def keyword_vocabulary(self) -> List[str]:
+        return [keyword for data in self.factors.values() for keyword in data["keywords"]]
+    
+    def use_matcher(self, matcher: KeywordMatcher):
+        self.matcher = matcher
+    
+    def calculate_score(self, text: str, category: str, matches: Optional[MatchResult] = None,
+                        include_factors: bool = True) -> Dict[str, Any]:
+        if matches is None:
+            matches = self.matcher.scan(text)
         
-        for factor_name, factor_data in self.factors.items():
-            matches = sum(1 for keyword in factor_data["keywords"] if keyword in text_lower)
-            factor_score = min(1.0, matches * 0.3)
-            
-            factor_scores[factor_name] = {
-                "score": factor_score,
-                "weight": factor_data["weight"],
-                "contribution": factor_score * factor_data["weight"],
-                "evidence": [kw for kw in factor_data["keywords"] if kw in text_lower]
-            }
-            
-            total_score += factor_scores[factor_name]["contribution"]
+        factor_scores, category_weight, final_score = self.model.score_one(matches, category)
+        return self._result(final_score, category, category_weight, factor_scores, matches, include_factors)
+    
+    def calculate_score_batch(self, texts: List[str], categories: List[str],
+                              matches: Optional[List[MatchResult]] = None,
+                              include_factors: bool = True) -> List[Dict[str, Any]]:
+        if matches is None:
+            matches = [self.matcher.scan(text) for text in texts]
         
-        category_weight = self.category_weights.get(category, 1.0)
-        weighted_score = total_score * category_weight * 100
-        final_score = min(100, weighted_score)
-        severity_level = self._get_severity_level(final_score)
-        risk_assessment = self._assess_risk(final_score, category)
+        factor_scores, category_weights, final_scores = self.model.score(matches, categories)
         
-        return {
-            "score": round(final_score),
-            "level": severity_level,
-            "factors": factor_scores,
-            "category_weight": category_weight,
-            "risk_assessment": risk_assessment
-        }
+        factor_rows = factor_scores.tolist() if include_factors else [None] * len(categories)
+        return [
+            self._result(final_score, category, category_weight, factor_row, row_matches, include_factors)
+            for final_score, category, category_weight, factor_row, row_matches in zip(
+                final_scores.tolist(), categories, category_weights.tolist(), factor_rows, matches
+            )
+        ]
+    
+    def score_array(self, texts: List[str], categories: List[str],
+                    matches: Optional[List[MatchResult]] = None) -> np.ndarray:
+        if matches is None:
+            matches = [self.matcher.scan(text) for text in texts]
+        return self.model.score(matches, categories)[2]
+    
+    def _result(self, final_score: float, category: str, category_weight: float, factor_scores: Optional[List[float]],
+                matches: MatchResult, include_factors: bool) -> Dict[str, Any]:
+        result = {"score": round(final_score), "level": self._get_severity_level(final_score)}
+        if include_factors:
+            result["factors"] = self.model.breakdown(factor_scores, matches)
+        result["category_weight"] = category_weight
+        result["risk_assessment"] = self._assess_risk(final_score, category)
+        return result
     
     def _get_severity_level(self, score: float) -> str:
         if score >= 80:
@@ -64,23 +80,8 @@ class LSSCalculator:
     
     def _assess_risk(self, score: float, category: str) -> Dict[str, Any]:
         if score >= 80:
-            return {
-                "level": "Critical",
-                "recommendation": "Immediate police intervention required",
-                "timeline": "Within 24 hours",
-                "actions": ["File FIR immediately", "Preserve evidence", "Seek medical attention if injured"]
-            }
+            return self.artifacts.risk_assessments["Critical"]
         elif score >= 50:
-            return {
-                "level": "Moderate",
-                "recommendation": "Police complaint recommended",
-                "timeline": "Within 48 hours",
-                "actions": ["File police complaint", "Document evidence", "Consult legal advisor"]
-            }
+            return self.artifacts.risk_assessments["Moderate"]
         else:
-            return {
-                "level": "Low",
-                "recommendation": "Can file general diary or civil complaint",
-                "timeline": "Within 7 days",
-                "actions": ["File general diary", "Attempt mediation", "Consult local authorities"]
-            }
\ No newline at end of file
+            return self.artifacts.risk_assessments["Low"]
\ No newline at end of file
@@ -0,0 +1,232 @@
+import bisect
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+CollectorFunc = Callable[[], Iterable[Tuple[Labels, float]]]
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Tuple[str, ...], values: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[Labels, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in sorted(self.values().items())]
+
+    def summary(self) -> Dict[str, float]:
+        return {",".join(labels) or "total": value for labels, value in sorted(self.values().items())}
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float):
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+class CollectedMetric(Counter):
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str], collect: CollectorFunc,
+                 kind: str = "gauge"):
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+        self.kind = kind
+
+    def values(self) -> Dict[Labels, float]:
+        try:
+            return {tuple(labels): float(value) for labels, value in self.collect()}
+        except Exception:
+            return {}
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> Dict[Labels, List[float]]:
+        with self._lock:
+            return {labels: list(series) for labels, series in self._series.items()}
+
+    def quantile(self, series: List[float], fraction: float) -> float:
+        count = series[-1]
+        if not count:
+            return 0.0
+        rank = fraction * count
+        cumulative = 0.0
+        for index, bucket_count in enumerate(series[:len(self.buckets) + 1]):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[index] - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(self.snapshot().items()):
+            cumulative = 0.0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), series):
+                cumulative += bucket_count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, ('le', _format_value(bound)))} "
+                    f"{_format_value(cumulative)}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}")
+        return lines
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            ",".join(labels) or "total": {
+                "count": int(series[-1]),
+                "mean_ms": round(series[-2] / series[-1] * 1000, 3) if series[-1] else 0.0,
+                "p50_ms": round(self.quantile(series, 0.50) * 1000, 3),
+                "p95_ms": round(self.quantile(series, 0.95) * 1000, 3),
+                "p99_ms": round(self.quantile(series, 0.99) * 1000, 3)
+            }
+            for labels, series in sorted(self.snapshot().items())
+        }
+
+class MetricsRegistry:
+    def __init__(self, prefix: str = "equicourt"):
+        self.prefix = prefix
+        self.started_at = time.time()
+        self._metrics: Dict[str, Any] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(f"{self.prefix}_{name}", documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(f"{self.prefix}_{name}", documentation, labelnames))
+
+    def collected(self, name: str, documentation: str, labelnames: Iterable[str], collect: CollectorFunc,
+                  kind: str = "gauge") -> CollectedMetric:
+        return self._register(CollectedMetric(f"{self.prefix}_{name}", documentation, labelnames, collect, kind))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(f"{self.prefix}_{name}", documentation, labelnames, buckets))
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            **{name[len(self.prefix) + 1:]: metric.summary() for name, metric in self._metrics.items()}
+        }
+
+class MetricsMiddleware:
+    def __init__(self, app, requests: Counter, errors: Counter, latency: Histogram, in_flight: Gauge):
+        self.app = app
+        self.requests = requests
+        self.errors = errors
+        self.latency = latency
+        self.in_flight = in_flight
+        self._route_paths: Dict[Any, str] = {}
+
+    def _endpoint_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = self._route_paths[endpoint] = route.path
+                    break
+            else:
+                return "unmatched"
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight.dec()
+            endpoint = f"{scope['method']} {self._endpoint_label(scope)}"
+            code = status[0]
+            self.latency.observe(elapsed, endpoint)
+            self.requests.inc(endpoint, str(code))
+            if code >= 500:
+                self.errors.inc(endpoint, "server_error")
+            elif code >= 400:
+                self.errors.inc(endpoint, "client_error")
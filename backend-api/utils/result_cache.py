@@ -0,0 +1,89 @@
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.cache_backends import CacheBackend, MemoryCacheBackend
+
+class ResultCache:
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: Optional[float] = 600.0,
+                 error_backoff_seconds: float = 5.0):
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl_seconds = ttl_seconds
+        self.error_backoff_seconds = error_backoff_seconds
+        self._suspended_until = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def make_key(namespace: str, version: str, *parts: Any) -> str:
+        digest = hashlib.sha256()
+        for part in (namespace, version) + parts:
+            data = str(part).encode("utf-8")
+            digest.update(b"%d:" % len(data))
+            digest.update(data)
+        return f"{namespace}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        found, value = False, None
+        if not self._suspended():
+            try:
+                found, value = self.backend.get(key)
+            except Exception:
+                self._backend_failed()
+
+        self._count("hits" if found else "misses")
+        return found, value
+
+    def set(self, key: str, value: Any):
+        if self._suspended():
+            return
+        try:
+            self.backend.set(key, value, self.ttl_seconds)
+        except Exception:
+            self._backend_failed()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+
+        value = compute()
+        if cacheable is None or cacheable(value):
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        self.backend.clear()
+
+    def _suspended(self) -> bool:
+        return self._suspended_until > time.monotonic()
+
+    def _backend_failed(self):
+        with self._lock:
+            self.errors += 1
+            self._suspended_until = time.monotonic() + self.error_backoff_seconds
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            backend_stats = self.backend.stats()
+        except Exception as e:
+            backend_stats = {"backend": self.backend.name, "error": str(e)}
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                **backend_stats,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
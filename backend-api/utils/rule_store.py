@@ -0,0 +1,242 @@
+import functools
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.versioning import rules_fingerprint
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rules", "rules.json")
+
+VERSION_PATTERN = re.compile(r"[A-Za-z0-9._-]+")
+
+RULE_DEPENDENTS = [
+    "rules",
+    "artifacts",
+    "normalizer",
+    "eccm_model",
+    "lss_calculator",
+    "ipc_mapper",
+    "doc_generator",
+    "timeline_predictor",
+    "corruption_detector",
+    "keyword_matcher",
+    "pipeline"
+]
+
+class RulesError(ValueError):
+    pass
+
+def _expect(condition: bool, message: str):
+    if not condition:
+        raise RulesError(message)
+
+def _expect_string_map(table: Any, name: str):
+    _expect(isinstance(table, dict), f"{name} must be an object")
+    for key, value in table.items():
+        _expect(isinstance(value, str), f"{name}.{key} must be a string")
+
+def _expect_string_list(value: Any, name: str):
+    _expect(isinstance(value, list) and all(isinstance(item, str) for item in value),
+            f"{name} must be a list of strings")
+
+def _expect_number(value: Any, name: str):
+    _expect(isinstance(value, (int, float)) and not isinstance(value, bool), f"{name} must be a number")
+
+def validate_rules(tables: Dict[str, Any]):
+    _expect(isinstance(tables, dict), "Rules file must contain a JSON object")
+    _expect(isinstance(tables.get("version"), str) and tables["version"], "version must be a non-empty string")
+    _expect(VERSION_PATTERN.fullmatch(tables["version"]) is not None,
+            "version may only contain letters, digits, '.', '_' and '-'")
+    for section in ["normalizer", "eccm", "lss", "ipc"]:
+        _expect(isinstance(tables.get(section), dict), f"{section} section is missing")
+
+    normalizer = tables["normalizer"]
+    for name in ["dialect_mappings", "spelling_corrections", "formalizations"]:
+        _expect_string_map(normalizer.get(name), f"normalizer.{name}")
+    _expect(isinstance(normalizer.get("regional_indicators"), dict), "normalizer.regional_indicators must be an object")
+    for language, words in normalizer["regional_indicators"].items():
+        _expect_string_list(words, f"normalizer.regional_indicators.{language}")
+
+    eccm = tables["eccm"]
+    _expect(isinstance(eccm.get("categories"), dict) and eccm["categories"], "eccm.categories must be a non-empty object")
+    for category, data in eccm["categories"].items():
+        _expect(isinstance(data, dict), f"eccm.categories.{category} must be an object")
+        _expect_string_list(data.get("keywords"), f"eccm.categories.{category}.keywords")
+        _expect(bool(data["keywords"]), f"eccm.categories.{category}.keywords must not be empty")
+        _expect_string_list(data.get("subcategories"), f"eccm.categories.{category}.subcategories")
+        _expect(bool(data["subcategories"]), f"eccm.categories.{category}.subcategories must not be empty")
+    _expect(isinstance(eccm.get("subcategory_hints"), dict), "eccm.subcategory_hints must be an object")
+    for category, hints in eccm["subcategory_hints"].items():
+        _expect(isinstance(hints, list), f"eccm.subcategory_hints.{category} must be a list")
+        for hint in hints:
+            _expect(isinstance(hint, dict) and isinstance(hint.get("subcategory"), str),
+                    f"eccm.subcategory_hints.{category} entries need a subcategory")
+            _expect_string_list(hint.get("keywords"), f"eccm.subcategory_hints.{category}.keywords")
+    _expect_string_list(eccm.get("strong_keywords"), "eccm.strong_keywords")
+
+    lss = tables["lss"]
+    _expect(isinstance(lss.get("factors"), dict) and lss["factors"], "lss.factors must be a non-empty object")
+    for factor, data in lss["factors"].items():
+        _expect(isinstance(data, dict), f"lss.factors.{factor} must be an object")
+        _expect_number(data.get("weight"), f"lss.factors.{factor}.weight")
+        _expect_string_list(data.get("keywords"), f"lss.factors.{factor}.keywords")
+    _expect(isinstance(lss.get("category_weights"), dict), "lss.category_weights must be an object")
+    for category, weight in lss["category_weights"].items():
+        _expect_number(weight, f"lss.category_weights.{category}")
+
+    _expect(isinstance(tables["ipc"].get("sections"), dict), "ipc.sections must be an object")
+    for category, sections in tables["ipc"]["sections"].items():
+        _expect(isinstance(sections, list), f"ipc.sections.{category} must be a list")
+        for section in sections:
+            _expect(isinstance(section, dict) and all(
+                isinstance(section.get(field), str) for field in ["code", "description", "punishment", "applicability"]
+            ), f"ipc.sections.{category} entries need code, description, punishment and applicability")
+
+class RuleSet:
+    def __init__(self, tables: Dict[str, Any], path: Optional[str] = None):
+        validate_rules(tables)
+        self.path = path
+        self.declared_version = tables["version"]
+        self.fingerprint = rules_fingerprint({key: value for key, value in tables.items() if key != "version"})
+        self.version = f"{self.declared_version}+{self.fingerprint}"
+        self.loaded_at = time.time()
+
+        normalizer, eccm, lss = tables["normalizer"], tables["eccm"], tables["lss"]
+        self.dialect_mappings: Dict[str, str] = normalizer["dialect_mappings"]
+        self.regional_indicators: Dict[str, List[str]] = normalizer["regional_indicators"]
+        self.spelling_corrections: Dict[str, str] = normalizer["spelling_corrections"]
+        self.formalizations: Dict[str, str] = normalizer["formalizations"]
+        self.categories: Dict[str, Dict[str, List[str]]] = eccm["categories"]
+        self.subcategory_hints: Dict[str, List[Tuple[str, List[str]]]] = {
+            category: [(hint["subcategory"], hint["keywords"]) for hint in hints]
+            for category, hints in eccm["subcategory_hints"].items()
+        }
+        self.strong_keywords: List[str] = eccm["strong_keywords"]
+        self.factors: Dict[str, Dict[str, Any]] = lss["factors"]
+        self.category_weights: Dict[str, float] = lss["category_weights"]
+        self.ipc_sections: Dict[str, List[Dict[str, str]]] = tables["ipc"]["sections"]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "declared_version": self.declared_version,
+            "fingerprint": self.fingerprint,
+            "path": self.path,
+            "loaded_at": self.loaded_at
+        }
+
+def load_rules(path: str = RULES_PATH) -> RuleSet:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tables = json.load(f)
+    except json.JSONDecodeError as e:
+        raise RulesError(f"Rules file {path} is not valid JSON: {e}")
+    return RuleSet(tables, path)
+
+@functools.lru_cache(maxsize=None)
+def default_rules() -> RuleSet:
+    return load_rules(os.environ.get("EQUICOURT_RULES_PATH") or RULES_PATH)
+
+class RuleWatcher:
+    def __init__(self, path: str, on_change: Callable[[RuleSet], None], interval_seconds: float = 2.0):
+        self.path = path
+        self.on_change = on_change
+        self.interval_seconds = interval_seconds
+        self.current: Optional[RuleSet] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.reloads = 0
+        self.rejected = 0
+        self.last_error: Optional[str] = None
+        self.last_reload_ms: Optional[float] = None
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> RuleSet:
+        with self._lock:
+            if self.current is None:
+                self._signature = self._file_signature()
+                self.current = load_rules(self.path)
+            return self.current
+
+    def reload(self, force: bool = True) -> bool:
+        with self._lock:
+            try:
+                signature = self._file_signature()
+                if not force and signature == self._signature:
+                    return False
+                self._signature = signature
+
+                started = time.perf_counter()
+                rules = load_rules(self.path)
+                if self.current is not None and rules.version == self.current.version:
+                    return False
+                self.on_change(rules)
+            except Exception as e:
+                self.rejected += 1
+                self.last_error = str(e)
+                raise
+
+            self.current = rules
+            self.reloads += 1
+            self.last_error = None
+            self.last_reload_ms = round((time.perf_counter() - started) * 1000, 3)
+            return True
+
+    def check(self) -> bool:
+        try:
+            return self.reload(force=False)
+        except Exception:
+            return False
+
+    def start(self):
+        if self._thread is not None or self.interval_seconds <= 0:
+            return
+
+        def watch():
+            while True:
+                time.sleep(self.interval_seconds)
+                self.check()
+
+        self._thread = threading.Thread(target=watch, name="rule-watcher", daemon=True)
+        self._thread.start()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "watching": self._thread is not None,
+            "interval_seconds": self.interval_seconds,
+            "current": self.current.describe() if self.current is not None else None,
+            "reloads": self.reloads,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+            "last_reload_ms": self.last_reload_ms
+        }
+
+class RulesVersionMiddleware:
+    def __init__(self, app, version: Callable[[], str], header: str = "x-rules-version"):
+        self.app = app
+        self.version = version
+        self.header = header.encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        version = self.version().encode("latin-1")
+
+        async def send_with_version(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if not any(name.lower() == self.header for name, _ in headers):
+                    message = {**message, "headers": headers + [(self.header, version)]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_version)
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+class SingleFlightOverflow(Exception):
+    def __init__(self, retry_after_seconds: int):
+        super().__init__("Too many requests are waiting on the same computation")
+        self.retry_after_seconds = retry_after_seconds
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.callers = 1
+
+def _fresh(error: BaseException) -> BaseException:
+    try:
+        clone = type(error).__new__(type(error), *error.args)
+        clone.__dict__.update(error.__dict__)
+    except Exception:
+        return error
+    return clone
+
+class SingleFlight:
+    def __init__(self, max_waiters: int = 64, retry_after_seconds: int = 1):
+        self.max_waiters = max_waiters
+        self.retry_after_seconds = retry_after_seconds
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.failures = 0
+        self.largest_group = 0
+
+    @staticmethod
+    def key(*parts: Any) -> Optional[Hashable]:
+        try:
+            hash(parts)
+        except TypeError:
+            return None
+        return parts
+
+    async def run(self, key: Optional[Hashable], compute: Callable[[], Awaitable[Any]]) -> Any:
+        if key is None:
+            return await compute()
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(compute()))
+            self._flights[key] = flight
+            self.executions += 1
+            flight.task.add_done_callback(lambda task: self._finish(key, flight))
+        elif flight.callers >= self.max_waiters:
+            self.rejected += 1
+            raise SingleFlightOverflow(self.retry_after_seconds)
+        else:
+            flight.callers += 1
+            self.coalesced += 1
+            self.largest_group = max(self.largest_group, flight.callers)
+
+        try:
+            await asyncio.wait({flight.task})
+        except asyncio.CancelledError:
+            flight.callers -= 1
+            raise
+
+        error = None if flight.task.cancelled() else flight.task.exception()
+        if error is not None:
+            raise _fresh(error) from error
+        return flight.task.result()
+
+    def _finish(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled() and flight.task.exception() is not None:
+            self.failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.executions + self.coalesced
+        return {
+            "in_flight": len(self._flights),
+            "max_waiters": self.max_waiters,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "failures": self.failures,
+            "largest_group": self.largest_group,
+            "coalesced_ratio": round(self.coalesced / requests, 4) if requests else 0.0
+        }
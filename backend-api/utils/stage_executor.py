@@ -0,0 +1,152 @@
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class ExecutorSaturated(Exception):
+    def __init__(self, retry_after_seconds: int):
+        super().__init__("Stage executor queue is full")
+        self.retry_after_seconds = retry_after_seconds
+
+class StageTimeout(Exception):
+    pass
+
+class ComponentVersionMismatch(Exception):
+    pass
+
+_worker_components: Optional[Dict[str, Any]] = None
+
+def _init_worker(factory: Callable[..., Dict[str, Any]], factory_kwargs: Dict[str, Any]):
+    global _worker_components
+    _worker_components = factory(**factory_kwargs)
+
+def _warm_up_worker(names: List[str]):
+    for name in names:
+        warm_up = getattr(_worker_components[name], "warm_up", None)
+        if callable(warm_up):
+            warm_up()
+
+def _invoke_in_worker(component: str, method: str, args: Tuple, kwargs: Dict[str, Any],
+                      version: Optional[str] = None) -> Any:
+    target = _worker_components[component]
+    if version is not None and target.rules_version != version:
+        _worker_components.refresh()
+        target = _worker_components[component]
+        if target.rules_version != version:
+            raise ComponentVersionMismatch(
+                f"{component} is at rules version {target.rules_version}, request pinned {version}"
+            )
+    return getattr(target, method)(*args, **kwargs)
+
+class StageExecutor:
+    def __init__(self, components: Dict[str, Any], mode: str = "thread",
+                 max_workers: Optional[int] = None, max_pending: int = 64,
+                 timeout_seconds: float = 10.0, retry_after_seconds: int = 1,
+                 factory: Optional[Callable[..., Dict[str, Any]]] = None,
+                 factory_kwargs: Optional[Dict[str, Any]] = None):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor mode: {mode}")
+        if mode == "process" and factory is None:
+            raise ValueError("Process mode needs a picklable component factory")
+
+        self.components = components
+        self.mode = mode
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_pending = max_pending
+        self.timeout_seconds = timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._factory = factory
+        self._factory_kwargs = factory_kwargs or {}
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.mode == "process":
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            initializer=_init_worker,
+                            initargs=(self._factory, self._factory_kwargs)
+                        )
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="equicourt-stage"
+                        )
+        return self._pool
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.max_pending:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def _release(self, _future=None):
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def call(self, component: str, method: str, *args: Any, timeout: Optional[float] = None,
+                   pinned: Any = None, **kwargs: Any) -> Any:
+        if not self._acquire():
+            raise ExecutorSaturated(self.retry_after_seconds)
+
+        try:
+            if self.mode == "process":
+                version = pinned.rules_version if pinned is not None else None
+                task = functools.partial(_invoke_in_worker, component, method, args, kwargs, version)
+            else:
+                target = pinned if pinned is not None else self.components[component]
+                task = functools.partial(getattr(target, method), *args, **kwargs)
+            future = self._get_pool().submit(task)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout if timeout is not None else self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise StageTimeout(f"{component}.{method} exceeded its time budget")
+
+    async def warm_up(self, names: List[str]):
+        pool = self._get_pool()
+        if self.mode == "process":
+            futures = [pool.submit(_warm_up_worker, names) for _ in range(self.max_workers)]
+        else:
+            futures = [pool.submit(time.sleep, 0) for _ in range(self.max_workers)]
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "timeout_seconds": self.timeout_seconds
+            }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+class Stage:
+    def __init__(self, name: str, func: StageFunc, depends_on: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+class StageGraph:
+    def __init__(self, stages: List[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        for stage in stages:
+            missing = [name for name in stage.depends_on if name not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {', '.join(missing)}")
+        self.order = self._topological_order()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.stages)
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, int] = {}
+
+        def visit(name: str):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Stage graph has a cycle through '{name}'")
+            state[name] = 1
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            state[name] = 2
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def plan(self, include: Optional[Iterable[str]] = None) -> List[str]:
+        if include is None:
+            return list(self.order)
+
+        requested = list(include)
+        unknown = [name for name in requested if name not in self.stages]
+        if unknown:
+            raise KeyError(", ".join(unknown))
+
+        needed: Set[str] = set()
+        pending = list(requested)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].depends_on)
+        return [name for name in self.order if name in needed]
+
+    async def run(self, include: Optional[Iterable[str]] = None) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        async for name, result, elapsed_ms in self.run_iter(include):
+            results[name] = result
+            timings[name] = elapsed_ms
+        return results, timings
+
+    async def run_iter(self, include: Optional[Iterable[str]] = None):
+        remaining = self.plan(include)
+        results: Dict[str, Any] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        async def timed(stage: Stage) -> Tuple[Any, float]:
+            started = time.perf_counter()
+            result = await stage.func(results)
+            return result, (time.perf_counter() - started) * 1000
+
+        try:
+            while remaining or running:
+                for name in [name for name in remaining
+                             if all(dependency in results for dependency in self.stages[name].depends_on)]:
+                    remaining.remove(name)
+                    running[asyncio.ensure_future(timed(self.stages[name]))] = name
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    result, elapsed_ms = task.result()
+                    results[name] = result
+                    yield name, result, round(elapsed_ms, 3)
+        finally:
+            for task in running:
+                task.cancel()
@@ -0,0 +1,100 @@
+import pytest
+
+from utils import analytics
+from utils.history_store import HistoryStore
+
+def analysis(category: str, score: int, level: str):
+    return {
+        "classification": {"category": category, "subcategory": "general"},
+        "severity": {"score": score, "level": level},
+        "timeline_prediction": {"estimated_duration_days": 90},
+        "corruption_risk": {"risk_score": 0.2, "risk_level": "low"}
+    }
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "history.sqlite3")
+
+def test_snapshot_counts_what_was_written(path):
+    store = HistoryStore(path, max_wait_ms=1)
+    store.record("a", "en", analysis("theft", 35, "medium"))
+    store.record("b", "en", analysis("theft", 95, "high"))
+    store.record("c", "en", analysis("fraud", 5, "low"))
+    store.flush()
+
+    snapshot = store.analytics_snapshot()
+    assert snapshot["total"] == 3
+    assert snapshot["categories"]["theft"]["count"] == 2
+    assert snapshot["categories"]["theft"]["means"]["severity_score"] == 65.0
+    assert snapshot["severity_histogram"]["30-39"] == 1
+    assert snapshot["severity_histogram"]["90-100"] == 1
+    assert len(snapshot["daily"]) == 1
+    store.close()
+
+def test_workers_sharing_a_file_agree(path):
+    first = HistoryStore(path, max_wait_ms=1)
+    second = HistoryStore(path, max_wait_ms=1)
+    assert second.analytics_snapshot()["total"] == 0
+
+    first.record("a", "en", analysis("theft", 40, "medium"))
+    first.flush()
+    second.record("b", "en", analysis("fraud", 80, "high"))
+    second.flush()
+
+    first_snapshot, second_snapshot = (
+        {key: value for key, value in store.analytics_snapshot().items() if key != "updated_at"}
+        for store in (first, second)
+    )
+    assert first_snapshot == second_snapshot
+    assert first_snapshot["total"] == 2
+    first.close()
+    second.close()
+
+def test_later_writes_are_applied_without_reloading_the_tables(path):
+    first = HistoryStore(path, max_wait_ms=1)
+    second = HistoryStore(path, max_wait_ms=1)
+    first.analytics_snapshot()
+    second.analytics_snapshot()
+
+    for index in range(5):
+        (first if index % 2 else second).record(str(index), "en", analysis("theft", 10 * index, "low"))
+        first.flush()
+        second.flush()
+        assert first.analytics_snapshot()["total"] == index + 1
+        assert second.analytics_snapshot()["total"] == index + 1
+
+    assert first.analytics.full_reloads == 1
+    assert second.analytics.full_reloads == 1
+    assert first.analytics_snapshot()["categories"]["theft"]["means"]["severity_score"] == 20.0
+    first.close()
+    second.close()
+
+def test_a_reader_behind_the_log_retention_reloads(path, monkeypatch):
+    monkeypatch.setattr(analytics, "LOG_RETENTION_BATCHES", 2)
+    reader = HistoryStore(path, max_wait_ms=1)
+    writer = HistoryStore(path, max_wait_ms=1)
+    reader.analytics_snapshot()
+
+    for index in range(4):
+        writer.record(str(index), "en", analysis("fraud", 50, "medium"))
+        writer.flush()
+
+    assert reader.analytics_snapshot()["total"] == 4
+    assert reader.analytics.full_reloads == 2
+    reader.close()
+    writer.close()
+
+def test_existing_history_is_backfilled_once(path):
+    store = HistoryStore(path, max_wait_ms=1)
+    store.record("a", "en", analysis("theft", 40, "medium"))
+    store.flush()
+    store._writer.execute("DELETE FROM daily_aggregates")
+    store._writer.commit()
+    store.close()
+
+    reopened = HistoryStore(path, max_wait_ms=1)
+    again = HistoryStore(path, max_wait_ms=1)
+    assert reopened.analytics_snapshot()["total"] == 1
+    assert again.analytics_snapshot()["total"] == 1
+    reopened.close()
+    again.close()
@@ -0,0 +1,144 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.corpus import SENTENCES
+from utils import bulk_processor
+from utils.bulk_processor import BulkProcessor, CheckpointMismatch, ResultWriter
+
+ROWS = 10
+
+def write_input(directory):
+    path = directory / "complaints.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(ROWS):
+            f.write(json.dumps({"case": f"C-{index}", "text": SENTENCES[index % len(SENTENCES)]}) + "\n")
+    return str(path)
+
+@pytest.fixture
+def input_path(tmp_path):
+    return write_input(tmp_path)
+
+def processor(input_path, output_path, **options):
+    options = {"chunk_size": 3, "workers": 1, "id_column": "case", "progress": io.StringIO(), **options}
+    return BulkProcessor(input_path, str(output_path), **options)
+
+def read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+class Interrupted(Exception):
+    pass
+
+def interrupt_at_chunk(monkeypatch, stop_at):
+    write_chunk = ResultWriter.write_chunk
+
+    def write_until(self, chunk_index, records):
+        if chunk_index == stop_at:
+            if self.output_format == "jsonl":
+                with open(self.path, "ab") as f:
+                    f.write(b'{"id": "torn')
+            raise Interrupted()
+        return write_chunk(self, chunk_index, records)
+
+    monkeypatch.setattr(ResultWriter, "write_chunk", write_until)
+
+@pytest.fixture(scope="module")
+def reference(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("reference")
+    summary = processor(write_input(directory), directory / "out.jsonl").run()
+    return summary, read_jsonl(directory / "out.jsonl")
+
+def test_full_run_writes_every_row_in_order(reference):
+    summary, records = reference
+    assert summary["rows"] == ROWS and summary["errors"] == 0
+    assert [record["id"] for record in records] == [f"C-{index}" for index in range(ROWS)]
+    assert [record["row"] for record in records] == list(range(ROWS))
+    assert all(record["status"] == "ok" for record in records)
+
+def test_interrupted_jsonl_run_resumes_to_the_same_output(input_path, tmp_path, monkeypatch, reference):
+    output_path = tmp_path / "out.jsonl"
+    with monkeypatch.context() as patch:
+        interrupt_at_chunk(patch, 2)
+        with pytest.raises(Interrupted):
+            processor(input_path, output_path).run()
+
+    checkpoint = json.loads((tmp_path / "out.jsonl.checkpoint.json").read_text(encoding="utf-8"))
+    assert checkpoint["chunks_done"] == 2 and checkpoint["rows_done"] == 6
+
+    progress = io.StringIO()
+    summary = processor(input_path, output_path, progress=progress).run()
+    assert "resuming after chunk 2 (6 rows)" in progress.getvalue()
+    assert summary["rows"] == ROWS
+    assert read_jsonl(output_path) == reference[1]
+
+def test_interrupted_csv_run_keeps_finished_parts(input_path, tmp_path, monkeypatch):
+    output_path = tmp_path / "parts"
+    with monkeypatch.context() as patch:
+        interrupt_at_chunk(patch, 1)
+        with pytest.raises(Interrupted):
+            processor(input_path, output_path, output_format="csv").run()
+    finished = (output_path / "part-00000.csv").stat().st_mtime_ns
+
+    processor(input_path, output_path, output_format="csv").run()
+    parts = sorted(path.name for path in output_path.iterdir())
+    assert parts == [f"part-{index:05d}.csv" for index in range(4)]
+    assert (output_path / "part-00000.csv").stat().st_mtime_ns == finished
+    frame = pd.concat(pd.read_csv(output_path / name) for name in parts)
+    assert frame["id"].tolist() == [f"C-{index}" for index in range(ROWS)]
+
+def test_checkpoint_for_different_settings_is_refused(input_path, tmp_path, monkeypatch):
+    output_path = tmp_path / "out.jsonl"
+    with monkeypatch.context() as patch:
+        interrupt_at_chunk(patch, 1)
+        with pytest.raises(Interrupted):
+            processor(input_path, output_path).run()
+
+    with pytest.raises(CheckpointMismatch, match="chunk_size"):
+        processor(input_path, output_path, chunk_size=4).run()
+    assert processor(input_path, output_path, chunk_size=4).run(restart=True)["rows"] == ROWS
+    assert len(read_jsonl(output_path)) == ROWS
+
+def test_checkpoint_for_an_edited_input_is_refused(input_path, tmp_path, monkeypatch):
+    output_path = tmp_path / "out.jsonl"
+    with monkeypatch.context() as patch:
+        interrupt_at_chunk(patch, 1)
+        with pytest.raises(Interrupted):
+            processor(input_path, output_path).run()
+
+    with open(input_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"case": "C-extra", "text": SENTENCES[0]}) + "\n")
+    with pytest.raises(CheckpointMismatch, match="input_size"):
+        processor(input_path, output_path).run()
+
+@pytest.mark.parametrize("output_name, output_format", [("out.jsonl", None), ("parts", "csv")])
+def test_checkpoint_without_its_output_is_refused(input_path, tmp_path, monkeypatch, output_name, output_format):
+    output_path = tmp_path / output_name
+    with monkeypatch.context() as patch:
+        interrupt_at_chunk(patch, 2)
+        with pytest.raises(Interrupted):
+            processor(input_path, output_path, output_format=output_format).run()
+
+    if output_format is None:
+        output_path.unlink()
+    else:
+        (output_path / "part-00001.csv").unlink()
+    with pytest.raises(CheckpointMismatch, match="missing or shorter"):
+        processor(input_path, output_path, output_format=output_format).run()
+
+def fail_in_worker(*args):
+    raise RuntimeError("worker blew up")
+
+def test_worker_failures_are_reported_without_a_traceback(input_path, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(bulk_processor, "_invoke_in_worker", fail_in_worker)
+    assert bulk_processor.main([input_path, str(tmp_path / "out.jsonl"), "--workers", "1"]) == 1
+    error = capsys.readouterr().err
+    assert "Bulk processing failed: RuntimeError: worker blew up" in error
+    assert "Traceback" not in error
+
+def test_parquet_without_an_engine_fails_before_any_work(input_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_processor.importlib.util, "find_spec", lambda name: None)
+    assert bulk_processor.main([input_path, str(tmp_path / "out.parquet")]) == 1
+    assert list(tmp_path.iterdir()) == [tmp_path / "complaints.jsonl"]
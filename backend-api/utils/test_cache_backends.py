@@ -0,0 +1,259 @@
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from utils.artifact_registry import ArtifactRegistry
+from utils.cache_backends import (
+    MemoryCacheBackend, RedisCacheBackend, RedisError, SQLiteCacheBackend, create_cache_backend
+)
+from utils.fast_json import FastJSONEncoder
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.clients.append(self.connection)
+        while True:
+            try:
+                command = self._read_command()
+            except (ConnectionError, OSError, ValueError):
+                return
+            if command is None:
+                return
+            server.commands.append(command)
+            try:
+                self.wfile.write(server.dispatch(command))
+            except OSError:
+                return
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if line[:1] != b"*":
+            raise ValueError(f"Expected an array, got {line!r}")
+        args = []
+        for _ in range(int(line[1:-2])):
+            header = self.rfile.readline()
+            length = int(header[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.lock = threading.Lock()
+        self.clients = []
+        self.commands = []
+        self.data = {}
+        self.cursors = {}
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def dispatch(self, command) -> bytes:
+        name, args = command[0].upper(), command[1:]
+        with self.lock:
+            if name == b"PING":
+                return b"+PONG\r\n"
+            if name == b"GET":
+                value = self._live(args[0])
+                return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+            if name == b"SET":
+                expires_at = 0.0
+                if len(args) == 4 and args[2].upper() == b"PX":
+                    expires_at = time.monotonic() + int(args[3]) / 1000
+                self.data[args[0]] = (args[1], expires_at)
+                return b"+OK\r\n"
+            if name == b"DEL":
+                removed = sum(1 for key in args if self.data.pop(key, None) is not None)
+                return b":%d\r\n" % removed
+            if name == b"DBSIZE":
+                return b":%d\r\n" % len(self.data)
+            if name == b"SCAN":
+                return self._scan(args)
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    def _scan(self, args) -> bytes:
+        after = self.cursors.pop(int(args[0]), b"")
+        options = {args[index].upper(): args[index + 1] for index in range(1, len(args) - 1, 2)}
+        pattern = options.get(b"MATCH", b"*").decode("utf-8")
+        count = int(options.get(b"COUNT", b"10"))
+        keys = sorted(key for key in self.data if key > after)
+        page = keys[:count]
+        next_cursor = 0
+        if len(keys) > count:
+            next_cursor = len(self.cursors) + 1
+            self.cursors[next_cursor] = page[-1]
+        matched = [key for key in page if fnmatch.fnmatchcase(key.decode("utf-8"), pattern)]
+        reply = [b"*2\r\n", b"$%d\r\n%d\r\n" % (len(str(next_cursor)), next_cursor), b"*%d\r\n" % len(matched)]
+        reply += [b"$%d\r\n%s\r\n" % (len(key), key) for key in matched]
+        return b"".join(reply)
+
+    def drop_connections(self):
+        with self.lock:
+            clients, self.clients = self.clients, []
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            client.close()
+
+def test_memory_backend_detaches_stored_values():
+    backend = MemoryCacheBackend()
+    value = {"category": "Theft", "keywords": ["stole"]}
+    backend.set("key", value)
+    value["keywords"].append("robbed")
+
+    found, cached = backend.get("key")
+    assert found and cached == {"category": "Theft", "keywords": ("stole",)}
+    with pytest.raises(TypeError):
+        cached["category"] = "Fraud"
+
+def test_sqlite_hits_do_not_write_until_the_touch_batch_fills(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), touch_batch_size=2)
+    backend.set("key", 1)
+    connection = backend._connection()
+    changes = connection.total_changes
+
+    assert backend.get("key") == (True, 1)
+    assert backend.get("key") == (True, 1)
+    assert connection.total_changes == changes
+    backend.set("other", 2)
+    backend.get("other")
+    assert connection.total_changes == changes + 3
+
+def test_sqlite_eviction_sees_pending_touches(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2, prune_interval=1)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == (True, 1)
+    backend.set("c", 3)
+
+    assert backend.get("b") == (False, None)
+    assert backend.get("a") == (True, 1) and backend.get("c") == (True, 3)
+
+def test_relative_sqlite_url_stays_relative(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+
+    assert create_cache_backend("sqlite://relative.db").path == "relative.db"
+    assert create_cache_backend("sqlite://data/cache.db").path == "data/cache.db"
+    assert create_cache_backend(f"sqlite://{tmp_path}/absolute.db").path == f"{tmp_path}/absolute.db"
+    assert (tmp_path / "relative.db").exists() and (tmp_path / "data" / "cache.db").exists()
+
+def test_memory_backend_keeps_registry_artifacts_spliceable():
+    registry = ArtifactRegistry()
+    encoder = FastJSONEncoder(fragment_for=registry.fragment_for)
+    mapping, checklist = registry.legal_mappings["Theft"], registry.evidence_checklists["Theft"]
+    backend = MemoryCacheBackend()
+    backend.set("key", {"legal": mapping, "evidence": checklist, "notes": ["kept"]})
+
+    _, cached = backend.get("key")
+    assert cached["legal"] is mapping and cached["evidence"] is checklist
+    assert cached["notes"] == ("kept",)
+    encoder.response({"result": cached})
+    assert encoder.fragments_spliced == 2
+
+@pytest.fixture
+def fake_redis():
+    server = FakeRedisServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def backend(fake_redis):
+    return RedisCacheBackend(port=fake_redis.port, prefix="test:")
+
+def test_get_returns_what_set_stored(backend, fake_redis):
+    backend.set("answer", {"score": 42, "tags": ["a", "b"]})
+    assert backend.get("answer") == (True, {"score": 42, "tags": ["a", "b"]})
+    assert fake_redis.commands[-1] == [b"GET", b"test:answer"]
+
+def test_missing_key_is_a_miss(backend):
+    assert backend.get("absent") == (False, None)
+
+def test_set_with_ttl_sends_px_and_expires(backend, fake_redis):
+    backend.set("short", "value", ttl_seconds=0.05)
+    assert fake_redis.commands[-1] == [b"SET", b"test:short", b'"value"', b"PX", b"50"]
+    assert backend.get("short") == (True, "value")
+    time.sleep(0.08)
+    assert backend.get("short") == (False, None)
+
+def test_delete_removes_key(backend):
+    backend.set("gone", 1)
+    backend.delete("gone")
+    assert backend.get("gone") == (False, None)
+
+def test_clear_scans_every_page_and_keeps_other_prefixes(backend, fake_redis):
+    for index in range(1200):
+        backend.set(f"key-{index}", index)
+    fake_redis.data[b"other:keep"] = (b"1", 0.0)
+
+    backend.clear()
+
+    scans = [command for command in fake_redis.commands if command[0] == b"SCAN"]
+    assert len(scans) > 1
+    assert list(fake_redis.data) == [b"other:keep"]
+
+def test_server_errors_raise_redis_error(backend):
+    with pytest.raises(RedisError):
+        backend._execute("NOPE")
+
+def test_error_replies_return_the_connection_to_the_pool(backend, fake_redis):
+    for _ in range(3):
+        with pytest.raises(RedisError):
+            backend._execute("NOPE")
+    backend.set("after", 1)
+
+    assert backend._pool.qsize() == 1
+    assert len(fake_redis.clients) == 1
+
+def test_stats_count_only_keys_under_the_prefix(backend, fake_redis):
+    for index in range(3):
+        backend.set(f"key-{index}", index)
+    fake_redis.data[b"other:keep"] = (b"1", 0.0)
+
+    assert backend.stats()["entries"] == 3
+
+def test_dropped_pooled_connection_reconnects_once(backend, fake_redis):
+    backend.set("survives", "yes")
+    fake_redis.drop_connections()
+
+    assert backend.get("survives") == (True, "yes")
+    assert backend.reconnects == 1
+    assert backend.stats()["entries"] == 1
+
+def test_unreachable_server_raises(fake_redis):
+    port = fake_redis.port
+    fake_redis.shutdown()
+    fake_redis.server_close()
+    with pytest.raises(OSError):
+        RedisCacheBackend(port=port, timeout=0.2).get("anything")
+
+def test_redis_url_selects_backend(fake_redis):
+    backend = create_cache_backend(f"redis://127.0.0.1:{fake_redis.port}/0?prefix=url:")
+    backend.set("k", [1, 2])
+    assert b"url:k" in fake_redis.data
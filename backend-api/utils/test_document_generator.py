@@ -0,0 +1,46 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from utils.document_generator import DocumentGenerator
+
+class Unprintable:
+    def __str__(self):
+        raise ValueError("cannot render narrative")
+
+def draft(complaint_text):
+    return {
+        "complaint_text": complaint_text,
+        "category": "Theft",
+        "severity_score": 42,
+        "severity_level": "Medium",
+        "ipc_sections": ["379"],
+        "complainant_info": {"name": "Asha"}
+    }
+
+@pytest.fixture(scope="module")
+def generator():
+    return DocumentGenerator()
+
+def test_zip_export_isolates_drafts_that_fail_while_rendering(generator):
+    drafts = [draft("My phone was stolen."), draft(Unprintable()), draft("My bike was stolen.")]
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(generator.iter_fir_export(drafts, "zip"))))
+
+    assert archive.testzip() is None
+    assert archive.namelist() == ["fir_00000.txt", "fir_00001.error.txt", "fir_00002.txt"]
+    assert "My bike was stolen." in archive.read("fir_00002.txt").decode("utf-8")
+    assert "cannot render narrative" in archive.read("fir_00001.error.txt").decode("utf-8")
+
+def test_zip_entries_match_the_rendered_draft(generator):
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(generator.iter_fir_export([draft("Stolen cycle.")], "zip"))))
+    rendered = generator.generate_fir_draft(**draft("Stolen cycle."))["fir_draft"]
+    assert archive.read("fir_00000.txt").decode("utf-8") == rendered
+
+def test_ndjson_export_reports_failures_per_line(generator):
+    lines = [json.loads(line) for line in b"".join(
+        generator.iter_fir_export([draft(Unprintable()), draft("Stolen cycle.")], "ndjson")
+    ).splitlines()]
+    assert [line["status"] for line in lines] == ["error", "ok"]
+    assert lines[1]["result"]["category"] == "Theft"
@@ -0,0 +1,85 @@
+import pytest
+
+from utils.history_store import HistoryError, HistoryStore, text_hash
+
+def analysis(category: str, level: str = "Medium"):
+    return {
+        "classification": {"category": category, "subcategory": "general"},
+        "severity": {"score": 40, "level": level},
+        "legal": {"ipc_sections": [{"code": "379"}, {"code": "411"}]}
+    }
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"), max_wait_ms=1)
+    yield store
+    store.close()
+
+def record_all(store, entries):
+    for text, category in entries:
+        assert store.record(text, "en", analysis(category), "rules-v1")
+    store.flush()
+
+def pages(store, limit, **filters):
+    cursor, collected = None, []
+    while True:
+        page = store.query(limit=limit, cursor=cursor, **filters)
+        collected.append([item["description"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return collected
+
+def test_cursor_pages_walk_newest_first_without_gaps(store):
+    record_all(store, [(f"complaint {index}", "Theft") for index in range(7)])
+
+    assert pages(store, 3) == [
+        ["complaint 6", "complaint 5", "complaint 4"],
+        ["complaint 3", "complaint 2", "complaint 1"],
+        ["complaint 0"]
+    ]
+    assert pages(store, 7) == [[f"complaint {index}" for index in range(6, -1, -1)]]
+
+def test_new_records_do_not_shift_later_pages(store):
+    record_all(store, [(f"complaint {index}", "Theft") for index in range(5)])
+    first = store.query(limit=2)
+    record_all(store, [("newer complaint", "Fraud")])
+
+    second = store.query(limit=2, cursor=first["next_cursor"])
+    assert [item["description"] for item in second["items"]] == ["complaint 2", "complaint 1"]
+
+def test_filters_combine_with_the_cursor(store):
+    record_all(store, [(f"complaint {index}", "Theft" if index % 2 else "Fraud") for index in range(6)])
+
+    assert pages(store, 2, category="Theft") == [["complaint 5", "complaint 3"], ["complaint 1"]]
+    assert pages(store, 5, text_hash=text_hash("complaint 4")) == [["complaint 4"]]
+    assert pages(store, 5, category="Assault") == [[]]
+
+def test_summaries_and_full_records(store):
+    record_all(store, [("my phone was stolen", "Theft")])
+    summary = store.query()["items"][0]
+
+    assert summary["category"] == "Theft"
+    assert summary["severity"] == {"score": 40, "level": "Medium"}
+    assert summary["sections"] == [{"code": "379"}, {"code": "411"}]
+    assert summary["rules_version"] == "rules-v1"
+    assert store.get(summary["id"])["result"] == analysis("Theft")
+    assert store.get(summary["id"] + 1) is None
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"limit": 0}, "limit must be between 1 and 500"),
+    ({"limit": 501}, "limit must be between 1 and 500"),
+    ({"cursor": "abc"}, "Invalid cursor"),
+    ({"since": "18-10-2026"}, "since must be a date"),
+    ({"language": "en"}, "Unknown history filter"),
+])
+def test_invalid_queries_are_rejected(store, arguments, message):
+    with pytest.raises(HistoryError, match=message):
+        store.query(**arguments)
+
+def test_records_after_close_are_refused(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.sqlite3"), max_wait_ms=1)
+    record_all(store, [("written before close", "Theft")])
+    store.close()
+
+    assert store.record("after close", "en", analysis("Theft")) is False
+    assert store.stats()["written"] == 1
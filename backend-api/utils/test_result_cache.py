@@ -0,0 +1,76 @@
+import json
+import shutil
+
+import pytest
+
+from utils.analysis_pipeline import build_components
+from utils.rule_store import RULES_PATH
+from utils.result_cache import ResultCache
+
+def test_keys_depend_on_namespace_version_and_parts():
+    key = ResultCache.make_key("normalize", "v1", "gadi chori", "en")
+    assert key == ResultCache.make_key("normalize", "v1", "gadi chori", "en")
+    assert key.startswith("normalize:")
+    assert key != ResultCache.make_key("normalize", "v2", "gadi chori", "en")
+    assert key != ResultCache.make_key("classify", "v1", "gadi chori", "en")
+
+@pytest.mark.parametrize("left, right", [
+    (("v1", "ab", "c"), ("v1", "a", "bc")),
+    (("v1", "a\x1fb"), ("v1", "a", "b")),
+    (("v1", "a\x1f", "b"), ("v1", "a", "\x1fb")),
+    (("v1\x1fa", "b"), ("v1", "a\x1fb")),
+    (("v1", "a"), ("v1", "a", "")),
+    (("v1", "", "a"), ("v1", "a", "")),
+    (("v1", "3:abc"), ("v1", "abc")),
+])
+def test_keys_do_not_collide_across_part_boundaries(left, right):
+    assert ResultCache.make_key("severity", *left) != ResultCache.make_key("severity", *right)
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = tmp_path / "rules.json"
+    shutil.copy(RULES_PATH, path)
+    return path
+
+def test_reloaded_rules_do_not_serve_results_cached_under_the_old_rules(rules_path):
+    components = build_components(rules_path=str(rules_path))
+    cache = components["result_cache"]
+    before = components["pipeline"]
+    assert "vehicle" in before.normalize("my gadi was taken", "en")["normalized_text"]
+    hits = cache.hits
+
+    tables = json.loads(rules_path.read_text(encoding="utf-8"))
+    tables["normalizer"]["dialect_mappings"]["gadi"] = "motorcycle"
+    rules_path.write_text(json.dumps(tables), encoding="utf-8")
+    assert components["rule_watcher"].reload()
+
+    after = components["pipeline"]
+    assert components["result_cache"] is cache
+    assert after.normalizer.rules_version != before.normalizer.rules_version
+    assert "motorcycle" in after.normalize("my gadi was taken", "en")["normalized_text"]
+    assert cache.hits == hits
+    assert "vehicle" in before.normalize("my gadi was taken", "en")["normalized_text"]
+    assert cache.hits == hits + 1
+
+class FailingBackend:
+    name = "failing"
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise ConnectionError("backend down")
+
+    def set(self, key, value, ttl_seconds=None):
+        self.calls += 1
+        raise ConnectionError("backend down")
+
+def test_backend_failures_fall_back_to_computing_and_back_off():
+    backend = FailingBackend()
+    cache = ResultCache(backend, error_backoff_seconds=60.0)
+
+    assert cache.get_or_compute("key", lambda: "computed") == "computed"
+    assert cache.get_or_compute("key", lambda: "again") == "again"
+    assert cache.errors == 1
+    assert backend.calls == 1
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import shutil
+
+import pytest
+
+from utils.analysis_pipeline import build_components
+from utils.rule_store import RULES_PATH, RulesError, RulesVersionMiddleware, validate_rules
+from utils.stage_executor import StageExecutor
+
+TEXT = "The chor took my gadi and attacked me with a knife in the market"
+
+def load_tables():
+    with open(RULES_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def test_shipped_rules_are_valid():
+    validate_rules(load_tables())
+
+@pytest.mark.parametrize("path, value, message", [
+    (("version",), "", "version must be a non-empty string"),
+    (("version",), "2024.1\r\nX-Injected: 1", "version may only contain"),
+    (("version",), "règles-2", "version may only contain"),
+    (("eccm", "categories", "theft", "keywords"), [], "eccm.categories.theft.keywords must not be empty"),
+    (("eccm", "categories", "theft", "subcategories"), [], "eccm.categories.theft.subcategories must not be empty"),
+    (("lss", "factors", "weapon_mentioned", "weight"), "high", "lss.factors.weapon_mentioned.weight must be a number"),
+    (("normalizer", "dialect_mappings", "gadi"), 7, "normalizer.dialect_mappings.gadi must be a string"),
+])
+def test_invalid_tables_are_rejected(path, value, message):
+    tables = load_tables()
+    section = tables
+    for name in path[:-1]:
+        section = section[name]
+    assert path[-1] in section
+    section[path[-1]] = value
+    with pytest.raises(RulesError, match=message):
+        validate_rules(tables)
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = tmp_path / "rules.json"
+    shutil.copy(RULES_PATH, path)
+    return path
+
+def write_rules(path, tables):
+    path.write_text(json.dumps(tables), encoding="utf-8")
+
+def test_rejected_reload_keeps_serving_the_current_rules(rules_path):
+    components = build_components(rules_path=str(rules_path))
+    watcher = components["rule_watcher"]
+    pipeline = components["pipeline"]
+    version = components["rules"].version
+
+    tables = load_tables()
+    tables["eccm"]["categories"]["theft"]["keywords"] = []
+    write_rules(rules_path, tables)
+    with pytest.raises(RulesError):
+        watcher.reload()
+    rules_path.write_text("{not json", encoding="utf-8")
+    assert watcher.check() is False
+
+    assert watcher.rejected == 2
+    assert "not valid JSON" in watcher.last_error
+    assert components["pipeline"] is pipeline
+    assert components["rules"].version == version
+    assert pipeline.classify(TEXT)["category"]
+
+    tables["eccm"]["categories"]["theft"]["keywords"] = ["stolen"]
+    write_rules(rules_path, tables)
+    assert watcher.reload()
+    assert watcher.reloads == 1 and watcher.last_error is None
+    assert components["rules"].version != version
+
+def test_reformatting_without_changes_is_not_a_reload(rules_path):
+    components = build_components(rules_path=str(rules_path))
+    pipeline = components["pipeline"]
+    rules_path.write_text(json.dumps(load_tables(), indent=4), encoding="utf-8")
+
+    assert components["rule_watcher"].reload() is False
+    assert components["pipeline"] is pipeline
+
+def test_a_version_only_change_is_a_reload(rules_path):
+    components = build_components(rules_path=str(rules_path))
+    watcher = components["rule_watcher"]
+    tables = load_tables()
+    tables["version"] = tables["version"] + ".1"
+    write_rules(rules_path, tables)
+
+    assert watcher.reload() is True
+    assert components["rules"].declared_version == tables["version"]
+    assert components["pipeline"].rules_version == components["rules"].version
+
+def run_middleware(app_headers):
+    sent = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": app_headers})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RulesVersionMiddleware(app, version=lambda: "live+b")
+    asyncio.run(middleware({"type": "http"}, None, send))
+    return [value for name, value in sent[0]["headers"] if name.lower() == b"x-rules-version"]
+
+def test_middleware_keeps_the_version_the_route_was_pinned_to():
+    assert run_middleware([]) == [b"live+b"]
+    assert run_middleware([(b"x-rules-version", b"pinned+a")]) == [b"pinned+a"]
+
+def test_a_reload_mid_request_does_not_mix_rule_sets(rules_path):
+    components = build_components(rules_path=str(rules_path))
+    executor = StageExecutor(components)
+    outputs = ["normalization", "classification", "severity", "timeline_prediction"]
+
+    tables = load_tables()
+    tables["normalizer"]["dialect_mappings"]["gadi"] = "motorcycle"
+    tables["lss"]["category_weights"] = {category: 0.05 for category in tables["lss"]["category_weights"]}
+
+    async def run(pipeline, reload_after_first_stage=False):
+        async def call(component, method, *args, **kwargs):
+            result = await executor.call(component, method, *args, **kwargs)
+            if reload_after_first_stage and method == "normalize":
+                write_rules(rules_path, tables)
+                assert components["rule_watcher"].reload()
+            return result
+
+        results, _ = await pipeline.stage_graph(TEXT, "en", call).run(outputs)
+        return results
+
+    expected = asyncio.run(run(build_components(rules_path=RULES_PATH)["pipeline"]))
+    pinned = components["pipeline"]
+    results = asyncio.run(run(pinned, reload_after_first_stage=True))
+    reloaded = asyncio.run(run(components["pipeline"]))
+
+    assert components["pipeline"] is not pinned
+    assert results == expected
+    assert "motorcycle" in reloaded["normalization"]["normalized_text"]
+    assert reloaded["severity"]["score"] != expected["severity"]["score"]
+    executor.shutdown()
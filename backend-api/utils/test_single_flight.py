@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from utils.single_flight import SingleFlight, SingleFlightOverflow
+
+class Computation:
+    def __init__(self, result="done", error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+async def started(flight, key, compute, count):
+    tasks = [asyncio.ensure_future(flight.run(key, compute)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+def test_concurrent_callers_share_one_execution():
+    async def scenario():
+        flight = SingleFlight()
+        compute = Computation({"category": "Theft"})
+        tasks = await started(flight, ("analyze", "text"), compute, 10)
+        compute.release.set()
+        results = await asyncio.gather(*tasks)
+        return flight, compute, results
+
+    flight, compute, results = asyncio.run(scenario())
+    assert compute.calls == 1
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert stats["executions"] == 1 and stats["coalesced"] == 9 and stats["largest_group"] == 10
+    assert stats["in_flight"] == 0
+
+def test_distinct_keys_and_later_calls_execute_separately():
+    async def scenario():
+        flight = SingleFlight()
+        compute = Computation()
+        compute.release.set()
+        await asyncio.gather(flight.run("a", compute), flight.run("b", compute))
+        await flight.run("a", compute)
+        return flight, compute
+
+    flight, compute = asyncio.run(scenario())
+    assert compute.calls == 3
+    assert flight.stats()["coalesced"] == 0
+
+def test_waiters_beyond_the_limit_are_rejected():
+    async def scenario():
+        flight = SingleFlight(max_waiters=2, retry_after_seconds=3)
+        compute = Computation()
+        tasks = await started(flight, "key", compute, 2)
+        with pytest.raises(SingleFlightOverflow) as overflow:
+            await flight.run("key", compute)
+        compute.release.set()
+        return flight, compute, await asyncio.gather(*tasks), overflow.value
+
+    flight, compute, results, overflow = asyncio.run(scenario())
+    assert results == ["done"] * 2
+    assert compute.calls == 1
+    assert overflow.retry_after_seconds == 3
+    assert flight.stats()["rejected"] == 1
+
+def test_failures_reach_every_waiter_and_are_not_cached():
+    async def scenario():
+        flight = SingleFlight()
+        failing = Computation(error=RuntimeError("stage failed"))
+        tasks = await started(flight, "key", failing, 3)
+        failing.release.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        retry = Computation("recovered")
+        retry.release.set()
+        return flight, outcomes, await flight.run("key", retry)
+
+    flight, outcomes, recovered = asyncio.run(scenario())
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert len({id(outcome) for outcome in outcomes}) == 3
+    original = outcomes[0].__cause__
+    assert all(outcome.__cause__ is original and str(outcome) == "stage failed" for outcome in outcomes)
+    assert original.__traceback__.tb_next is None
+    assert recovered == "recovered"
+    assert flight.stats()["failures"] == 1
+
+def test_a_cancelled_waiter_does_not_cancel_the_shared_computation():
+    async def scenario():
+        flight = SingleFlight()
+        compute = Computation()
+        first, second = await started(flight, "key", compute, 2)
+        first.cancel()
+        await asyncio.sleep(0)
+        compute.release.set()
+        return first, await second
+
+    first, result = asyncio.run(scenario())
+    assert first.cancelled()
+    assert result == "done"
+
+def test_cancelled_waiters_free_their_slot():
+    async def scenario():
+        flight = SingleFlight(max_waiters=2)
+        compute = Computation()
+        first, second = await started(flight, "key", compute, 2)
+        second.cancel()
+        await asyncio.sleep(0)
+        third = await started(flight, "key", compute, 1)
+        compute.release.set()
+        return flight, await asyncio.gather(first, *third)
+
+    flight, results = asyncio.run(scenario())
+    assert results == ["done"] * 2
+    assert flight.stats()["rejected"] == 0
+
+def test_unhashable_keys_bypass_coalescing():
+    assert SingleFlight.key("analyze", ["not", "hashable"]) is None
+
+    async def scenario():
+        flight = SingleFlight()
+        compute = Computation()
+        compute.release.set()
+        await asyncio.gather(flight.run(None, compute), flight.run(None, compute))
+        return flight, compute
+
+    flight, compute = asyncio.run(scenario())
+    assert compute.calls == 2
+    assert flight.stats()["executions"] == 0
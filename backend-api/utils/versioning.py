@@ -0,0 +1,7 @@
+import hashlib
+import json
+from typing import Any
+
+def rules_fingerprint(*tables: Any) -> str:
+    payload = json.dumps(tables, sort_keys=True, default=sorted, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
@@ -1101,6 +1101,16 @@ class ApiService {
 
   // Search legal acts
   async searchLegalActs(query) {
+    try {
+      const params = new URLSearchParams({ q: query, kind: 'act', page_size: '50' });
+      const response = await fetch(`${API_BASE_URL}/legal-search?${params}`);
+      if (!response.ok) throw new Error('Legal search failed');
+      const data = await response.json();
+      return data.results.map(result => result.document);
+    } catch (error) {
+      console.warn('Legal search service unavailable, using fallback');
+    }
+
     const acts = await this.getLegalActs();
     const lowerQuery = query.toLowerCase();
     
@@ -1162,10 +1172,54 @@ class ApiService {
         next_maintenance: '2024-02-15'
       }
     };
+
+    try {
+      const response = await fetch(`${API_BASE_URL}/metrics/summary`);
+      if (!response.ok) throw new Error('Metrics request failed');
+      const summary = await response.json();
+      const latency = summary.http_request_duration_seconds || {};
+      const meanMs = (endpoint, fallback) => (latency[endpoint] ? latency[endpoint].mean_ms : fallback);
+      const count = (...endpoints) =>
+        endpoints.reduce((total, endpoint) => total + (latency[endpoint] ? latency[endpoint].count : 0), 0);
+      const observed = Object.values(latency);
+      const requests = observed.reduce((total, entry) => total + entry.count, 0);
+
+      metrics.latency = {
+        complaint_processing: meanMs('POST /analyze-complete', metrics.latency.complaint_processing),
+        draft_generation: meanMs('POST /generate-fir', metrics.latency.draft_generation),
+        classification: meanMs('POST /classify', metrics.latency.classification),
+        ipc_bns_comparison: meanMs('POST /ipc-bns', metrics.latency.ipc_bns_comparison),
+        average: requests
+          ? observed.reduce((total, entry) => total + entry.mean_ms * entry.count, 0) / requests
+          : metrics.latency.average
+      };
+      metrics.usage = {
+        ...metrics.usage,
+        complaints_processed: count('POST /analyze-complete', 'POST /analyze-complete/stream'),
+        drafts_generated: count('POST /generate-fir', 'POST /generate-fir/bulk'),
+        ipc_queries: count('POST /ipc-bns', 'GET /ipc-bns'),
+        legal_acts_searched: count('GET /legal-search', 'GET /legal-acts')
+      };
+      metrics.system_status = { ...metrics.system_status, uptime_seconds: summary.uptime_seconds };
+      metrics.backend = summary;
+    } catch (error) {
+      console.warn('Metrics service unavailable, using simulated metrics');
+    }
     
     return metrics;
   }
 
+  async getAnalytics(days = 30) {
+    try {
+      const response = await fetch(`${API_BASE_URL}/analytics?days=${days}`);
+      if (!response.ok) throw new Error('Analytics request failed');
+      return await response.json();
+    } catch (error) {
+      console.warn('Analytics service unavailable');
+      return null;
+    }
+  }
+
   async saveToHistory(complaintData) {
     try {
       const history = await AsyncStorage.getItem('equicourt_complaints');
@@ -1187,7 +1241,20 @@ class ApiService {
     }
   }
 
-  async getComplaintHistory() {
+  async getComplaintHistory(filters = {}) {
+    try {
+      const params = new URLSearchParams({ limit: '50' });
+      Object.entries(filters).forEach(([key, value]) => {
+        if (value !== undefined && value !== null && value !== 'All') params.append(key, String(value));
+      });
+      const response = await fetch(`${API_BASE_URL}/history?${params.toString()}`);
+      if (!response.ok) throw new Error('History request failed');
+      const page = await response.json();
+      if (page.items.length > 0) return page.items;
+    } catch (error) {
+      console.warn('History service unavailable, using local history');
+    }
+
     try {
       const history = await AsyncStorage.getItem('equicourt_complaints');
       return history ? JSON.parse(history) : [];